@@ -0,0 +1,99 @@
+"""
+계정(프로필) 관리 모듈
+- 이름별로 토큰 파일과 구독 목록 캐시를 따로 보관
+- 채널 정보/피드/영상 통계 캐시는 모든 계정이 공유 (cache_manager)
+- 'default' 계정은 기존 경로(token.json, cache/subscriptions.json)를 그대로 사용
+"""
+
+import os
+import re
+
+import auth
+import cache_manager
+
+ACCOUNTS_DIR = 'accounts'
+DEFAULT_ACCOUNT = 'default'
+
+_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,32}$')
+
+current = DEFAULT_ACCOUNT
+
+
+def is_valid_name(name):
+    """계정 이름이 유효한지 확인합니다 (영문/숫자/_/-, 32자 이하)."""
+    return bool(name) and bool(_NAME_PATTERN.match(name))
+
+
+def token_file(name):
+    """계정의 토큰 파일 경로를 반환합니다."""
+    if name == DEFAULT_ACCOUNT:
+        return 'token.json'
+    return os.path.join(ACCOUNTS_DIR, name, 'token.json')
+
+
+def subscriptions_file(name):
+    """계정의 구독 목록 캐시 파일 경로를 반환합니다."""
+    if name == DEFAULT_ACCOUNT:
+        return os.path.join(cache_manager.CACHE_DIR, 'subscriptions.json')
+    return os.path.join(ACCOUNTS_DIR, name, 'subscriptions.json')
+
+
+def list_accounts():
+    """계정 이름 목록을 반환합니다 (default가 처음)."""
+    names = []
+    if os.path.exists(ACCOUNTS_DIR):
+        names = sorted(
+            entry.name for entry in os.scandir(ACCOUNTS_DIR)
+            if entry.is_dir() and is_valid_name(entry.name) and entry.name != DEFAULT_ACCOUNT
+        )
+    return [DEFAULT_ACCOUNT] + names
+
+
+def switch(name):
+    """
+    현재 계정을 바꿉니다 (없으면 새로 만듦).
+
+    Args:
+        name: 계정 이름
+
+    Returns:
+        bool: 성공 여부
+    """
+    global current
+
+    if not is_valid_name(name):
+        return False
+
+    if name != DEFAULT_ACCOUNT:
+        account_dir = os.path.join(ACCOUNTS_DIR, name)
+        if not os.path.exists(account_dir):
+            os.makedirs(account_dir)
+
+    current = name
+    auth.TOKEN_FILE = token_file(name)
+    cache_manager.SUBSCRIPTIONS_CACHE = subscriptions_file(name)
+    return True
+
+
+def collect_channel_ids(names):
+    """
+    여러 계정의 구독 채널 ID를 중복 없이 모읍니다 (저장된 구독 목록 기준).
+
+    Args:
+        names: 계정 이름 리스트
+
+    Returns:
+        list: 채널 ID 리스트 (처음 나온 순서)
+    """
+    seen = set()
+    channel_ids = []
+
+    for name in names:
+        if not is_valid_name(name):
+            continue
+        for sub in cache_manager.read_subscriptions(subscriptions_file(name)):
+            if sub.id not in seen:
+                seen.add(sub.id)
+                channel_ids.append(sub.id)
+
+    return channel_ids
@@ -1,14 +1,16 @@
 """
 OAuth 2.0 인증 처리 모듈
 - config.py에서 키를 읽어옴
+- Google API 라이브러리는 처음 필요할 때 불러옴 (시작 속도)
+- 생성한 서비스 객체는 재사용
+- HTTP 요청은 transport의 공유 연결 풀 사용 (스레드 안전)
+- 자격 증명은 credentials 모듈이 메모리에 보관하고 백그라운드에서 미리 갱신
 """
 
 import os
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
 import config
+import credentials
+import transport
 
 # OAuth 스코프 (읽기 전용)
 SCOPES = ['https://www.googleapis.com/auth/youtube.readonly']
@@ -16,74 +18,113 @@ SCOPES = ['https://www.googleapis.com/auth/youtube.readonly']
 # 토큰 파일 경로
 TOKEN_FILE = 'token.json'
 
+# API 주소 (로컬 대체 서버로 테스트할 때 지정, 예: http://127.0.0.1:8765/youtube/v3/)
+API_ENDPOINT = os.environ.get('AUTOBLOGER_API_ENDPOINT', '')
 
-def get_authenticated_service():
+# 생성된 서비스 객체 캐시
+_api_service = None        # (API 키, 서비스)
+_oauth_service = None      # (토큰 파일, 자격 증명, 서비스)
+
+
+def _build_youtube(credentials=None, **kwargs):
+    """
+    YouTube API 서비스 객체를 생성합니다.
+    discovery 문서는 라이브러리에 포함된 정적 사본을 사용합니다 (네트워크 요청 없음).
+    여러 스레드에서 동시에 호출해도 되도록 transport.PooledHttp를 사용합니다.
+    """
+    from googleapiclient.discovery import build
+
+    if API_ENDPOINT:
+        kwargs['client_options'] = {'api_endpoint': API_ENDPOINT}
+
+    return build(
+        'youtube', 'v3',
+        http=transport.PooledHttp(credentials),
+        static_discovery=True,
+        cache_discovery=False,
+        **kwargs
+    )
+
+
+def get_authenticated_service(interactive=True):
     """
     OAuth 인증된 YouTube API 서비스를 반환합니다.
 
+    Args:
+        interactive: False면 브라우저 인증 없이 저장된 토큰만 사용 (헤드리스 실행용)
+
     Returns:
         YouTube API 서비스 객체 또는 None
     """
+    global _oauth_service
+
     if not config.CLIENT_ID or not config.CLIENT_SECRET:
         print("오류: config.py에 CLIENT_ID와 CLIENT_SECRET을 입력하세요.")
         return None
 
-    creds = None
-
-    # 저장된 토큰 확인
-    if os.path.exists(TOKEN_FILE):
-        creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
-
-    # 토큰이 없거나 유효하지 않으면 인증 진행
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            # 토큰 갱신
-            try:
-                creds.refresh(Request())
-            except Exception as e:
-                print(f"토큰 갱신 실패: {e}")
-                creds = None
-
-        if not creds:
-            # 새로운 인증 진행
-            client_config = {
-                "installed": {
-                    "client_id": config.CLIENT_ID,
-                    "client_secret": config.CLIENT_SECRET,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": ["http://localhost"]
-                }
+    # 메모리의 자격 증명 (평소 갱신은 credentials 모듈이 백그라운드에서 처리,
+    # 이미 만료된 토큰은 API 호출 중이 아니라 여기서 한 번 갱신)
+    creds = credentials.ensure_fresh(TOKEN_FILE, SCOPES)
+
+    # 같은 자격 증명으로 만든 서비스가 있으면 그대로 사용
+    if _oauth_service and _oauth_service[0] == TOKEN_FILE and _oauth_service[1] is creds:
+        return _oauth_service[2]
+
+    # 토큰이 없거나 갱신할 수 없으면 인증 진행
+    if not creds or not (creds.valid or creds.refresh_token):
+        if not interactive:
+            print("오류: 저장된 토큰이 없거나 만료되었습니다. 앱에서 먼저 로그인하세요.")
+            return None
+
+        # 새로운 인증 진행
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        client_config = {
+            "installed": {
+                "client_id": config.CLIENT_ID,
+                "client_secret": config.CLIENT_SECRET,
+                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                "token_uri": "https://oauth2.googleapis.com/token",
+                "redirect_uris": ["http://localhost"]
             }
+        }
 
-            flow = InstalledAppFlow.from_client_config(client_config, SCOPES)
-            # 타임아웃 없이 진행, 사용자가 취소하면 예외 발생
-            creds = flow.run_local_server(
-                port=8080,
-                open_browser=True,
-                success_message='인증 완료! 이 창을 닫아도 됩니다.'
-            )
+        flow = InstalledAppFlow.from_client_config(client_config, SCOPES)
+        # 타임아웃 없이 진행, 사용자가 취소하면 예외 발생
+        creds = flow.run_local_server(
+            port=8080,
+            open_browser=True,
+            success_message='인증 완료! 이 창을 닫아도 됩니다.'
+        )
 
         # 토큰 저장
-        with open(TOKEN_FILE, 'w') as token:
-            token.write(creds.to_json())
+        credentials.store(TOKEN_FILE, SCOPES, creds)
 
     # YouTube API 서비스 생성
-    return build('youtube', 'v3', credentials=creds)
+    service = _build_youtube(credentials=creds)
+    _oauth_service = (TOKEN_FILE, creds, service)
+    return service
 
 
 def get_api_service():
     """
     API 키를 사용한 YouTube API 서비스를 반환합니다.
-    (인증 불필요한 API 호출용)
+    (인증 불필요한 API 호출용, 같은 키면 재사용)
 
     Returns:
         YouTube API 서비스 객체 또는 None
     """
+    global _api_service
+
     if not config.API_KEY:
         return None
 
-    return build('youtube', 'v3', developerKey=config.API_KEY)
+    if _api_service and _api_service[0] == config.API_KEY:
+        return _api_service[1]
+
+    service = _build_youtube(developerKey=config.API_KEY)
+    _api_service = (config.API_KEY, service)
+    return service
 
 
 def is_configured():
@@ -92,19 +133,20 @@ def is_configured():
 
 
 def is_authenticated():
-    """인증 상태를 확인합니다."""
-    if not os.path.exists(TOKEN_FILE):
-        return False
-
+    """인증 상태를 확인합니다 (메모리의 자격 증명 기준, 파일은 처음 한 번만 읽음)."""
     try:
-        creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
-        return creds and (creds.valid or creds.refresh_token)
+        return credentials.is_authenticated(TOKEN_FILE, SCOPES)
     except Exception:
         return False
 
 
 def logout():
     """저장된 토큰을 삭제합니다."""
+    global _oauth_service
+
+    _oauth_service = None
+    credentials.forget(TOKEN_FILE)
+
     if os.path.exists(TOKEN_FILE):
         os.remove(TOKEN_FILE)
         return True
@@ -0,0 +1,151 @@
+"""
+레코드 메모리 벤치마크
+- 검색 중 메모리에 올라가는 데이터(구독 목록, 채널 정보, RSS 영상, 영상 통계, 결과)를
+  dict 방식과 records 레코드 방식으로 만들어 tracemalloc으로 비교
+- 채널 ID/채널명은 실제처럼 항목마다 따로 만들어진 문자열로 생성 (JSON/피드 파싱 결과와 같음)
+
+사용 예:
+    python bench_records.py --channels 10000 --videos 150000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from records import (
+    VideoEntry, VideoStats, ChannelInfo, Subscription, VideoResult, THUMBNAIL_URL_TEMPLATE
+)
+
+RESULT_RATIO = 10  # 영상 10개 중 1개가 필터 통과
+
+
+def _fresh(text):
+    """파싱 결과처럼 같은 내용의 새 문자열 객체를 만듭니다."""
+    return ''.join(list(text))
+
+
+def _channel_id(i):
+    return f"UC{i:022d}"
+
+
+def _video_id(i):
+    return f"v{i:010d}"
+
+
+def build_dicts(channels, videos):
+    subscriptions = [
+        {
+            'id': _fresh(_channel_id(c)),
+            'title': _fresh(f"채널 {c}"),
+            'thumbnail': f"https://yt3.ggpht.com/ytc/{c}=s88",
+            'description': '',
+            'subscriberCount': c * 10
+        }
+        for c in range(channels)
+    ]
+    channel_info = {
+        _channel_id(c): {
+            'subscriberCount': c * 10,
+            'title': _fresh(f"채널 {c}"),
+            'thumbnail': f"https://yt3.ggpht.com/ytc/{c}=s88"
+        }
+        for c in range(channels)
+    }
+    all_videos = [
+        {
+            'videoId': _video_id(v),
+            'title': f"영상 제목 {v}",
+            'channelId': _fresh(_channel_id(v % channels)),
+            'channelTitle': _fresh(f"채널 {v % channels}"),
+            'publishedAt': f"2024-01-{v % 28 + 1:02d}T00:00:00",
+            'thumbnail': THUMBNAIL_URL_TEMPLATE.format(_video_id(v))
+        }
+        for v in range(videos)
+    ]
+    video_info = {
+        _video_id(v): {'viewCount': v * 3, 'likeCount': v, 'commentCount': v // 10, 'duration': 600}
+        for v in range(videos)
+    }
+    results = [
+        dict(video, viewCount=v * 3, likeCount=v, subscriberCount=0, duration=600,
+             ratio=1.5, velocity=0.0)
+        for v, video in enumerate(all_videos) if v % RESULT_RATIO == 0
+    ]
+    return subscriptions, channel_info, all_videos, video_info, results
+
+
+def build_records(channels, videos):
+    subscriptions = [
+        Subscription(
+            _fresh(_channel_id(c)),
+            _fresh(f"채널 {c}"),
+            f"https://yt3.ggpht.com/ytc/{c}=s88",
+            '',
+            c * 10
+        )
+        for c in range(channels)
+    ]
+    channel_info = {
+        _channel_id(c): ChannelInfo(c * 10, _fresh(f"채널 {c}"), f"https://yt3.ggpht.com/ytc/{c}=s88")
+        for c in range(channels)
+    }
+    all_videos = [
+        VideoEntry(
+            _video_id(v),
+            f"영상 제목 {v}",
+            _fresh(_channel_id(v % channels)),
+            _fresh(f"채널 {v % channels}"),
+            f"2024-01-{v % 28 + 1:02d}T00:00:00"
+        )
+        for v in range(videos)
+    ]
+    video_info = {_video_id(v): VideoStats(v * 3, v, v // 10, 600) for v in range(videos)}
+    results = [
+        VideoResult(video.videoId, video.title, video.channelId, video.channelTitle,
+                    video.publishedAt, v * 3, v, 0, 600, 1.5, 0.0)
+        for v, video in enumerate(all_videos) if v % RESULT_RATIO == 0
+    ]
+    return subscriptions, channel_info, all_videos, video_info, results
+
+
+def measure(build, channels, videos):
+    """데이터셋별로 살아 있는 메모리(바이트)를 측정합니다."""
+    names = ('subscriptions', 'channel_info', 'all_videos', 'video_info', 'results')
+    gc.collect()
+    tracemalloc.start()
+    data = list(build(channels, videos))
+    total, _ = tracemalloc.get_traced_memory()
+
+    # 데이터셋별 크기: 뒤에서부터 하나씩 버리면서 줄어든 양
+    sizes = dict.fromkeys(names, 0)
+    for index in range(len(data) - 1, -1, -1):
+        before, _ = tracemalloc.get_traced_memory()
+        data[index] = None
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+        sizes[names[index]] = before - after
+    tracemalloc.stop()
+
+    sizes['total'] = total
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='레코드 메모리 벤치마크')
+    parser.add_argument('--channels', type=int, default=10000, help='채널 수 (기본: 10000)')
+    parser.add_argument('--videos', type=int, default=150000, help='영상 수 (기본: 150000)')
+    args = parser.parse_args()
+
+    dict_sizes = measure(build_dicts, args.channels, args.videos)
+    record_sizes = measure(build_records, args.channels, args.videos)
+
+    print(f"채널 {args.channels}개, 영상 {args.videos}개")
+    print(f"{'':14s} {'dict':>10s} {'records':>10s} {'절감':>6s}")
+    for name in dict_sizes:
+        before, after = dict_sizes[name], record_sizes[name]
+        saved = (1 - after / before) * 100 if before else 0
+        print(f"{name:14s} {before / 1024 / 1024:8.1f}MB {after / 1024 / 1024:8.1f}MB {saved:5.0f}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+시작 속도 벤치마크
+- 앱 모듈 import 시간 (새 프로세스에서 측정, 첫 화면 전 비용)
+- 첫 검색 전 비용: Google API 라이브러리 import + 서비스 생성
+- 재사용되는 서비스 조회 비용
+
+실제 앱의 첫 화면/첫 검색까지 시간은 main.get_startup_timings로 확인합니다.
+
+사용 예:
+    python bench_startup.py --repeat 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# 새 프로세스에서 실행할 측정 코드 (결과: 이름=초)
+_IMPORT_APP = '''
+import time
+t = time.perf_counter()
+import {modules}
+print("import_app=%f" % (time.perf_counter() - t))
+'''
+
+_FIRST_SEARCH = '''
+import time
+import auth, config
+config.API_KEY = "bench-key"
+t = time.perf_counter()
+auth.get_api_service()
+print("first_service=%f" % (time.perf_counter() - t))
+t = time.perf_counter()
+for _ in range(100):
+    auth.get_api_service()
+print("memoized_service=%f" % ((time.perf_counter() - t) / 100))
+'''
+
+
+def _run(code):
+    """새 파이썬 프로세스에서 코드를 실행하고 측정값을 반환합니다."""
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True, text=True, check=True
+    ).stdout
+
+    result = {}
+    for line in output.splitlines():
+        if '=' in line:
+            name, value = line.split('=', 1)
+            result[name] = float(value)
+    return result
+
+
+def _app_modules():
+    """import할 앱 모듈 (eel이 없으면 헤드리스 모듈만)."""
+    try:
+        import eel  # noqa: F401
+        return 'main'
+    except ImportError:
+        return 'auth, search_pipeline, cache_manager, thumbnail_cache'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시작 속도 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (기본: 5)')
+    args = parser.parse_args()
+
+    modules = _app_modules()
+    samples = {}
+
+    for _ in range(args.repeat):
+        runs = [_run(_IMPORT_APP.format(modules=modules))]
+        try:
+            runs.append(_run(_FIRST_SEARCH))
+        except subprocess.CalledProcessError as e:
+            print(f"서비스 생성 측정 실패: {e.stderr.strip().splitlines()[-1]}")
+
+        for run in runs:
+            for name, value in run.items():
+                samples.setdefault(name, []).append(value)
+
+    print(f"모듈: {modules}")
+    for name, values in samples.items():
+        print(
+            f"{name:18s} 중앙값 {statistics.median(values) * 1000:8.2f}ms "
+            f"(최소 {min(values) * 1000:.2f}ms, {len(values)}회)"
+        )
+
+
+if __name__ == '__main__':
+    main()
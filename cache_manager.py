@@ -1,13 +1,21 @@
 """
 캐시 관리 모듈
-- 구독 목록, 채널 정보 캐싱
-- 캐시 만료 확인 (24시간)
+- 구독 목록 캐싱 (계정별 파일, accounts 모듈이 경로 지정)
+- 채널 정보/RSS 피드/영상 통계 항목별 캐싱 (모든 계정이 공유)
+- 캐시 만료 확인 (구독 목록 24시간, 항목별 캐시는 종류별 유효 시간)
+- 메모리에는 레코드 객체(records), 파일에는 필드 값 리스트로 저장
+- 다른 프로세스(refresher 데몬 등)가 저장하면 파일 수정 시각으로 감지해 합침
 """
 
 import os
 import json
+import time
+import threading
 from datetime import datetime, timedelta
 
+import metrics
+from records import ChannelInfo, VideoEntry, VideoStats, Subscription
+
 CACHE_DIR = 'cache'
 CACHE_EXPIRY_HOURS = 24
 
@@ -15,12 +23,49 @@ CACHE_EXPIRY_HOURS = 24
 SUBSCRIPTIONS_CACHE = os.path.join(CACHE_DIR, 'subscriptions.json')
 CHANNELS_CACHE = os.path.join(CACHE_DIR, 'channels.json')
 VIDEOS_CACHE = os.path.join(CACHE_DIR, 'videos.json')
-
-
-def _ensure_cache_dir():
-    """캐시 디렉토리가 없으면 생성합니다."""
-    if not os.path.exists(CACHE_DIR):
-        os.makedirs(CACHE_DIR)
+FEEDS_CACHE = os.path.join(CACHE_DIR, 'feeds.json')
+
+# 항목별 캐시 유효 시간 (초)
+CHANNEL_STATS_TTL = 24 * 3600
+FEED_TTL = 30 * 60
+VIDEO_STATS_TTL = 60 * 60
+
+_item_lock = threading.Lock()
+_item_caches = {}  # 캐시 파일 -> {ID: [저장 시각, 레코드]}
+_item_mtimes = {}  # 캐시 파일 -> 마지막으로 읽거나 쓴 파일의 수정 시각 (다른 프로세스의 저장 감지)
+_write_lock = threading.Lock()  # 파일 쓰기 (조회는 막지 않음, 둘 다 잡을 때는 항상 _write_lock 먼저)
+_versions = {}     # 캐시 파일 -> [메모리 버전, 파일에 쓴 버전]
+
+# 항목별 캐시 파일 값 <-> 레코드 변환 (읽기, 쓰기)
+_CHANNEL_CODEC = (ChannelInfo.load, ChannelInfo.to_row)
+_VIDEO_CODEC = (VideoStats.load, VideoStats.to_row)
+_FEED_CODEC = (
+    lambda value: [VideoEntry.load(video) for video in value],
+    lambda videos: [video.to_row() for video in videos]
+)
+
+
+def _ensure_cache_dir(cache_file=None):
+    """캐시 파일이 들어갈 디렉토리가 없으면 생성합니다."""
+    cache_dir = os.path.dirname(cache_file) if cache_file else CACHE_DIR
+    if cache_dir and not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+
+
+def _write_file(cache_file, data, **kwargs):
+    """
+    임시 파일에 쓴 뒤 바꿔치기합니다 (중간에 중단되거나 다른 프로세스가 읽어도 잘린 파일이 보이지 않음).
+
+    Returns:
+        int: 쓴 파일의 수정 시각 (ns)
+    """
+    _ensure_cache_dir(cache_file)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, **kwargs)
+    mtime = os.stat(tmp_file).st_mtime_ns  # 바꿔치기해도 유지됨
+    os.replace(tmp_file, cache_file)
+    return mtime
 
 
 def _is_cache_valid(cache_file):
@@ -42,34 +87,36 @@ def _is_cache_valid(cache_file):
 
 def _save_cache(cache_file, data):
     """데이터를 캐시 파일에 저장합니다."""
-    _ensure_cache_dir()
-
     cache_data = {
         'cached_at': datetime.now().isoformat(),
         'data': data
     }
 
-    with open(cache_file, 'w', encoding='utf-8') as f:
-        json.dump(cache_data, f, ensure_ascii=False, indent=2)
+    _write_file(cache_file, cache_data, indent=2)
 
 
 def _load_cache(cache_file):
-    """캐시 파일에서 데이터를 불러옵니다."""
+    """캐시 파일에서 데이터를 불러옵니다 (적중/실패는 파일 이름별로 기록)."""
+    dataset = os.path.splitext(os.path.basename(cache_file))[0]
+
     if not _is_cache_valid(cache_file):
+        metrics.record_cache(dataset, False)
         return None
 
     try:
         with open(cache_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
+        metrics.record_cache(dataset, True)
         return data.get('data')
     except Exception:
+        metrics.record_cache(dataset, False)
         return None
 
 
 # 구독 목록 캐시
 def save_subscriptions(subscriptions):
-    """구독 목록을 캐시에 저장합니다."""
-    _save_cache(SUBSCRIPTIONS_CACHE, subscriptions)
+    """구독 목록(Subscription 리스트)을 캐시에 저장합니다."""
+    _save_cache(SUBSCRIPTIONS_CACHE, [sub.to_dict() for sub in subscriptions])
     print(f"구독 목록 {len(subscriptions)}개 캐시 저장 완료")
 
 
@@ -78,32 +125,195 @@ def load_subscriptions():
     data = _load_cache(SUBSCRIPTIONS_CACHE)
     if data:
         print(f"캐시에서 구독 목록 {len(data)}개 로드")
+        return [Subscription.from_dict(sub) for sub in data]
     return data
 
 
-# 채널 정보 캐시
-def save_channels(channels):
+def read_subscriptions(cache_file):
+    """
+    구독 목록 캐시 파일을 만료 여부와 관계없이 읽습니다.
+    (다른 계정의 채널 ID 목록을 모을 때 사용)
+    """
+    if not os.path.exists(cache_file):
+        return []
+
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f).get('data') or []
+        return [Subscription.from_dict(sub) for sub in data]
+    except Exception:
+        return []
+
+
+# 항목별 캐시 (채널 정보, 피드, 영상 통계)
+def _file_mtime(cache_file):
+    try:
+        return os.stat(cache_file).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _get_items(cache_file, codec):
+    """
+    항목별 캐시를 메모리로 불러옵니다 (잠금 안에서 호출).
+    파일이 마지막으로 읽거나 쓴 뒤 바뀌었으면 다시 읽어 항목별로 더 최근 것을 남깁니다.
+    """
+    items = _item_caches.get(cache_file)
+    mtime = _file_mtime(cache_file)
+    if items is not None and mtime == _item_mtimes.get(cache_file):
+        return items
+
+    if items is None:
+        items = _item_caches[cache_file] = {}
+    _item_mtimes[cache_file] = mtime
+    if mtime is None:
+        return items
+
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f).get('data')
+    except Exception:
+        return items
+
+    if isinstance(data, dict):
+        decode = codec[0]
+        for item_id, entry in data.items():
+            current = items.get(item_id)
+            if current is None or current[0] < entry[0]:
+                items[item_id] = [entry[0], decode(entry[1])]
+    return items
+
+
+def _lookup_items(cache_file, ids, ttl, codec):
+    """
+    유효 시간 안에 저장된 항목을 찾습니다.
+
+    Returns:
+        tuple: ({ID: 레코드}, 캐시에 없거나 만료된 ID 리스트)
+    """
+    now = time.time()
+    hits = {}
+    missing = []
+
+    with _item_lock:
+        items = _get_items(cache_file, codec)
+        for item_id in ids:
+            entry = items.get(item_id)
+            if entry and now - entry[0] < ttl:
+                hits[item_id] = entry[1]
+            else:
+                missing.append(item_id)
+
+    dataset = os.path.splitext(os.path.basename(cache_file))[0]
+    metrics.record_cache(dataset, True, len(hits))
+    metrics.record_cache(dataset, False, len(missing))
+    return hits, missing
+
+
+def _snapshot(cache_file, ttl, codec):
+    """
+    만료된 항목을 정리하고 파일에 쓸 값을 만듭니다 (잠금 안에서 호출).
+
+    Returns:
+        tuple: (파일에 쓸 값, 버전)
+    """
+    now = time.time()
+    items = _get_items(cache_file, codec)
+
+    expired = [item_id for item_id, entry in items.items() if now - entry[0] >= ttl]
+    for item_id in expired:
+        del items[item_id]
+
+    encode = codec[1]
+    rows = {item_id: [entry[0], encode(entry[1])] for item_id, entry in items.items()}
+    versions = _versions.setdefault(cache_file, [0, 0])
+    versions[0] += 1
+    return rows, versions[0]
+
+
+def _store_items(cache_file, new_items, ttl, codec):
+    """
+    항목을 저장하고 만료된 항목을 정리한 뒤 파일에 기록합니다.
+    파일 쓰기(직렬화)는 조회 잠금 밖에서 하고, 더 새로운 내용이 이미 쓰였으면 건너뜁니다.
+    """
+    if not new_items:
+        return
+
+    now = time.time()
+
+    with _item_lock:
+        items = _get_items(cache_file, codec)
+        for item_id, data in new_items.items():
+            items[item_id] = [now, data]
+        rows, version = _snapshot(cache_file, ttl, codec)
+
+    with _write_lock:
+        versions = _versions.setdefault(cache_file, [0, 0])
+        if versions[1] >= version:
+            return
+        if _file_mtime(cache_file) != _item_mtimes.get(cache_file):
+            # 그사이 다른 프로세스가 저장함: 합쳐서 다시 만듦
+            with _item_lock:
+                rows, version = _snapshot(cache_file, ttl, codec)
+
+        mtime = _write_file(
+            cache_file,
+            {'cached_at': datetime.now().isoformat(), 'data': rows},
+            separators=(',', ':')
+        )
+        versions[1] = version
+        # 방금 쓴 파일은 다시 읽지 않음 (그 뒤 다른 프로세스가 쓰면 수정 시각이 달라 다시 읽음)
+        with _item_lock:
+            _item_mtimes[cache_file] = mtime
+
+
+def load_channel_stats(channel_ids):
+    """캐시된 채널 정보를 찾습니다 (get_channels_batch 형식)."""
+    return _lookup_items(CHANNELS_CACHE, channel_ids, CHANNEL_STATS_TTL, _CHANNEL_CODEC)
+
+
+def save_channel_stats(channel_info):
     """채널 정보를 캐시에 저장합니다."""
-    _save_cache(CHANNELS_CACHE, channels)
-    print(f"채널 정보 {len(channels)}개 캐시 저장 완료")
+    _store_items(CHANNELS_CACHE, channel_info, CHANNEL_STATS_TTL, _CHANNEL_CODEC)
 
 
-def load_channels():
-    """캐시에서 채널 정보를 불러옵니다."""
-    data = _load_cache(CHANNELS_CACHE)
-    if data:
-        print(f"캐시에서 채널 정보 {len(data)}개 로드")
-    return data
+def load_feeds(channel_ids):
+    """캐시된 채널별 RSS 영상 목록을 찾습니다."""
+    return _lookup_items(FEEDS_CACHE, channel_ids, FEED_TTL, _FEED_CODEC)
+
+
+def save_feeds(feeds):
+    """채널별 RSS 영상 목록을 캐시에 저장합니다 (받지 못한 채널은 제외)."""
+    _store_items(
+        FEEDS_CACHE,
+        {cid: videos for cid, videos in feeds.items() if videos is not None},
+        FEED_TTL,
+        _FEED_CODEC
+    )
+
+
+def load_video_stats(video_ids):
+    """캐시된 영상 통계를 찾습니다 (get_videos_batch 형식)."""
+    return _lookup_items(VIDEOS_CACHE, video_ids, VIDEO_STATS_TTL, _VIDEO_CODEC)
+
+
+def save_video_stats(video_info):
+    """영상 통계를 캐시에 저장합니다."""
+    _store_items(VIDEOS_CACHE, video_info, VIDEO_STATS_TTL, _VIDEO_CODEC)
 
 
 # 캐시 삭제
 def clear_all_cache():
     """모든 캐시를 삭제합니다."""
-    cache_files = [SUBSCRIPTIONS_CACHE, CHANNELS_CACHE, VIDEOS_CACHE]
+    cache_files = [SUBSCRIPTIONS_CACHE, CHANNELS_CACHE, VIDEOS_CACHE, FEEDS_CACHE]
 
-    for cache_file in cache_files:
-        if os.path.exists(cache_file):
-            os.remove(cache_file)
+    with _write_lock, _item_lock:
+        _item_caches.clear()
+        _item_mtimes.clear()
+        _versions.clear()
+        for cache_file in cache_files:
+            if os.path.exists(cache_file):
+                os.remove(cache_file)
 
     print("모든 캐시 삭제 완료")
 
@@ -121,7 +331,8 @@ def get_cache_info():
 
     for name, path in [('subscriptions', SUBSCRIPTIONS_CACHE),
                        ('channels', CHANNELS_CACHE),
-                       ('videos', VIDEOS_CACHE)]:
+                       ('videos', VIDEOS_CACHE),
+                       ('feeds', FEEDS_CACHE)]:
         if os.path.exists(path):
             try:
                 with open(path, 'r', encoding='utf-8') as f:
@@ -0,0 +1,182 @@
+"""
+헤드리스 검색 명령 (브라우저/Eel 없이 실행)
+- 구독 채널 불러오기 + 영상 검색 파이프라인 실행
+- 결과를 NDJSON 또는 CSV로 표준 출력/파일에 기록
+- 저장된 검색은 refresher가 갱신한 결과를 바로 출력 (--saved)
+
+사용 예:
+    python cli.py --filter-type mutation --ratio 2 --days 7 --format csv -o result.csv
+    python cli.py --saved rising --format csv
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import sys
+import time
+
+from auth import get_authenticated_service, get_api_service
+import accounts
+import metrics
+import profiler
+import saved_searches
+import search_pipeline
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description='구독 채널에서 조건에 맞는 영상을 검색합니다 (헤드리스).'
+    )
+    parser.add_argument('--filter-type', choices=('normal', 'mutation', 'velocity'), default='normal',
+                        help='필터 종류 (기본: normal)')
+    parser.add_argument('--max-subscribers', type=int, default=10000,
+                        help='일반 필터: 구독자 수 상한 (기본: 10000)')
+    parser.add_argument('--min-views', type=int, default=10000,
+                        help='일반 필터: 조회수 하한 (기본: 10000)')
+    parser.add_argument('--ratio', type=float, default=1.0,
+                        help='돌연변이 필터: 조회수/구독자 비율 하한 (기본: 1.0)')
+    parser.add_argument('--min-velocity', type=float, default=100,
+                        help='급상승 필터: 시간당 조회수 하한 (기본: 100)')
+    parser.add_argument('--days', type=int, default=15,
+                        help='최근 N일 이내 영상 (기본: 15)')
+    parser.add_argument('--sort', choices=search_pipeline.RESULT_SORT_KEYS,
+                        help='정렬 기준 (기본: 필터 종류에 따라 조회수/지수)')
+    parser.add_argument('--format', choices=('ndjson', 'csv'), default='ndjson',
+                        help='출력 형식 (기본: ndjson)')
+    parser.add_argument('-o', '--output',
+                        help='출력 파일 (기본: 표준 출력)')
+    parser.add_argument('--refresh-subs', action='store_true',
+                        help='구독 목록 캐시를 무시하고 API로 다시 조회')
+    parser.add_argument('--account', default=accounts.DEFAULT_ACCOUNT,
+                        help='사용할 계정 (기본: default)')
+    parser.add_argument('--all-accounts', action='store_true',
+                        help='모든 계정의 저장된 구독 채널을 합쳐서 검색')
+    parser.add_argument('--channels-file',
+                        help='구독 목록 대신 사용할 채널 ID 파일 (한 줄에 하나)')
+    parser.add_argument('--saved', metavar='NAME',
+                        help='검색하지 않고 저장된 검색의 결과(refresher가 갱신)를 출력')
+    parser.add_argument('--metrics-file', default=metrics.TRACE_FILE,
+                        help='검색 측정값을 JSONL로 덧붙일 파일 '
+                             '(기본: AUTOBLOGER_METRICS_FILE 환경 변수)')
+    parser.add_argument('--profile', action='store_true', default=profiler.ENABLED,
+                        help='단계별 cProfile/tracemalloc 보고서를 profiles/에 저장 '
+                             '(기본: AUTOBLOGER_PROFILE 환경 변수)')
+    return parser
+
+
+def read_channel_ids(path):
+    """채널 ID 파일을 읽습니다 (한 줄에 하나, #으로 시작하는 줄은 무시)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+
+def _get_oauth_service():
+    return get_authenticated_service(interactive=False)
+
+
+def write_ndjson(videos, out):
+    for video in videos:
+        out.write(json.dumps(video.to_dict(), ensure_ascii=False))
+        out.write('\n')
+
+
+def write_csv(videos, out):
+    writer = csv.DictWriter(out, fieldnames=search_pipeline.RESULT_FIELDS)
+    writer.writeheader()
+    for video in videos:
+        writer.writerow(video.to_dict())
+
+
+def _write_results(videos, args):
+    writer = write_csv if args.format == 'csv' else write_ndjson
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as out:
+            writer(videos, out)
+    else:
+        writer(videos, sys.stdout)
+        sys.stdout.flush()
+
+
+def run_saved(args):
+    """저장된 검색의 뷰를 출력합니다."""
+    filter_config = saved_searches.get_search(args.saved)
+    view = saved_searches.load_view(args.saved)
+    if filter_config is None or view is None or view.get('filterConfig') != filter_config:
+        print(f"오류: '{args.saved}' 검색 결과가 없습니다. refresher.py를 먼저 실행하세요.",
+              file=sys.stderr)
+        return 1
+
+    sort_key = args.sort or search_pipeline.default_sort_key(filter_config)
+    _write_results(search_pipeline.sort_results(view['results'], sort_key), args)
+    print(f"결과 {len(view['results'])}개 ({view.get('updatedAt')} 갱신)", file=sys.stderr)
+    return 0
+
+
+def run(args):
+    """
+    검색을 실행하고 결과를 기록합니다.
+
+    Returns:
+        int: 종료 코드
+    """
+    if args.saved:
+        return run_saved(args)
+
+    filter_config = {
+        'filterType': args.filter_type,
+        'maxSubscribers': args.max_subscribers,
+        'minViews': args.min_views,
+        'daysWithin': args.days,
+        'mutationRatio': args.ratio,
+        'minVelocity': args.min_velocity
+    }
+    metrics.TRACE_FILE = args.metrics_file or ''
+    profiler.ENABLED = args.profile
+    started = time.perf_counter()
+
+    # 진행 메시지는 표준 에러로 (표준 출력은 결과 전용)
+    with contextlib.redirect_stdout(sys.stderr):
+        if not accounts.switch(args.account):
+            print(f"오류: 잘못된 계정 이름입니다: {args.account}")
+            return 1
+
+        if args.channels_file:
+            channel_ids = read_channel_ids(args.channels_file)
+        elif args.all_accounts:
+            channel_ids = accounts.collect_channel_ids(accounts.list_accounts())
+        else:
+            try:
+                subs, _ = search_pipeline.load_subscriptions(_get_oauth_service, args.refresh_subs)
+            except Exception as e:
+                print(f"구독 목록 오류: {e}")
+                return 1
+            channel_ids = [sub.id for sub in subs]
+
+        api_service = get_api_service() or _get_oauth_service()
+        if not api_service:
+            print("오류: API 키 또는 로그인이 필요합니다.")
+            return 1
+
+        total, videos = search_pipeline.run_search(api_service, channel_ids, filter_config)
+
+    sort_key = args.sort or search_pipeline.default_sort_key(filter_config)
+    videos = search_pipeline.sort_results(videos, sort_key)
+
+    _write_results(videos, args)
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"채널 {len(channel_ids)}개, 영상 {total}개 수집, 결과 {len(videos)}개 "
+        f"({elapsed:.2f}초, 채널 {len(channel_ids) / elapsed:.1f}개/초)",
+        file=sys.stderr
+    )
+    return 0
+
+
+def main(argv=None):
+    return run(build_parser().parse_args(argv))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,578 @@
+"""
+분산 피드 수집 모듈 (코디네이터/워커)
+- 코디네이터: 채널 ID를 샤드로 나눠 SQLite 작업 큐에 넣고, TCP(JSON 한 줄씩)로 워커에게 나눠 줌
+- 워커: 샤드를 받아 RSS를 수집/파싱하고 압축된 결과를 코디네이터로 보냄 (여러 머신 가능)
+- 임대 시간 안에 결과가 오지 않으면(워커 중단 등) 샤드를 다른 워커에게 다시 배정
+- 받지 못한 채널은 새 샤드로 한 번 더 시도
+- 워커별 처리량 통계 (샤드/채널/영상 수, 채널/초)
+- 결과는 피드 캐시에 저장 (검색 파이프라인이 그대로 사용)
+
+사용 예:
+    python crawl_cluster.py coordinator --channels-file ids.txt --local-workers 4
+    python crawl_cluster.py coordinator --channels-file ids.txt --bind 0.0.0.0:8766 --local-workers 0
+    python crawl_cluster.py worker --connect 10.0.0.5:8766
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import sqlite3
+import argparse
+import threading
+import subprocess
+import socketserver
+
+import cache_manager
+import metrics
+import rss_fetcher
+from records import VideoEntry
+
+QUEUE_DIR = os.path.join(cache_manager.CACHE_DIR, 'crawl')  # 실행마다 큐 파일 하나
+SHARD_SIZE = 50        # 샤드 하나의 채널 수
+LEASE_SECONDS = 120    # 이 시간 안에 결과가 없으면 다시 배정
+MAX_ATTEMPTS = 3       # 샤드 하나를 시도하는 최대 횟수
+IDLE_WAIT = 0.5        # 남은 샤드가 모두 임대 중일 때 워커가 기다리는 시간 (초)
+
+
+# 결과 압축: {채널ID: [채널명, [[영상ID, 제목, 게시 시각], ...]] 또는 None}
+def encode_feed(videos):
+    if videos is None:
+        return None
+    title = videos[0].channelTitle if videos else ''
+    return [title, [[v.videoId, v.title, v.publishedAt] for v in videos]]
+
+
+def decode_feed(channel_id, data):
+    if data is None:
+        return None
+    title, rows = data
+    return [VideoEntry(video_id, video_title, channel_id, title, published)
+            for video_id, video_title, published in rows]
+
+
+class WorkQueue:
+    """SQLite 샤드 큐 (코디네이터 프로세스 안에서 여러 스레드가 공유)."""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS shards (
+                id INTEGER PRIMARY KEY,
+                channels TEXT NOT NULL,
+                days INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                worker TEXT,
+                lease_until REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                channel_id TEXT PRIMARY KEY,
+                data TEXT
+            );
+        ''')
+        self.reassigned = 0
+
+    def reset(self):
+        """이전 실행의 샤드와 결과를 지웁니다."""
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM shards')
+            self._db.execute('DELETE FROM results')
+
+    def add(self, channel_ids, days, shard_size=SHARD_SIZE, attempts=0):
+        """채널 ID를 샤드로 나눠 넣습니다 (잠금 안에서도 호출 가능하도록 잠금 없이 실행)."""
+        rows = [
+            (json.dumps(channel_ids[i:i + shard_size]), days, attempts)
+            for i in range(0, len(channel_ids), shard_size)
+        ]
+        with self._db:
+            self._db.executemany('INSERT INTO shards (channels, days, attempts) VALUES (?, ?, ?)', rows)
+        return len(rows)
+
+    def add_shards(self, channel_ids, days, shard_size=SHARD_SIZE):
+        with self._lock:
+            return self.add(channel_ids, days, shard_size)
+
+    def resume(self):
+        """중단된 실행을 이어서 하도록 임대 중인 샤드를 되돌립니다."""
+        with self._lock, self._db:
+            self._db.execute("UPDATE shards SET status = 'pending', worker = NULL WHERE status = 'leased'")
+
+    def lease(self, worker, lease_seconds=LEASE_SECONDS):
+        """
+        대기 중인 샤드 하나를 워커에게 임대합니다 (임대가 만료된 샤드는 먼저 되돌림).
+
+        Returns:
+            tuple: (샤드 ID, 채널 ID 리스트, 기간) 또는 None
+        """
+        now = time.time()
+        with self._lock, self._db:
+            expired = self._db.execute(
+                "UPDATE shards SET status = 'pending', worker = NULL, attempts = attempts + 1, "
+                "error = 'lease expired' WHERE status = 'leased' AND lease_until < ?",
+                (now,)
+            ).rowcount
+            if expired:
+                self.reassigned += expired
+                self._db.execute(
+                    "UPDATE shards SET status = 'failed' WHERE status = 'pending' AND attempts >= ?",
+                    (MAX_ATTEMPTS,)
+                )
+
+            row = self._db.execute(
+                "SELECT id, channels, days FROM shards WHERE status = 'pending' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._db.execute(
+                "UPDATE shards SET status = 'leased', worker = ?, lease_until = ? WHERE id = ?",
+                (worker, now + lease_seconds, row[0])
+            )
+        return row[0], json.loads(row[1]), row[2]
+
+    def complete(self, shard_id, worker, feeds):
+        """
+        샤드 결과를 저장합니다. 받지 못한 채널은 새 샤드로 다시 넣습니다.
+
+        Args:
+            shard_id: 샤드 ID
+            worker: 결과를 보낸 워커 이름
+            feeds: {채널ID: encode_feed 결과}
+
+        Returns:
+            bool: 받아들였으면 True (임대가 만료되어 다른 워커에게 넘어간 샤드의 늦은 결과면 False)
+        """
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT days, attempts FROM shards WHERE id = ? AND status = 'leased' AND worker = ?",
+                (shard_id, worker)
+            ).fetchone()
+            if row is None:
+                return False
+
+            days, attempts = row
+            self._db.executemany(
+                'INSERT OR REPLACE INTO results (channel_id, data) VALUES (?, ?)',
+                [(cid, json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+                 for cid, data in feeds.items() if data is not None]
+            )
+            self._db.execute("UPDATE shards SET status = 'done', worker = NULL WHERE id = ?", (shard_id,))
+
+            failed = [cid for cid, data in feeds.items() if data is None]
+            if failed and attempts + 1 < MAX_ATTEMPTS:
+                self.add(failed, days, attempts=attempts + 1)
+        return True
+
+    def fail(self, shard_id, worker, error):
+        """워커가 처리하지 못한 샤드를 다시 대기 상태로 (시도 횟수를 넘으면 실패로) 바꿉니다."""
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE shards SET status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END, "
+                "attempts = attempts + 1, worker = NULL, error = ? "
+                "WHERE id = ? AND status = 'leased' AND worker = ?",
+                (MAX_ATTEMPTS, str(error)[:500], shard_id, worker)
+            )
+
+    def counts(self):
+        """상태별 샤드 수를 반환합니다."""
+        with self._lock:
+            rows = self._db.execute('SELECT status, COUNT(*) FROM shards GROUP BY status').fetchall()
+        return dict(rows)
+
+    def is_finished(self):
+        counts = self.counts()
+        return not counts.get('pending') and not counts.get('leased')
+
+    def fetched(self):
+        """결과를 받은 채널 수를 반환합니다."""
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def results(self):
+        """
+        수집 결과를 반환합니다.
+
+        Returns:
+            dict: {채널ID: VideoEntry 리스트 (끝내 받지 못한 채널은 None)}
+        """
+        with self._lock:
+            channel_ids = set()
+            for (channels,) in self._db.execute('SELECT channels FROM shards'):
+                channel_ids.update(json.loads(channels))
+            stored = dict(self._db.execute('SELECT channel_id, data FROM results'))
+
+        return {
+            cid: decode_feed(cid, json.loads(stored[cid])) if cid in stored else None
+            for cid in channel_ids
+        }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class Coordinator:
+    """작업 큐를 TCP로 워커에게 나눠 주고 워커별 통계를 모읍니다."""
+
+    def __init__(self, queue, bind=('127.0.0.1', 0), lease_seconds=LEASE_SECONDS):
+        self.queue = queue
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        self.workers = {}   # 워커 이름 -> 통계
+        self.released = set()  # 종료 응답(done)을 받은 워커
+        self._server = socketserver.ThreadingTCPServer(bind, self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def address(self):
+        return self._server.server_address
+
+    def _worker_stats(self, name):
+        stats = self.workers.get(name)
+        if stats is None:
+            stats = self.workers[name] = {
+                'shards': 0, 'channels': 0, 'videos': 0, 'failedChannels': 0,
+                'errors': 0, 'fetchSeconds': 0.0, 'firstSeen': time.time(), 'lastSeen': time.time()
+            }
+        stats['lastSeen'] = time.time()
+        return stats
+
+    def handle(self, message):
+        """워커 메시지 하나를 처리하고 응답을 반환합니다."""
+        op = message.get('op')
+        worker = str(message.get('worker', 'unknown'))
+
+        if op == 'lease':
+            shard = self.queue.lease(worker, self.lease_seconds)
+            with self._lock:
+                self._worker_stats(worker)
+            if shard is None:
+                done = self.queue.is_finished()
+                if done:
+                    with self._lock:
+                        self.released.add(worker)
+                return {'shard': None, 'done': done, 'wait': IDLE_WAIT}
+            shard_id, channels, days = shard
+            return {'shard': shard_id, 'channels': channels, 'days': days}
+
+        if op == 'result':
+            feeds = message.get('feeds') or {}
+            accepted = self.queue.complete(message['shard'], worker, feeds)
+            with self._lock:
+                stats = self._worker_stats(worker)
+                stats['fetchSeconds'] += float(message.get('seconds', 0))
+                if accepted:
+                    stats['shards'] += 1
+                    stats['channels'] += len(feeds)
+                    stats['videos'] += sum(len(data[1]) for data in feeds.values() if data)
+                    stats['failedChannels'] += sum(1 for data in feeds.values() if data is None)
+            return {'ok': True, 'accepted': accepted}
+
+        if op == 'fail':
+            self.queue.fail(message['shard'], worker, message.get('error', ''))
+            with self._lock:
+                self._worker_stats(worker)['errors'] += 1
+            metrics.record_error('crawl_worker')
+            return {'ok': True}
+
+        return {'error': f'unknown op: {op}'}
+
+    def _make_handler(self):
+        coordinator = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        response = coordinator.handle(json.loads(line))
+                    except Exception as e:
+                        response = {'error': str(e)}
+                    self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+                    self.wfile.flush()
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='crawl-coordinator', daemon=True)
+        self._thread.start()
+
+    def wait_released(self, timeout):
+        """연결했던 워커가 모두 종료 응답을 받을 때까지 기다립니다."""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self._lock:
+                if self.released >= set(self.workers):
+                    return True
+            time.sleep(0.1)
+        return False
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def get_stats(self):
+        """워커별 처리량 통계를 반환합니다."""
+        with self._lock:
+            result = {}
+            for name, stats in self.workers.items():
+                busy = stats['fetchSeconds']
+                wall = max(stats['lastSeen'] - stats['firstSeen'], 1e-9)
+                result[name] = {
+                    **{key: stats[key] for key in ('shards', 'channels', 'videos', 'failedChannels', 'errors')},
+                    'fetchSeconds': round(busy, 3),
+                    'channelsPerSecond': round(stats['channels'] / busy, 1) if busy else 0,
+                    'wallChannelsPerSecond': round(stats['channels'] / wall, 1)
+                }
+        return result
+
+
+def spawn_local_workers(address, count):
+    """이 머신에서 워커 프로세스를 띄웁니다."""
+    host, port = address
+    script = os.path.abspath(__file__)
+    return [
+        subprocess.Popen(
+            [sys.executable, script, 'worker', '--connect', f"{host}:{port}", '--name', f"local-{i + 1}"],
+            cwd=os.getcwd()
+        )
+        for i in range(count)
+    ]
+
+
+def crawl(channel_ids, days_within=15, local_workers=4, bind=('127.0.0.1', 0),
+          queue_file=None, resume=False, progress_callback=None,
+          shard_size=SHARD_SIZE, lease_seconds=LEASE_SECONDS):
+    """
+    코디네이터를 띄워 워커들로 채널 피드를 수집합니다.
+
+    Args:
+        channel_ids: 채널 ID 리스트
+        days_within: 최근 N일 이내
+        local_workers: 이 머신에서 띄울 워커 수 (0이면 원격 워커만 기다림)
+        bind: 코디네이터 주소 (host, port)
+        queue_file: SQLite 큐 파일 (없으면 이 실행만 쓰는 파일을 만들고 끝나면 삭제)
+        resume: True면 queue_file의 이전 실행을 이어서 수행
+        progress_callback: 진행률 콜백 (받은 채널 수, 전체 채널 수)
+        shard_size: 샤드당 채널 수
+        lease_seconds: 샤드 임대 시간 (초)
+
+    Returns:
+        tuple: ({채널ID: VideoEntry 리스트 또는 None}, 워커별 통계)
+    """
+    channel_ids = list(channel_ids)
+    if resume and not queue_file:
+        raise ValueError('이어서 수행하려면 큐 파일이 필요합니다.')
+    temporary = not queue_file
+    if temporary:
+        # 앱과 refresher가 동시에 수집해도 서로의 샤드를 지우지 않도록 실행마다 따로 만듦
+        queue_file = os.path.join(QUEUE_DIR, f"{os.getpid()}-{threading.get_ident()}-{time.time_ns()}.db")
+
+    queue = WorkQueue(queue_file)
+    if resume:
+        queue.resume()
+    else:
+        queue.reset()
+        queue.add_shards(channel_ids, days_within, shard_size)
+
+    coordinator = Coordinator(queue, bind, lease_seconds)
+    coordinator.start()
+    processes = spawn_local_workers(coordinator.address, local_workers)
+    print(f"코디네이터 {coordinator.address[0]}:{coordinator.address[1]}, 로컬 워커 {local_workers}개")
+
+    finished = False
+    try:
+        last = None
+        while not queue.is_finished():
+            fetched = queue.fetched()
+            if progress_callback and fetched != last:
+                progress_callback(fetched, len(channel_ids))
+                last = fetched
+            if processes and all(p.poll() is not None for p in processes):
+                raise RuntimeError('로컬 워커가 모두 종료되었습니다.')
+            time.sleep(0.2)
+
+        counts = queue.counts()
+        results = queue.results()
+        if progress_callback:
+            progress_callback(len(results), len(results))
+        finished = True
+    finally:
+        # 워커는 다음 임대 요청에서 done을 받아 종료 (원격 워커도 기다림)
+        coordinator.wait_released(IDLE_WAIT * 4)
+        deadline = time.time() + 5
+        for p in processes:
+            try:
+                p.wait(timeout=max(0.1, deadline - time.time()))
+            except subprocess.TimeoutExpired:
+                p.terminate()
+        coordinator.stop()
+        queue.close()
+        if temporary and finished:
+            os.remove(queue_file)
+        elif not finished:
+            print(f"수집 중단: --resume --queue {queue_file} 로 이어서 수행할 수 있습니다.")
+
+    stats = coordinator.get_stats()
+    print(
+        f"분산 수집 완료: 샤드 {counts.get('done', 0)}개 완료, {counts.get('failed', 0)}개 실패, "
+        f"다시 배정 {queue.reassigned}회"
+    )
+    for name, worker in sorted(stats.items()):
+        print(
+            f"  {name}: 샤드 {worker['shards']}개, 채널 {worker['channels']}개, 영상 {worker['videos']}개, "
+            f"{worker['channelsPerSecond']}채널/초, 오류 {worker['errors']}회"
+        )
+    return results, stats
+
+
+def fetch_channels(channel_ids, days_within=15, progress_callback=None, local_workers=4):
+    """rss_fetcher.fetch_channels와 같은 형식으로 로컬 워커를 써서 수집합니다 (search_pipeline.CRAWL_WORKERS)."""
+    if not channel_ids:
+        return {}
+    results, _ = crawl(channel_ids, days_within, local_workers, progress_callback=progress_callback)
+    return results
+
+
+def run_worker(address, name=None, crash_after=None):
+    """
+    워커 루프: 샤드를 받아 수집하고 결과를 보냅니다 (남은 샤드가 없으면 종료).
+
+    Args:
+        address: 코디네이터 (host, port)
+        name: 워커 이름 (기본: 호스트명-PID)
+        crash_after: 테스트용, 샤드 N개를 받은 뒤 결과를 보내지 않고 종료 (다시 배정 확인)
+
+    Returns:
+        int: 처리한 샤드 수
+    """
+    name = name or f"{socket.gethostname()}-{os.getpid()}"
+    processed = 0
+    leased = 0
+
+    with socket.create_connection(address) as sock:
+        stream = sock.makefile('rwb')
+
+        def call(message):
+            message['worker'] = name
+            stream.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+            stream.flush()
+            line = stream.readline()
+            if not line:
+                raise ConnectionError('코디네이터 연결이 끊어졌습니다.')
+            return json.loads(line)
+
+        while True:
+            task = call({'op': 'lease'})
+            if task.get('shard') is None:
+                if task.get('done'):
+                    return processed
+                time.sleep(task.get('wait', IDLE_WAIT))
+                continue
+
+            leased += 1
+            if crash_after is not None and leased > crash_after:
+                print(f"[{name}] 테스트: 샤드 {task['shard']} 처리 중 종료")
+                os._exit(1)
+
+            started = time.perf_counter()
+            try:
+                feeds = rss_fetcher.fetch_channels(task['channels'], task['days'])
+            except Exception as e:
+                call({'op': 'fail', 'shard': task['shard'], 'error': str(e)})
+                continue
+
+            call({
+                'op': 'result',
+                'shard': task['shard'],
+                'seconds': round(time.perf_counter() - started, 3),
+                'feeds': {cid: encode_feed(videos) for cid, videos in feeds.items()}
+            })
+            processed += 1
+
+
+def _parse_address(text):
+    host, _, port = text.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='분산 피드 수집 (코디네이터/워커)')
+    sub = parser.add_subparsers(dest='role', required=True)
+
+    coord = sub.add_parser('coordinator', help='채널을 샤드로 나눠 워커에게 배정')
+    coord.add_argument('--channels-file', required=True, help='채널 ID 파일 (한 줄에 하나)')
+    coord.add_argument('--days', type=int, help='최근 N일 이내 (기본: 피드 캐시 기간 30일, '
+                                                  '더 짧으면 피드 캐시에 저장하지 않음)')
+    coord.add_argument('--bind', default='127.0.0.1:8766', help='주소 (기본: 127.0.0.1:8766)')
+    coord.add_argument('--local-workers', type=int, default=4, help='로컬 워커 수 (기본: 4)')
+    coord.add_argument('--shard-size', type=int, default=SHARD_SIZE,
+                       help=f'샤드당 채널 수 (기본: {SHARD_SIZE})')
+    coord.add_argument('--lease', type=int, default=LEASE_SECONDS,
+                       help=f'샤드 임대 시간, 지나면 다른 워커에게 배정 (초, 기본: {LEASE_SECONDS})')
+    coord.add_argument('--queue', help=f'SQLite 큐 파일 (기본: {QUEUE_DIR}/에 실행마다 만들고 끝나면 삭제)')
+    coord.add_argument('--resume', action='store_true', help='--queue 파일의 이전 실행 이어서 수행')
+    coord.add_argument('--stats-file', help='워커별 통계를 저장할 JSON 파일')
+
+    work = sub.add_parser('worker', help='코디네이터에서 샤드를 받아 수집')
+    work.add_argument('--connect', default='127.0.0.1:8766', help='코디네이터 주소')
+    work.add_argument('--name', help='워커 이름 (기본: 호스트명-PID)')
+    work.add_argument('--crash-after', type=int, help='테스트용: 샤드 N개 처리 후 비정상 종료')
+
+    args = parser.parse_args(argv)
+
+    if args.role == 'worker':
+        try:
+            count = run_worker(_parse_address(args.connect), args.name, args.crash_after)
+        except ConnectionError as e:
+            print(f"워커 종료: {e}")
+            return 1
+        print(f"워커 종료: 샤드 {count}개 처리")
+        return 0
+
+    if args.resume and not args.queue:
+        parser.error('--resume에는 --queue가 필요합니다.')
+
+    # 워커는 불러오지 않음 (API 모듈)
+    from cli import read_channel_ids
+    from search_pipeline import FEED_CACHE_DAYS
+
+    days = args.days or FEED_CACHE_DAYS
+    channel_ids = read_channel_ids(args.channels_file)
+    started = time.perf_counter()
+
+    def progress(current, total):
+        print(f"채널 {current}/{total}", file=sys.stderr)
+
+    results, stats = crawl(
+        channel_ids, days, args.local_workers, _parse_address(args.bind),
+        args.queue, args.resume, progress, args.shard_size, args.lease
+    )
+    # 피드 캐시 항목은 FEED_CACHE_DAYS 전체를 담고 있다고 보므로 더 짧은 기간은 저장하지 않음
+    cached = days >= FEED_CACHE_DAYS
+    if cached:
+        cache_manager.save_feeds(results)
+
+    elapsed = time.perf_counter() - started
+    videos = sum(len(v) for v in results.values() if v)
+    missing = sum(1 for v in results.values() if v is None)
+    print(
+        f"채널 {len(results)}개 ({missing}개 실패), 영상 {videos}개, {elapsed:.2f}초 "
+        f"({len(results) / elapsed:.1f}채널/초), "
+        + ("피드 캐시에 저장" if cached else f"{FEED_CACHE_DAYS}일보다 짧아 피드 캐시에 저장하지 않음")
+    )
+    if args.stats_file:
+        with open(args.stats_file, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
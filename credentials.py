@@ -0,0 +1,236 @@
+"""
+OAuth 자격 증명 관리 모듈
+- 토큰 파일은 처음 사용할 때 한 번만 읽고 메모리에 보관
+- 백그라운드 스레드가 토큰 파일 변경(다른 프로세스의 로그인/로그아웃)을 감시
+- 액세스 토큰은 만료 전에 백그라운드에서 미리 갱신 (API 호출 중에 갱신을 기다리지 않음)
+- 이미 만료된 토큰(하루 첫 실행 등)은 서비스를 만들 때 한 번 갱신 (ensure_fresh)
+- 갱신된 토큰은 파일에도 저장 (CLI 등 다른 프로세스와 공유)
+"""
+
+import os
+import time
+import threading
+from datetime import datetime, timezone
+
+import metrics
+import singleflight
+import transport
+
+REFRESH_AHEAD = 5 * 60   # 만료 5분 전부터 갱신
+CHECK_INTERVAL = 30      # 파일 변경/만료 확인 주기 (초)
+RETRY_INTERVAL = 60      # 갱신 실패(네트워크 등) 후 다시 시도할 때까지 (초)
+
+_lock = threading.Lock()
+_wake = threading.Event()
+_thread = None
+_entries = {}  # 토큰 파일 -> _Entry
+_flight = singleflight.group('token_refresh')  # 감시 스레드와 ensure_fresh가 동시에 갱신하지 않도록
+
+
+class _Entry:
+    """토큰 파일 하나의 메모리 상태."""
+
+    __slots__ = ('scopes', 'creds', 'mtime', 'retry_at')
+
+    def __init__(self, scopes, creds, mtime):
+        self.scopes = scopes
+        self.creds = creds
+        self.mtime = mtime
+        self.retry_at = 0
+
+
+def _mtime(token_file):
+    try:
+        return os.stat(token_file).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read(token_file, scopes):
+    """토큰 파일에서 자격 증명을 읽습니다 (없거나 읽을 수 없으면 None)."""
+    from google.oauth2.credentials import Credentials
+
+    if not os.path.exists(token_file):
+        return None
+    try:
+        return Credentials.from_authorized_user_file(token_file, scopes)
+    except Exception as e:
+        print(f"토큰 파일 읽기 실패 ({token_file}): {e}")
+        return None
+
+
+def _write(token_file, creds):
+    """토큰 파일을 저장하고 수정 시각을 반환합니다."""
+    token_dir = os.path.dirname(token_file)
+    if token_dir and not os.path.exists(token_dir):
+        os.makedirs(token_dir)
+    with open(token_file, 'w') as f:
+        f.write(creds.to_json())
+    return _mtime(token_file)
+
+
+def _needs_refresh(creds):
+    """갱신 토큰이 있고 액세스 토큰이 없거나 곧 만료되면 True."""
+    if not creds.refresh_token:
+        return False
+    if not creds.token:
+        return True
+    if creds.expiry is None:
+        return False
+    now = datetime.now(timezone.utc).replace(tzinfo=None)  # google-auth는 UTC naive 시각 사용
+    return (creds.expiry - now).total_seconds() < REFRESH_AHEAD
+
+
+def _ensure_watcher():
+    """감시 스레드를 시작합니다 (최초 1회, 잠금 안에서 호출)."""
+    global _thread
+
+    if _thread is None:
+        _thread = threading.Thread(target=_watch, name='credentials', daemon=True)
+        _thread.start()
+
+
+def get(token_file, scopes):
+    """
+    토큰 파일의 자격 증명을 반환합니다 (메모리에 있으면 파일을 읽지 않음).
+    만료가 가까우면 백그라운드 갱신을 요청합니다.
+
+    Args:
+        token_file: 토큰 파일 경로
+        scopes: OAuth 스코프 리스트
+
+    Returns:
+        Credentials 또는 None
+    """
+    with _lock:
+        entry = _entries.get(token_file)
+        if entry is None:
+            entry = _Entry(scopes, _read(token_file, scopes), _mtime(token_file))
+            _entries[token_file] = entry
+        _ensure_watcher()
+        creds = entry.creds
+
+    if creds is not None and _needs_refresh(creds):
+        _wake.set()
+    return creds
+
+
+def ensure_fresh(token_file, scopes):
+    """
+    액세스 토큰이 이미 쓸 수 없으면(없거나 만료) 지금 갱신하고 자격 증명을 반환합니다.
+    하루 첫 실행처럼 감시 스레드가 아직 갱신하지 못한 경우에만 기다리고,
+    만료가 가깝기만 한 토큰은 그대로 반환합니다 (갱신은 get()이 깨운 감시 스레드가 처리).
+
+    Returns:
+        Credentials 또는 None (갱신 토큰이 취소되었으면 None)
+    """
+    creds = get(token_file, scopes)
+    if creds is None or creds.valid or not creds.refresh_token:
+        return creds
+
+    with _lock:
+        entry = _entries.get(token_file)
+        retry_at = entry.retry_at if entry else 0
+    if time.monotonic() >= retry_at:
+        refresh(token_file)
+    return get(token_file, scopes)
+
+
+def is_authenticated(token_file, scopes):
+    """사용할 수 있는 자격 증명이 있는지 메모리 상태로 확인합니다."""
+    creds = get(token_file, scopes)
+    return bool(creds and (creds.valid or creds.refresh_token))
+
+
+def store(token_file, scopes, creds):
+    """새로 받은 자격 증명(로그인)을 파일과 메모리에 저장합니다."""
+    with _lock:
+        mtime = _write(token_file, creds)
+        _entries[token_file] = _Entry(scopes, creds, mtime)
+        _ensure_watcher()
+
+
+def forget(token_file):
+    """메모리의 자격 증명을 버립니다 (로그아웃)."""
+    with _lock:
+        _entries.pop(token_file, None)
+
+
+def refresh(token_file):
+    """
+    액세스 토큰을 지금 갱신하고 파일에 저장합니다 (감시 스레드, ensure_fresh에서 호출).
+    같은 파일의 갱신이 진행 중이면 그 결과를 기다립니다.
+
+    Returns:
+        bool: 성공 여부
+    """
+    return _flight.do(token_file, _refresh, token_file)
+
+
+def _refresh(token_file):
+    from google.auth.exceptions import RefreshError
+    from google.auth.transport.requests import Request
+
+    with _lock:
+        entry = _entries.get(token_file)
+        creds = entry.creds if entry else None
+    if creds is None or not creds.refresh_token:
+        return False
+
+    try:
+        creds.refresh(Request(transport.new_session()))
+    except RefreshError as e:
+        # 갱신 토큰이 취소/만료됨: 다시 로그인해야 함
+        print(f"토큰 갱신 실패, 다시 로그인하세요 ({token_file}): {e}")
+        metrics.record_error('token_refresh')
+        with _lock:
+            if _entries.get(token_file) is entry:
+                entry.creds = None
+        return False
+    except Exception as e:
+        print(f"토큰 갱신 실패, {RETRY_INTERVAL}초 후 다시 시도 ({token_file}): {e}")
+        metrics.record_error('token_refresh')
+        with _lock:
+            entry.retry_at = time.monotonic() + RETRY_INTERVAL
+        return False
+
+    metrics.incr('token_refresh')
+    with _lock:
+        if _entries.get(token_file) is entry and entry.creds is creds:
+            try:
+                entry.mtime = _write(token_file, creds)
+            except OSError as e:
+                print(f"토큰 저장 실패 ({token_file}): {e}")
+    return True
+
+
+def _check(token_file):
+    """토큰 파일 변경을 반영하고 만료가 가까우면 갱신합니다."""
+    with _lock:
+        entry = _entries.get(token_file)
+        if entry is None:
+            return
+        mtime = _mtime(token_file)
+        if mtime != entry.mtime:
+            # 다른 프로세스가 로그인/로그아웃/갱신함
+            entry.creds = _read(token_file, entry.scopes)
+            entry.mtime = mtime
+            entry.retry_at = 0
+        creds = entry.creds
+        retry_at = entry.retry_at
+
+    if creds is not None and _needs_refresh(creds) and time.monotonic() >= retry_at:
+        refresh(token_file)
+
+
+def _watch():
+    while True:
+        _wake.wait(CHECK_INTERVAL)
+        _wake.clear()
+        with _lock:
+            token_files = list(_entries)
+        for token_file in token_files:
+            try:
+                _check(token_file)
+            except Exception as e:
+                print(f"자격 증명 확인 오류 ({token_file}): {e}")
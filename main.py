@@ -3,25 +3,80 @@ YouTube 구독 채널 필터 검색 프로그램
 - Eel 기반 데스크톱 앱
 """
 
+import time
+
+# 시작 시각 (첫 화면/첫 검색까지 걸린 시간 측정용)
+_STARTED_AT = time.perf_counter()
+
 import eel
 import os
 from auth import (
     get_authenticated_service, get_api_service,
     is_configured, is_authenticated, logout
 )
-from youtube_api import get_subscriptions, get_channels_batch, get_videos_batch
-from rss_fetcher import fetch_all_channels
+from subscription_index import SubscriptionIndex
+import accounts
 import cache_manager
+import metrics
+import saved_searches
+import search_pipeline
+import thumbnail_cache
 import config
 
 # 전역 변수
 youtube_service = None
 subscriptions = []
+subs_index = SubscriptionIndex()
+
+# 마지막 검색 결과 (페이지 단위로 프론트엔드에 전달)
+last_results = []
+_sorted_results = {}
+RESULT_PAGE_MAX = 500
+
+# 시작 성능 기록 (초)
+startup_timings = {}
 
 # Eel 초기화
 eel.init('web')
 
 
+@eel.btl.route(thumbnail_cache.LOCAL_URL_PREFIX + '<name>')
+def serve_thumbnail(name):
+    """로컬 썸네일 캐시에서 이미지를 제공합니다 (없으면 원본으로 리디렉트하고 백그라운드에서 저장)."""
+    key = name.rsplit('.', 1)[0]
+    path = thumbnail_cache.get_thumbnail_path(key)
+    if not path:
+        # Eel 서버 스레드에서는 다운로드를 기다리지 않음
+        url = thumbnail_cache.source_url(key)
+        if not url:
+            return eel.btl.HTTPError(404, '썸네일 없음')
+        response = eel.btl.HTTPResponse(status=302)
+        response.set_header('Location', url)
+        response.set_header('Cache-Control', 'no-store')
+        return response
+
+    response = eel.btl.static_file(
+        os.path.basename(path),
+        root=os.path.abspath(os.path.dirname(path)),
+        mimetype='image/jpeg'
+    )
+    response.set_header(
+        'Cache-Control', f'public, max-age={thumbnail_cache.CACHE_MAX_AGE}, immutable'
+    )
+    return response
+
+
+def _with_local_thumbnails(items):
+    """레코드를 dict로 바꾸고 썸네일 URL을 로컬 캐시 URL로 바꿉니다 (미리 받기 시작)."""
+    thumbnail_cache.prefetch(item.thumbnail for item in items)
+    result = []
+    for item in items:
+        data = item.to_dict()
+        data['thumbnail'] = thumbnail_cache.local_url(item.thumbnail)
+        result.append(data)
+    return result
+
+
 @eel.expose
 def save_api_config(client_id, client_secret, api_key=''):
     """API 설정을 config.py에 저장합니다."""
@@ -61,6 +116,7 @@ def get_config_status():
     """설정 상태를 반환합니다."""
     global youtube_service
 
+    _record_startup('firstWindow')
     authenticated = is_authenticated()
 
     # 인증된 상태라면 자동으로 서비스 연결
@@ -96,80 +152,73 @@ def do_login():
 
 @eel.expose
 def do_logout():
-    """로그아웃하고 캐시를 삭제합니다."""
-    global youtube_service, subscriptions
+    """
+    현재 계정에서 로그아웃하고 구독 목록 캐시를 삭제합니다.
+    (채널/피드/영상 캐시는 다른 계정과 공유하므로 유지)
+    """
+    global youtube_service
 
     logout()
-    cache_manager.clear_all_cache()
+    cache_manager.clear_subscriptions_cache()
     youtube_service = None
-    subscriptions = []
+    _set_subscriptions([])
+    _set_results([])
 
     return {'success': True}
 
 
 @eel.expose
-def load_subscriptions(force_refresh=False):
+def get_accounts():
+    """계정 목록과 현재 계정을 반환합니다."""
+    return {
+        'accounts': accounts.list_accounts(),
+        'current': accounts.current
+    }
+
+
+@eel.expose
+def switch_account(name):
+    """현재 계정을 바꿉니다 (없으면 새로 만듦)."""
+    global youtube_service
+
+    if not accounts.switch(name):
+        return {'success': False, 'error': '계정 이름은 영문, 숫자, _, - 로 32자 이하여야 합니다.'}
+
+    youtube_service = None
+    _set_subscriptions([])
+    _set_results([])
+
+    return {'success': True}
+
+
+def _get_youtube_service():
     """
-    구독 채널 목록을 불러옵니다.
+    OAuth 인증된 서비스를 반환합니다 (없으면 인증 진행).
+    auth가 자격 증명별로 서비스를 재사용하므로 매번 물어봐도 비용이 적고,
+    다른 프로세스에서 다시 로그인해 자격 증명이 바뀌면 새 서비스를 받습니다.
     """
-    global youtube_service, subscriptions
-
-    # 캐시 확인
-    if not force_refresh:
-        cached = cache_manager.load_subscriptions()
-        if cached:
-            # 캐시에 구독자 수가 없으면 API로 조회
-            needs_subscriber_count = any(
-                'subscriberCount' not in sub or sub.get('subscriberCount') == 0
-                for sub in cached
-            )
-
-            if needs_subscriber_count:
-                try:
-                    if not youtube_service:
-                        youtube_service = get_authenticated_service()
-
-                    if youtube_service:
-                        from youtube_api import get_channels_batch
-                        channel_ids = [sub['id'] for sub in cached]
-                        channel_stats = get_channels_batch(youtube_service, channel_ids)
-
-                        for sub in cached:
-                            stats = channel_stats.get(sub['id'], {})
-                            sub['subscriberCount'] = stats.get('subscriberCount', 0)
-
-                        cache_manager.save_subscriptions(cached)
-                except Exception as e:
-                    print(f"구독자 수 조회 실패: {e}")
-
-            subscriptions = cached
-            return {
-                'success': True,
-                'subscriptions': cached,
-                'fromCache': True
-            }
-
-    # API 호출
-    try:
-        if not youtube_service:
-            youtube_service = get_authenticated_service()
-
-        if not youtube_service:
-            return {'success': False, 'error': '로그인이 필요합니다.'}
+    global youtube_service
 
-        print("구독 채널 목록을 가져오는 중...")
-        subs = get_subscriptions(youtube_service)
+    youtube_service = get_authenticated_service()
+    return youtube_service
 
-        if not subs:
-            return {'success': False, 'error': '구독 채널이 없습니다.'}
 
-        cache_manager.save_subscriptions(subs)
-        subscriptions = subs
+@eel.expose
+def load_subscriptions(force_refresh=False):
+    """
+    구독 채널 목록을 불러옵니다.
+    목록 자체는 get_subscriptions_page로 페이지 단위 조회합니다.
+    """
+    try:
+        subs, from_cache = search_pipeline.load_subscriptions(
+            _get_youtube_service, force_refresh
+        )
+        _set_subscriptions(subs)
 
         return {
             'success': True,
-            'subscriptions': subs,
-            'fromCache': False
+            'count': len(subs),
+            'fromCache': from_cache
         }
 
     except Exception as e:
@@ -180,137 +229,180 @@ def load_subscriptions(force_refresh=False):
 def search_videos(filter_config):
     """
     조건에 맞는 영상을 검색합니다.
+    filter_config['channels']가 있으면 그 채널들을,
+    filter_config['accounts']가 있으면 해당 계정들의 구독 채널을 합쳐서 검색합니다.
+    결과 목록은 get_results_page로 페이지 단위 조회합니다.
     """
-    global youtube_service, subscriptions
-
-    if not subscriptions:
+    account_names = filter_config.get('accounts')
+    if filter_config.get('channels'):
+        channel_ids = list(filter_config['channels'])
+    elif account_names:
+        channel_ids = accounts.collect_channel_ids(account_names)
+    else:
+        channel_ids = [sub.id for sub in subscriptions]
+
+    if not channel_ids:
         return {'success': False, 'error': '먼저 구독 채널을 불러오세요.'}
 
     try:
         # API 서비스 선택
         api_service = get_api_service()
         if not api_service:
-            if not youtube_service:
-                youtube_service = get_authenticated_service()
-            api_service = youtube_service
+            api_service = _get_youtube_service()
 
         if not api_service:
             return {'success': False, 'error': 'API 키 또는 로그인이 필요합니다.'}
 
-        filter_type = filter_config.get('filterType', 'normal')
-        max_subscribers = filter_config.get('maxSubscribers', 10000)
-        min_views = filter_config.get('minViews', 10000)
-        days_within = filter_config.get('daysWithin', 15)
-        mutation_ratio = filter_config.get('mutationRatio', 1.0)
-
-        channel_ids = [sub['id'] for sub in subscriptions]
-        print(f"총 {len(channel_ids)}개 채널 검색 시작...")
-
-        # 1단계: 채널 구독자 수 조회
-        print("1단계: 채널 정보 조회 중...")
-        eel.update_progress("채널 정보 조회 중...", 10)()
-        channel_info = get_channels_batch(api_service, channel_ids)
-
-        # 2단계: RSS로 최신 영상 수집
-        print("2단계: RSS 피드 수집 중...")
-        eel.update_progress("RSS 피드 수집 중...", 30)()
-
-        def rss_progress(current, total):
-            percent = 30 + int((current / total) * 40)
-            eel.update_progress(f"RSS 수집: {current}/{total}", percent)()
-
-        all_videos = fetch_all_channels(channel_ids, days_within, rss_progress)
-        print(f"총 {len(all_videos)}개 영상 수집됨")
-
-        if not all_videos:
-            return {
-                'success': True,
-                'videos': [],
-                'stats': {'total': 0, 'filtered': 0}
-            }
-
-        # 3단계: 영상 상세 정보 조회
-        print("3단계: 영상 정보 조회 중...")
-        eel.update_progress("영상 정보 조회 중...", 75)()
-        video_ids = [v['videoId'] for v in all_videos]
-        video_info = get_videos_batch(api_service, video_ids)
-
-        # 4단계: 필터링
-        print("4단계: 필터 적용 중...")
-        eel.update_progress("필터 적용 중...", 90)()
-
-        filtered_videos = []
-        min_duration = 181  # 쇼츠 제외
-
-        for video in all_videos:
-            video_id = video['videoId']
-            channel_id = video['channelId']
-
-            v_info = video_info.get(video_id)
-            if not v_info:
-                continue
-
-            if v_info['duration'] < min_duration:
-                continue
-
-            view_count = v_info['viewCount']
-
-            c_info = channel_info.get(channel_id)
-            if not c_info:
-                continue
-
-            subscriber_count = c_info['subscriberCount']
-
-            # 필터 적용
-            if filter_type == 'normal':
-                if subscriber_count > max_subscribers:
-                    continue
-                if view_count < min_views:
-                    continue
-            else:
-                if subscriber_count == 0:
-                    continue
-                ratio = view_count / subscriber_count
-                if ratio < mutation_ratio:
-                    continue
-
-            filtered_videos.append({
-                'videoId': video_id,
-                'title': video['title'],
-                'channelId': channel_id,
-                'channelTitle': c_info['title'],
-                'thumbnail': video['thumbnail'],
-                'publishedAt': video['publishedAt'],
-                'viewCount': view_count,
-                'likeCount': v_info['likeCount'],
-                'subscriberCount': subscriber_count,
-                'duration': v_info['duration'],
-                'ratio': round(view_count / subscriber_count, 2) if subscriber_count > 0 else 0
-            })
-
-        filtered_videos.sort(key=lambda x: x['viewCount'], reverse=True)
-
-        eel.update_progress("완료!", 100)()
-        print(f"필터링 결과: {len(filtered_videos)}개")
+        def progress(text, percent):
+            eel.update_progress(text, percent)()
 
-        return {
-            'success': True,
-            'videos': filtered_videos,
-            'stats': {
-                'total': len(all_videos),
-                'filtered': len(filtered_videos)
-            }
-        }
+        total, filtered_videos = search_pipeline.run_search(
+            api_service, channel_ids, filter_config, progress
+        )
+        _record_startup('firstSearch')
+        return _search_response(filter_config, total, filtered_videos)
 
     except Exception as e:
         print(f"검색 오류: {e}")
         return {'success': False, 'error': str(e)}
 
 
+def _search_response(filter_config, total, results):
+    """검색 결과를 보관하고 프론트엔드 응답을 만듭니다."""
+    _set_results(results)
+    return {
+        'success': True,
+        'total': len(results),
+        'sortKey': search_pipeline.default_sort_key(filter_config),
+        'stats': {
+            'total': total,
+            'filtered': len(results)
+        }
+    }
+
+
+@eel.expose
+def get_saved_searches():
+    """저장된 검색 이름 목록을 반환합니다."""
+    return {'searches': sorted(saved_searches.list_searches())}
+
+
+@eel.expose
+def save_search(name, filter_config):
+    """
+    현재 필터 설정을 이름을 붙여 저장합니다 (refresher 데몬이 결과를 갱신).
+    검색 대상 계정이 없으면 현재 계정으로 저장합니다.
+    """
+    if not filter_config.get('accounts') and not filter_config.get('channels'):
+        filter_config = dict(filter_config, accounts=[accounts.current])
+
+    if not saved_searches.save_search(name, filter_config):
+        return {'success': False, 'error': '검색 이름은 영문, 숫자, _, - 로 32자 이하여야 합니다.'}
+    return {'success': True}
+
+
+@eel.expose
+def delete_saved_search(name):
+    """저장된 검색을 삭제합니다."""
+    return {'success': saved_searches.delete_search(name)}
+
+
+@eel.expose
+def open_saved_search(name):
+    """
+    저장된 검색의 결과를 엽니다.
+    refresher가 갱신한 뷰가 있으면 바로 반환하고, 없으면 지금 검색해서 뷰로 저장합니다.
+    """
+    filter_config = saved_searches.get_search(name)
+    if filter_config is None:
+        return {'success': False, 'error': '저장된 검색이 없습니다.'}
+
+    view = saved_searches.load_view(name)
+    if view and view.get('filterConfig') == filter_config:
+        response = _search_response(filter_config, view.get('videos', 0), view['results'])
+        response['updatedAt'] = view.get('updatedAt')
+        return response
+
+    response = search_videos(filter_config)
+    if response['success']:
+        sort_key = response['sortKey']
+        saved_searches.save_view(
+            name, filter_config, _get_sorted_results(sort_key), response['stats']['total']
+        )
+    return response
+
+
+def _record_startup(name):
+    """프로그램 시작부터 처음 도달한 시점까지의 시간을 기록합니다."""
+    if name not in startup_timings:
+        startup_timings[name] = round(time.perf_counter() - _STARTED_AT, 3)
+        print(f"시작 후 {name}: {startup_timings[name]}초")
+
+
+def _set_subscriptions(subs):
+    """구독 목록을 교체하고 검색 인덱스를 다시 만듭니다."""
+    global subscriptions
+    subscriptions = subs
+    subs_index.rebuild(subs)
+
+
+def _set_results(videos):
+    """검색 결과를 보관하고 정렬 캐시를 초기화합니다."""
+    global last_results, _sorted_results
+    last_results = videos
+    _sorted_results = {}
+
+
+def _get_sorted_results(sort_key):
+    """정렬 기준별로 정렬된 결과를 반환합니다 (한 번 정렬 후 재사용)."""
+    if sort_key not in search_pipeline.RESULT_SORT_KEYS:
+        sort_key = 'viewCount'
+
+    if sort_key not in _sorted_results:
+        _sorted_results[sort_key] = search_pipeline.sort_results(last_results, sort_key)
+    return _sorted_results[sort_key]
+
+
+@eel.expose
+def get_results_page(offset=0, limit=100, sort_key='viewCount'):
+    """
+    마지막 검색 결과의 일부를 반환합니다.
+
+    Args:
+        offset: 시작 위치
+        limit: 최대 개수 (RESULT_PAGE_MAX 이하)
+        sort_key: 정렬 기준 (search_pipeline.RESULT_SORT_KEYS 중 하나)
+    """
+    offset = max(0, int(offset))
+    limit = max(0, min(int(limit), RESULT_PAGE_MAX))
+
+    sorted_results = _get_sorted_results(sort_key)
+
+    return {
+        'success': True,
+        'videos': _with_local_thumbnails(sorted_results[offset:offset + limit]),
+        'offset': offset,
+        'total': len(sorted_results)
+    }
+
+
+@eel.expose
+def get_startup_timings():
+    """시작 성능 기록을 반환합니다 (firstWindow, firstSearch)."""
+    return startup_timings
+
+
+@eel.expose
+def get_metrics():
+    """성능 측정값을 반환합니다 (마지막 검색, 누적, 연결 재사용)."""
+    return metrics.get_metrics()
+
+
 @eel.expose
 def clear_cache():
     """모든 캐시를 삭제합니다."""
     cache_manager.clear_all_cache()
+    thumbnail_cache.clear()
     return {'success': True}
 
 
@@ -318,23 +410,44 @@ def clear_cache():
 def get_subscriptions_list():
     """구독 채널 목록을 반환합니다 (팝업용)."""
     global subscriptions
-    return subscriptions
+    return [sub.to_dict() for sub in subscriptions]
+
+
+@eel.expose
+def get_subscriptions_page(offset=0, limit=100, query=''):
+    """
+    구독 채널 목록의 일부를 구독자 수 순으로 반환합니다 (팝업용).
+
+    Args:
+        offset: 시작 위치
+        limit: 최대 개수 (RESULT_PAGE_MAX 이하)
+        query: 채널명 검색어 (접두사 일치 우선, 부분 문자열 포함)
+    """
+    offset = max(0, int(offset))
+    limit = max(0, min(int(limit), RESULT_PAGE_MAX))
+
+    items, total = subs_index.page(offset, limit, query or '')
+
+    return {
+        'success': True,
+        'subscriptions': _with_local_thumbnails(items),
+        'offset': offset,
+        'total': total,
+        'count': len(subs_index)
+    }
 
 
 @eel.expose
 def unsubscribe_channel(channel_id):
     """채널 구독을 취소합니다."""
-    global youtube_service, subscriptions
-
     try:
-        if not youtube_service:
-            youtube_service = get_authenticated_service()
+        youtube = _get_youtube_service()
 
-        if not youtube_service:
+        if not youtube:
             return {'success': False, 'error': '로그인이 필요합니다.'}
 
         # 구독 ID 찾기 (subscriptions.list로 조회)
-        request = youtube_service.subscriptions().list(
+        request = youtube.subscriptions().list(
             part='id',
             forChannelId=channel_id,
             mine=True
@@ -347,10 +460,10 @@ def unsubscribe_channel(channel_id):
         subscription_id = response['items'][0]['id']
 
         # 구독 취소
-        youtube_service.subscriptions().delete(id=subscription_id).execute()
+        youtube.subscriptions().delete(id=subscription_id).execute()
 
         # 로컬 목록에서도 제거
-        subscriptions = [s for s in subscriptions if s['id'] != channel_id]
+        _set_subscriptions([s for s in subscriptions if s.id != channel_id])
 
         # 캐시 업데이트
         cache_manager.save_subscriptions(subscriptions)
@@ -0,0 +1,142 @@
+"""
+성능 계측 모듈
+- 단계별 소요 시간 (채널, RSS, 영상, 필터)
+- 호스트별 HTTP 요청 수/바이트
+- 캐시 데이터셋별 적중/실패
+- 배치 조회 등에서 버려진 오류 수
+- 중복 요청 합치기로 절약된 요청 수 (counters의 singleflight.*)
+- 검색마다 JSONL 파일에 기록 (선택)
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import urlsplit
+
+# 검색마다 측정값을 덧붙일 JSONL 파일 (비어 있으면 기록하지 않음)
+TRACE_FILE = os.environ.get('AUTOBLOGER_METRICS_FILE', '')
+
+_lock = threading.Lock()
+
+
+def _empty():
+    return {
+        'stages': {},     # 단계 -> 초
+        'http': {},       # 호스트 -> {'requests', 'bytes'}
+        'cache': {},      # 데이터셋 -> {'hit', 'miss'}
+        'errors': {},     # 이름 -> 개수
+        'counters': {}    # 기타 카운터
+    }
+
+
+_run = _empty()      # 현재(마지막) 검색
+_totals = _empty()   # 프로그램 시작 이후 누적
+_last_run = None     # 마지막으로 끝난 검색 기록
+
+
+def _add(section, key, field, amount):
+    for target in (_run, _totals):
+        entry = target[section].setdefault(key, {})
+        entry[field] = entry.get(field, 0) + amount
+
+
+def _incr(section, key, amount):
+    for target in (_run, _totals):
+        target[section][key] = target[section].get(key, 0) + amount
+
+
+def start_run():
+    """새 검색 측정을 시작합니다."""
+    global _run
+    with _lock:
+        _run = _empty()
+
+
+@contextmanager
+def stage(name):
+    """with 블록의 소요 시간을 단계 이름으로 기록합니다."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        with _lock:
+            _incr('stages', name, round(elapsed, 4))
+
+
+def record_http(url, nbytes):
+    """HTTP 요청 하나를 호스트별로 기록합니다."""
+    host = urlsplit(url).netloc or 'unknown'
+    with _lock:
+        _add('http', host, 'requests', 1)
+        _add('http', host, 'bytes', nbytes)
+
+
+def record_cache(dataset, hit, count=1):
+    """캐시 조회 결과를 데이터셋별로 기록합니다."""
+    if not count:
+        return
+    with _lock:
+        _add('cache', dataset, 'hit' if hit else 'miss', count)
+
+
+def record_error(name):
+    """처리하지 않고 넘어간 오류를 기록합니다."""
+    with _lock:
+        _incr('errors', name, 1)
+
+
+def incr(name, amount=1):
+    """기타 카운터를 증가시킵니다."""
+    with _lock:
+        _incr('counters', name, amount)
+
+
+def finish_run(summary=None):
+    """
+    검색 측정을 끝내고 기록을 반환합니다.
+    TRACE_FILE이 지정되어 있으면 한 줄(JSON)로 덧붙입니다.
+
+    Args:
+        summary: 함께 남길 정보 (채널 수, 결과 수 등)
+
+    Returns:
+        dict: 검색 기록
+    """
+    global _last_run
+    import transport
+
+    with _lock:
+        record = {
+            'finishedAt': datetime.now().isoformat(),
+            **(summary or {}),
+            **json.loads(json.dumps(_run)),
+            'transport': transport.get_stats()
+        }
+        _last_run = record
+
+    if TRACE_FILE:
+        try:
+            with open(TRACE_FILE, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except OSError as e:
+            print(f"측정값 기록 실패: {e}")
+
+    return record
+
+
+def get_metrics():
+    """마지막 검색 기록과 누적 측정값을 반환합니다."""
+    import singleflight
+    import transport
+
+    with _lock:
+        return {
+            'lastRun': _last_run,
+            'totals': json.loads(json.dumps(_totals)),
+            'transport': transport.get_stats(),
+            'singleflight': singleflight.get_stats()
+        }
@@ -0,0 +1,181 @@
+"""
+프로파일링 모듈 (선택 기능)
+- AUTOBLOGER_PROFILE=1 환경 변수 또는 CLI --profile로 활성화
+- 검색 단계별 cProfile + tracemalloc 스냅샷
+- RSS 작업 스레드 함수 프로파일
+- 실행마다 profiles/ 디렉토리에 보고서 작성
+- 비활성 상태에서는 빈 컨텍스트만 반환 (추가 비용 거의 없음)
+"""
+
+import os
+import io
+import time
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+ENABLED = os.environ.get('AUTOBLOGER_PROFILE', '') not in ('', '0')
+PROFILE_DIR = 'profiles'
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 15
+
+_NULL_CONTEXT = nullcontext()
+_lock = threading.Lock()
+_run = None  # 현재 프로파일 실행 (비활성/실행 전이면 None)
+
+
+def start_run(label='search'):
+    """프로파일 실행을 시작합니다 (비활성이면 아무것도 하지 않음)."""
+    global _run
+
+    if not ENABLED:
+        return
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    _run = {
+        'label': label,
+        'startedTracing': started_tracing,
+        'startedAt': datetime.now(),
+        'stages': [],
+        'workers': {}   # 이름 -> pstats.Stats (작업 스레드 누적)
+    }
+
+
+def stage(name):
+    """단계를 프로파일하는 컨텍스트를 반환합니다 (비활성이면 빈 컨텍스트)."""
+    if _run is None:
+        return _NULL_CONTEXT
+    return _profile_stage(name)
+
+
+def _enable(profile):
+    """
+    프로파일러를 켭니다.
+    Python 3.12부터는 프로파일러가 프로세스 전체에 하나만 켜질 수 있으므로
+    이미 다른 프로파일러가 켜져 있으면 False를 반환합니다 (그 프로파일러가 측정).
+    """
+    try:
+        profile.enable()
+        return True
+    except ValueError:
+        return False
+
+
+@contextmanager
+def _profile_stage(name):
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+
+    profile = cProfile.Profile()
+    enabled = _enable(profile)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if enabled:
+            profile.disable()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+
+        _run['stages'].append({
+            'name': name,
+            'seconds': elapsed,
+            'peak': peak,
+            'profile': profile if enabled else None,
+            'allocations': after.compare_to(before, 'lineno')[:TOP_ALLOCATIONS]
+        })
+
+
+def wrap_worker(name, func):
+    """
+    작업 스레드에서 실행되는 함수를 프로파일하도록 감쌉니다.
+
+    Args:
+        name: 보고서에 표시할 작업 이름
+        func: 감쌀 함수
+
+    Returns:
+        함수 (비활성이면 func 그대로)
+    """
+    if _run is None:
+        return func
+
+    run = _run
+
+    def wrapper(*args, **kwargs):
+        profile = cProfile.Profile()
+        if not _enable(profile):
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            with _lock:
+                stats = run['workers'].get(name)
+                if stats is None:
+                    run['workers'][name] = pstats.Stats(profile)
+                else:
+                    stats.add(profile)
+
+    return wrapper
+
+
+def _format_stats(stats):
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+    return stream.getvalue()
+
+
+def finish_run():
+    """
+    프로파일 실행을 끝내고 보고서를 작성합니다.
+
+    Returns:
+        str: 보고서 파일 경로 (비활성이면 None)
+    """
+    global _run
+
+    if _run is None:
+        return None
+
+    run, _run = _run, None
+    if run['startedTracing']:
+        tracemalloc.stop()
+
+    if not os.path.exists(PROFILE_DIR):
+        os.makedirs(PROFILE_DIR)
+
+    stamp = run['startedAt'].strftime('%Y%m%d_%H%M%S')
+    path = os.path.join(PROFILE_DIR, f"{stamp}_{run['label']}.txt")
+
+    lines = [f"프로파일: {run['label']} ({run['startedAt'].isoformat()})", '']
+
+    for stage_info in run['stages']:
+        lines.append(f"=== 단계 {stage_info['name']}: {stage_info['seconds']:.3f}초, "
+                     f"최대 메모리 {stage_info['peak'] / 1024 / 1024:.1f}MB ===")
+        lines.append('')
+        lines.append('-- 메모리 증가 (할당 위치별) --')
+        for diff in stage_info['allocations']:
+            lines.append(str(diff))
+        lines.append('')
+        if stage_info['profile'] is not None:
+            lines.append('-- 함수별 시간 --')
+            lines.append(_format_stats(pstats.Stats(stage_info['profile'])))
+
+    for name, stats in run['workers'].items():
+        lines.append(f"=== 작업 스레드 {name} (누적) ===")
+        lines.append(_format_stats(stats))
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+
+    print(f"프로파일 보고서 저장: {path}")
+    return path
@@ -0,0 +1,142 @@
+"""
+레코드 타입 모듈
+- 영상/채널/구독 정보를 __slots__ 객체로 보관 (항목마다 dict를 만들지 않음)
+- 채널 ID와 채널명은 sys.intern으로 같은 문자열을 공유
+- 필드 이름은 프론트엔드/캐시 파일의 키와 같음
+- Eel/CLI 출력 시에만 to_dict()로 변환, 캐시 파일에는 to_row() 리스트로 저장
+"""
+
+import os
+import sys
+
+_intern = sys.intern
+
+# 로컬 대체 서버로 테스트할 때 AUTOBLOGER_THUMBNAIL_URL로 바꿈 ({}에 영상 ID)
+THUMBNAIL_URL_TEMPLATE = os.environ.get(
+    'AUTOBLOGER_THUMBNAIL_URL', "https://i.ytimg.com/vi/{}/mqdefault.jpg"
+)
+
+
+class Record:
+    """__slots__ 레코드 공통 기능 (dict/리스트 변환)."""
+
+    __slots__ = ()
+
+    # to_dict에 포함할 필드 (기본: __slots__, 계산 속성 추가 가능)
+    DICT_FIELDS = None
+
+    def to_dict(self):
+        """dict로 변환합니다 (Eel/CLI 출력용)."""
+        fields = self.DICT_FIELDS or self.__slots__
+        return {name: getattr(self, name) for name in fields}
+
+    def to_row(self):
+        """필드 값 리스트로 변환합니다 (캐시 파일용)."""
+        return [getattr(self, name) for name in self.__slots__]
+
+    @classmethod
+    def from_dict(cls, data):
+        """dict에서 레코드를 만듭니다 (알 수 없는 키는 무시)."""
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+    @classmethod
+    def from_row(cls, row):
+        """to_row 결과에서 레코드를 만듭니다."""
+        return cls(*row)
+
+    @classmethod
+    def load(cls, value):
+        """캐시 파일 값(리스트 또는 dict)에서 레코드를 만듭니다."""
+        if isinstance(value, dict):
+            return cls.from_dict(value)
+        return cls.from_row(value)
+
+    def __repr__(self):
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+
+class VideoEntry(Record):
+    """RSS 피드에서 얻은 영상 정보."""
+
+    __slots__ = ('videoId', 'title', 'channelId', 'channelTitle', 'publishedAt')
+    DICT_FIELDS = __slots__ + ('thumbnail',)
+
+    def __init__(self, videoId, title='', channelId='', channelTitle='', publishedAt=''):
+        self.videoId = videoId
+        self.title = title
+        self.channelId = _intern(channelId)
+        self.channelTitle = _intern(channelTitle)
+        self.publishedAt = publishedAt
+
+    @property
+    def thumbnail(self):
+        # 영상 ID로 만들 수 있으므로 따로 저장하지 않음
+        return THUMBNAIL_URL_TEMPLATE.format(self.videoId)
+
+
+class VideoStats(Record):
+    """영상 통계 (videos.list)."""
+
+    __slots__ = ('viewCount', 'likeCount', 'commentCount', 'duration')
+
+    def __init__(self, viewCount=0, likeCount=0, commentCount=0, duration=0):
+        self.viewCount = viewCount
+        self.likeCount = likeCount
+        self.commentCount = commentCount
+        self.duration = duration
+
+
+class ChannelInfo(Record):
+    """채널 정보 (channels.list)."""
+
+    __slots__ = ('subscriberCount', 'title', 'thumbnail')
+
+    def __init__(self, subscriberCount=0, title='', thumbnail=''):
+        self.subscriberCount = subscriberCount
+        self.title = _intern(title)
+        self.thumbnail = thumbnail
+
+
+class Subscription(Record):
+    """구독 채널."""
+
+    __slots__ = ('id', 'title', 'thumbnail', 'description', 'subscriberCount')
+
+    def __init__(self, id, title='', thumbnail='', description='', subscriberCount=0):
+        self.id = _intern(id)
+        self.title = _intern(title)
+        self.thumbnail = thumbnail
+        self.description = description
+        self.subscriberCount = subscriberCount
+
+
+class VideoResult(Record):
+    """필터를 통과한 검색 결과 항목."""
+
+    __slots__ = (
+        'videoId', 'title', 'channelId', 'channelTitle', 'publishedAt',
+        'viewCount', 'likeCount', 'subscriberCount', 'duration', 'ratio', 'velocity'
+    )
+    DICT_FIELDS = (
+        'videoId', 'title', 'channelId', 'channelTitle', 'thumbnail', 'publishedAt',
+        'viewCount', 'likeCount', 'subscriberCount', 'duration', 'ratio', 'velocity'
+    )
+
+    def __init__(self, videoId, title, channelId, channelTitle, publishedAt,
+                 viewCount, likeCount, subscriberCount, duration, ratio, velocity):
+        self.videoId = videoId
+        self.title = title
+        self.channelId = channelId
+        self.channelTitle = channelTitle
+        self.publishedAt = publishedAt
+        self.viewCount = viewCount
+        self.likeCount = likeCount
+        self.subscriberCount = subscriberCount
+        self.duration = duration
+        self.ratio = ratio
+        self.velocity = velocity
+
+    @property
+    def thumbnail(self):
+        return THUMBNAIL_URL_TEMPLATE.format(self.videoId)
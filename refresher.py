@@ -0,0 +1,280 @@
+"""
+백그라운드 갱신 데몬
+- 저장된 검색(saved_searches)마다 결과를 구체화된 뷰로 유지
+- 주기마다 캐시가 만료된 채널 정보/피드/영상 통계만 다시 받음 (공유 캐시도 함께 갱신)
+- 새 영상, 통계를 새로 받은 영상, 정보를 새로 받은 채널의 영상만 다시 필터 (증분 갱신)
+- 기간이 지난 영상은 뷰에서 제거
+- Eel 없이 실행 (헤드리스). 로컬 대체 서버(standin_server)로 테스트 가능
+
+앱과 CLI(--saved)는 뷰 파일을 읽기만 하므로 저장된 검색은 바로 결과가 나옵니다.
+
+사용 예:
+    python refresher.py --interval 900
+    python refresher.py --once --api-key standin
+"""
+
+import sys
+import time
+import argparse
+import threading
+from datetime import datetime, timedelta
+
+import config
+import accounts
+import cache_manager
+import metrics
+import saved_searches
+import search_pipeline
+from auth import get_authenticated_service, get_api_service
+
+DEFAULT_INTERVAL = 15 * 60  # 갱신 주기 (초), 피드 캐시 유효 시간(30분)보다 짧게
+
+
+class MaterializedView:
+    """저장된 검색 하나의 결과 (영상ID -> VideoResult)."""
+
+    def __init__(self, name, filter_config, results=()):
+        self.name = name
+        self.filter_config = filter_config
+        self.days = filter_config.get('daysWithin', 15)
+        self.match = search_pipeline.make_filter(filter_config)
+        self.channel_ids = set()
+        self.results = {result.videoId: result for result in results}
+        self.videos = 0
+        self.needs_full = True   # 다음 갱신에서 모든 영상 검사
+        self.dirty = False
+
+    def set_channels(self, channel_ids):
+        """검색 대상 채널을 바꿉니다 (바뀌면 다음 갱신에서 전체 검사)."""
+        channel_ids = set(channel_ids)
+        if channel_ids != self.channel_ids:
+            self.channel_ids = channel_ids
+            self.needs_full = True
+
+    def cutoff(self, now):
+        return (now - timedelta(days=self.days)).isoformat()
+
+    def expire(self, cutoff):
+        """기간이 지났거나 대상 채널이 아닌 결과를 제거합니다."""
+        stale = [
+            video_id for video_id, result in self.results.items()
+            if result.publishedAt < cutoff or result.channelId not in self.channel_ids
+        ]
+        for video_id in stale:
+            del self.results[video_id]
+        if stale:
+            self.dirty = True
+
+    def update(self, videos, video_info, channel_info, cutoff):
+        """
+        영상들을 다시 검사해 결과를 추가/변경/제거합니다.
+
+        Args:
+            videos: 다시 검사할 VideoEntry (대상 채널이 아닌 영상은 무시)
+            video_info: {영상ID: VideoStats}
+            channel_info: {채널ID: ChannelInfo}
+            cutoff: 기간 시작 (ISO 문자열)
+        """
+        for video in videos:
+            if video.channelId not in self.channel_ids or video.publishedAt < cutoff:
+                continue
+
+            video_id = video.videoId
+            result = self.match(video, video_info.get(video_id), channel_info.get(video.channelId))
+            old = self.results.get(video_id)
+
+            if result is None:
+                if old is not None:
+                    del self.results[video_id]
+                    self.dirty = True
+            elif old is None or old.to_row() != result.to_row():
+                self.results[video_id] = result
+                self.dirty = True
+
+    def save(self):
+        """뷰를 기본 정렬 순서로 저장합니다."""
+        sort_key = search_pipeline.default_sort_key(self.filter_config)
+        results = search_pipeline.sort_results(list(self.results.values()), sort_key)
+        saved_searches.save_view(self.name, self.filter_config, results, self.videos)
+        self.dirty = False
+
+
+class Refresher:
+    """저장된 검색의 뷰를 주기적으로 갱신합니다."""
+
+    def __init__(self, get_service):
+        """
+        Args:
+            get_service: YouTube API 서비스를 반환하는 함수 (없으면 None)
+        """
+        self.get_service = get_service
+        self.views = {}        # 검색 이름 -> MaterializedView
+        self._candidates = {}  # 지난 갱신에서 본 영상 (영상ID -> VideoEntry)
+
+    def _sync_views(self):
+        """저장된 검색 목록에 맞춰 뷰를 만들거나 버립니다."""
+        searches = saved_searches.list_searches()
+
+        for name in list(self.views):
+            if name not in searches:
+                del self.views[name]
+
+        for name, filter_config in searches.items():
+            view = self.views.get(name)
+            if view is None or view.filter_config != filter_config:
+                # 설정이 같은 뷰 파일이 있으면 이어서 갱신
+                saved = saved_searches.load_view(name)
+                results = saved['results'] if saved and saved.get('filterConfig') == filter_config else ()
+                view = self.views[name] = MaterializedView(name, filter_config, results)
+            view.set_channels(saved_searches.channel_ids_for(filter_config))
+
+    def run_cycle(self):
+        """
+        한 번 갱신합니다.
+
+        Returns:
+            dict: 갱신 요약 (뷰가 없거나 API를 쓸 수 없으면 None)
+        """
+        self._sync_views()
+        if not self.views:
+            print("저장된 검색이 없습니다.")
+            return None
+
+        youtube = self.get_service()
+        if not youtube:
+            print("오류: API 키 또는 로그인이 필요합니다.")
+            return None
+
+        metrics.start_run()
+        try:
+            return self._update(youtube)
+        except Exception as e:
+            # 실패한 갱신도 측정 기록(TRACE_FILE)에 남김
+            metrics.finish_run({'views': len(self.views), 'error': f"{type(e).__name__}: {e}"})
+            raise
+
+    def _update(self, youtube):
+        """run_cycle의 본문: 캐시/피드/통계를 갱신하고 뷰를 다시 검사합니다."""
+        channel_ids = list(dict.fromkeys(
+            cid for view in self.views.values() for cid in view.channel_ids
+        ))
+        days = max(view.days for view in self.views.values())
+
+        with metrics.stage('channels'):
+            channel_info, missing = cache_manager.load_channel_stats(channel_ids)
+            fresh_channels = search_pipeline.fetch_channel_info(youtube, missing) if missing else {}
+            channel_info.update(fresh_channels)
+
+        with metrics.stage('rss'):
+            feeds, fetched_feeds = search_pipeline.load_feeds(channel_ids, days)
+            videos = search_pipeline.recent_videos(feeds, channel_ids, days)
+
+        with metrics.stage('videos'):
+            video_info, missing = cache_manager.load_video_stats([v.videoId for v in videos])
+            fresh_stats = search_pipeline.fetch_video_info(youtube, missing) if missing else {}
+            video_info.update(fresh_stats)
+
+        # 다시 검사할 영상: 새 영상, 통계를 새로 받은 영상, 채널 정보를 새로 받은 영상
+        changed = [
+            video for video in videos
+            if video.videoId not in self._candidates
+            or video.videoId in fresh_stats
+            or video.channelId in fresh_channels
+        ]
+        self._candidates = {video.videoId: video for video in videos}
+
+        now = datetime.now()
+        saved = []
+        with metrics.stage('filter'):
+            for view in self.views.values():
+                cutoff = view.cutoff(now)
+                view.expire(cutoff)
+                view.update(videos if view.needs_full else changed, video_info, channel_info, cutoff)
+
+                view_videos = sum(
+                    1 for video in videos
+                    if video.channelId in view.channel_ids and video.publishedAt >= cutoff
+                )
+                if view.dirty or view.needs_full or view_videos != view.videos:
+                    view.videos = view_videos
+                    view.save()
+                    saved.append(view.name)
+                view.needs_full = False
+
+        summary = {
+            'views': len(self.views),
+            'channels': len(channel_ids),
+            'videos': len(videos),
+            'changed': len(changed),
+            'fetched': {
+                'channels': len(fresh_channels),
+                'feeds': len(fetched_feeds),
+                'videos': len(fresh_stats)
+            },
+            'saved': saved
+        }
+        record = metrics.finish_run(summary)
+
+        stages = ', '.join(f"{name} {seconds:.2f}초" for name, seconds in record['stages'].items())
+        print(
+            f"갱신 완료: 영상 {len(videos)}개 중 {len(changed)}개 다시 검사, "
+            f"뷰 {len(saved)}/{len(self.views)}개 저장 ({stages})"
+        )
+        return summary
+
+    def run_forever(self, interval=DEFAULT_INTERVAL, stop_event=None):
+        """
+        interval초마다 갱신합니다 (stop_event가 설정되면 종료).
+
+        Args:
+            interval: 갱신 주기 (초)
+            stop_event: threading.Event (스레드에서 실행할 때 종료용)
+        """
+        stop_event = stop_event or threading.Event()
+
+        while not stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.run_cycle()
+            except Exception as e:
+                print(f"갱신 오류: {e}")
+                metrics.record_error('refresher')
+            stop_event.wait(max(0, interval - (time.monotonic() - started)))
+
+
+def _get_service():
+    return get_api_service() or get_authenticated_service(interactive=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='저장된 검색 백그라운드 갱신')
+    parser.add_argument('--interval', type=int, default=DEFAULT_INTERVAL,
+                        help=f'갱신 주기 (초, 기본: {DEFAULT_INTERVAL})')
+    parser.add_argument('--once', action='store_true', help='한 번만 갱신하고 종료')
+    parser.add_argument('--account', default=accounts.DEFAULT_ACCOUNT,
+                        help='API 키가 없을 때 사용할 로그인 계정')
+    parser.add_argument('--api-key', default='', help='config.py 대신 사용할 API 키')
+    parser.add_argument('--metrics-file', default=metrics.TRACE_FILE,
+                        help='갱신마다 측정값을 덧붙일 JSONL 파일 (기본: AUTOBLOGER_METRICS_FILE 환경 변수)')
+    args = parser.parse_args(argv)
+
+    if not accounts.switch(args.account):
+        print(f"오류: 잘못된 계정 이름입니다: {args.account}")
+        return 1
+    if args.api_key:
+        config.API_KEY = args.api_key
+    metrics.TRACE_FILE = args.metrics_file
+
+    refresher = Refresher(_get_service)
+    if args.once:
+        return 0 if refresher.run_cycle() is not None else 1
+
+    try:
+        refresher.run_forever(args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
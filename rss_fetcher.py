@@ -2,17 +2,28 @@
 RSS 피드 수집 모듈
 - YouTube 채널 RSS 피드 파싱
 - 비동기 처리로 속도 향상
+- aiohttp/feedparser는 처음 수집할 때 불러옴 (시작 속도)
+- 같은 채널을 동시에 요청하면 한 번만 받고 결과 공유 (singleflight)
 """
 
+import os
 import asyncio
-import aiohttp
-import feedparser
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor
 
-RSS_URL_TEMPLATE = "https://www.youtube.com/feeds/videos.xml?channel_id={}"
+import metrics
+import profiler
+import singleflight
+from records import VideoEntry
+
+# 로컬 대체 서버로 테스트할 때 AUTOBLOGER_RSS_URL로 바꿈 ({}에 채널 ID)
+RSS_URL_TEMPLATE = os.environ.get(
+    'AUTOBLOGER_RSS_URL', "https://www.youtube.com/feeds/videos.xml?channel_id={}"
+)
 MAX_VIDEOS_PER_CHANNEL = 15  # YouTube RSS는 최대 15개 제공
 
+_flight = singleflight.group('rss')  # 키: (채널 ID, 기간)
+
 
 def parse_published_date(date_str):
     """RSS 날짜 문자열을 datetime으로 변환합니다."""
@@ -29,17 +40,25 @@ def parse_published_date(date_str):
 def fetch_channel_rss(channel_id, days_within=15):
     """
     단일 채널의 RSS 피드를 가져옵니다.
+    같은 채널을 다른 스레드/코루틴이 받는 중이면 그 결과를 기다려 씁니다.
 
     Args:
         channel_id: YouTube 채널 ID
         days_within: 최근 N일 이내 영상만
 
     Returns:
-        list: [{'videoId': ..., 'title': ..., 'publishedAt': ..., 'channelId': ...}, ...]
+        list: [VideoEntry, ...] (피드를 받지 못하면 None)
     """
+    return _flight.do((channel_id, days_within), _fetch_channel_rss, channel_id, days_within)
+
+
+def _fetch_channel_rss(channel_id, days_within):
+    import feedparser
+
     try:
         url = RSS_URL_TEMPLATE.format(channel_id)
         feed = feedparser.parse(url)
+        metrics.record_http(url, 0)  # feedparser가 직접 받으므로 크기는 알 수 없음
 
         if not feed.entries:
             return []
@@ -65,40 +84,54 @@ def fetch_channel_rss(channel_id, days_within=15):
             if not video_id:
                 continue
 
-            # 썸네일 URL
-            thumbnail = f"https://i.ytimg.com/vi/{video_id}/mqdefault.jpg"
-
-            videos.append({
-                'videoId': video_id,
-                'title': entry.get('title', ''),
-                'channelId': channel_id,
-                'channelTitle': entry.get('author', ''),
-                'publishedAt': published.isoformat(),
-                'thumbnail': thumbnail
-            })
+            videos.append(VideoEntry(
+                video_id,
+                entry.get('title', ''),
+                channel_id,
+                entry.get('author', ''),
+                published.isoformat()
+            ))
 
         return videos
 
     except Exception as e:
         print(f"RSS 피드 오류 ({channel_id}): {e}")
-        return []
+        metrics.record_error('rss')
+        return None
 
 
 async def fetch_channel_rss_async(session, channel_id, days_within=15):
-    """비동기로 단일 채널의 RSS 피드를 가져옵니다."""
+    """
+    비동기로 단일 채널의 RSS 피드를 가져옵니다 (피드를 받지 못하면 None).
+    같은 채널을 다른 스레드/코루틴이 받는 중이면 그 결과를 기다려 씁니다.
+    """
+    return await _flight.do_async(
+        (channel_id, days_within), _fetch_channel_rss_async, session, channel_id, days_within
+    )
+
+
+async def _fetch_channel_rss_async(session, channel_id, days_within):
+    import aiohttp
+    import feedparser
+
     try:
         url = RSS_URL_TEMPLATE.format(channel_id)
 
         async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
             if response.status != 200:
-                return []
+                metrics.record_http(url, 0)
+                metrics.record_error('rss')
+                return None
 
-            content = await response.text()
+            content = await response.read()
+        metrics.record_http(url, len(content))
 
         # feedparser는 동기 함수이므로 ThreadPoolExecutor 사용
         loop = asyncio.get_event_loop()
         with ThreadPoolExecutor() as executor:
-            feed = await loop.run_in_executor(executor, feedparser.parse, content)
+            feed = await loop.run_in_executor(
+                executor, profiler.wrap_worker('feedparser.parse', feedparser.parse), content
+            )
 
         if not feed.entries:
             return []
@@ -116,30 +149,29 @@ async def fetch_channel_rss_async(session, channel_id, days_within=15):
             if not video_id:
                 continue
 
-            thumbnail = f"https://i.ytimg.com/vi/{video_id}/mqdefault.jpg"
-
-            videos.append({
-                'videoId': video_id,
-                'title': entry.get('title', ''),
-                'channelId': channel_id,
-                'channelTitle': entry.get('author', ''),
-                'publishedAt': published.isoformat(),
-                'thumbnail': thumbnail
-            })
+            videos.append(VideoEntry(
+                video_id,
+                entry.get('title', ''),
+                channel_id,
+                entry.get('author', ''),
+                published.isoformat()
+            ))
 
         return videos
 
     except asyncio.TimeoutError:
         print(f"RSS 타임아웃 ({channel_id})")
-        return []
+        metrics.record_error('rss')
+        return None
     except Exception as e:
         print(f"RSS 오류 ({channel_id}): {e}")
-        return []
+        metrics.record_error('rss')
+        return None
 
 
-async def fetch_all_channels_async(channel_ids, days_within=15, progress_callback=None):
+async def fetch_channels_async(channel_ids, days_within=15, progress_callback=None):
     """
-    모든 채널의 RSS 피드를 비동기로 가져옵니다.
+    여러 채널의 RSS 피드를 비동기로 가져옵니다.
 
     Args:
         channel_ids: 채널 ID 리스트
@@ -147,32 +179,34 @@ async def fetch_all_channels_async(channel_ids, days_within=15, progress_callbac
         progress_callback: 진행률 콜백 함수 (current, total)
 
     Returns:
-        list: 모든 영상 리스트
+        dict: {채널ID: 영상 리스트 (피드를 받지 못하면 None)}
     """
-    all_videos = []
+    import aiohttp
+
+    result = {}
     total = len(channel_ids)
 
     connector = aiohttp.TCPConnector(limit=20)  # 동시 연결 제한
 
     async with aiohttp.ClientSession(connector=connector) as session:
-        tasks = [
-            fetch_channel_rss_async(session, cid, days_within)
-            for cid in channel_ids
-        ]
+        async def fetch(cid):
+            return cid, await fetch_channel_rss_async(session, cid, days_within)
+
+        tasks = [fetch(cid) for cid in channel_ids]
 
         for i, task in enumerate(asyncio.as_completed(tasks)):
-            videos = await task
-            all_videos.extend(videos)
+            cid, videos = await task
+            result[cid] = videos
 
             if progress_callback:
                 progress_callback(i + 1, total)
 
-    return all_videos
+    return result
 
 
-def fetch_all_channels(channel_ids, days_within=15, progress_callback=None):
+def fetch_channels(channel_ids, days_within=15, progress_callback=None):
     """
-    모든 채널의 RSS 피드를 가져옵니다 (동기 래퍼).
+    여러 채널의 RSS 피드를 채널별로 가져옵니다 (동기 래퍼).
 
     Args:
         channel_ids: 채널 ID 리스트
@@ -180,23 +214,44 @@ def fetch_all_channels(channel_ids, days_within=15, progress_callback=None):
         progress_callback: 진행률 콜백
 
     Returns:
-        list: 모든 영상 리스트
+        dict: {채널ID: 영상 리스트 (피드를 받지 못하면 None)}
     """
+    if not channel_ids:
+        return {}
+
     try:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         result = loop.run_until_complete(
-            fetch_all_channels_async(channel_ids, days_within, progress_callback)
+            fetch_channels_async(channel_ids, days_within, progress_callback)
         )
         loop.close()
         return result
     except Exception as e:
         print(f"RSS 수집 오류: {e}")
         # 비동기 실패 시 동기 방식으로 폴백
-        all_videos = []
+        result = {}
         for i, cid in enumerate(channel_ids):
-            videos = fetch_channel_rss(cid, days_within)
-            all_videos.extend(videos)
+            result[cid] = fetch_channel_rss(cid, days_within)
             if progress_callback:
                 progress_callback(i + 1, len(channel_ids))
-        return all_videos
+        return result
+
+
+def fetch_all_channels(channel_ids, days_within=15, progress_callback=None):
+    """
+    모든 채널의 RSS 피드를 가져옵니다.
+
+    Args:
+        channel_ids: 채널 ID 리스트
+        days_within: 최근 N일 이내
+        progress_callback: 진행률 콜백
+
+    Returns:
+        list: 모든 영상 리스트
+    """
+    all_videos = []
+    for videos in fetch_channels(channel_ids, days_within, progress_callback).values():
+        if videos:
+            all_videos.extend(videos)
+    return all_videos
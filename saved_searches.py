@@ -0,0 +1,131 @@
+"""
+저장된 검색 모듈
+- 이름별 필터 설정 저장 (saved_searches.json)
+- 검색 결과(구체화된 뷰)는 cache/views/<이름>.json에 저장
+- 뷰는 refresher 데몬이 갱신하고, 앱/CLI는 파일을 읽기만 함
+"""
+
+import os
+import json
+import threading
+from datetime import datetime
+
+import accounts
+from cache_manager import CACHE_DIR
+from records import VideoResult
+
+SAVED_SEARCHES_FILE = 'saved_searches.json'
+VIEWS_DIR = os.path.join(CACHE_DIR, 'views')
+
+_lock = threading.Lock()
+
+
+def _read_json(path, default):
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"파일 읽기 실패 ({path}): {e}")
+        return default
+
+
+def _write_json(path, data, **kwargs):
+    """임시 파일에 쓴 뒤 바꿔치기합니다 (다른 프로세스가 읽는 중이어도 안전)."""
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, **kwargs)
+    os.replace(tmp_file, path)
+
+
+def list_searches():
+    """저장된 검색 목록을 반환합니다 ({이름: 필터 설정})."""
+    with _lock:
+        return _read_json(SAVED_SEARCHES_FILE, {})
+
+
+def get_search(name):
+    """저장된 검색의 필터 설정을 반환합니다 (없으면 None)."""
+    return list_searches().get(name)
+
+
+def save_search(name, filter_config):
+    """
+    검색을 저장합니다 (같은 이름이면 덮어씀).
+
+    Args:
+        name: 검색 이름 (계정 이름과 같은 규칙)
+        filter_config: 필터 설정 (accounts 또는 channels로 검색 대상 지정)
+
+    Returns:
+        bool: 성공 여부
+    """
+    if not accounts.is_valid_name(name):
+        return False
+
+    with _lock:
+        searches = _read_json(SAVED_SEARCHES_FILE, {})
+        searches[name] = filter_config
+        _write_json(SAVED_SEARCHES_FILE, searches, indent=2)
+    return True
+
+
+def delete_search(name):
+    """저장된 검색과 그 뷰를 삭제합니다."""
+    with _lock:
+        searches = _read_json(SAVED_SEARCHES_FILE, {})
+        if searches.pop(name, None) is None:
+            return False
+        _write_json(SAVED_SEARCHES_FILE, searches, indent=2)
+
+    path = view_file(name)
+    if os.path.exists(path):
+        os.remove(path)
+    return True
+
+
+def channel_ids_for(filter_config):
+    """검색 대상 채널 ID 리스트 (channels가 있으면 그대로, 없으면 accounts의 저장된 구독 목록)."""
+    if filter_config.get('channels'):
+        return list(filter_config['channels'])
+    return accounts.collect_channel_ids(filter_config.get('accounts') or [accounts.DEFAULT_ACCOUNT])
+
+
+def view_file(name):
+    return os.path.join(VIEWS_DIR, f"{name}.json")
+
+
+def load_view(name):
+    """
+    저장된 뷰를 읽습니다.
+
+    Returns:
+        dict: {'filterConfig', 'updatedAt', 'videos', 'results': VideoResult 리스트} (없으면 None)
+    """
+    data = _read_json(view_file(name), None)
+    if not data:
+        return None
+    data['results'] = [VideoResult.from_row(row) for row in data.get('results', [])]
+    return data
+
+
+def save_view(name, filter_config, results, videos):
+    """
+    뷰를 저장합니다.
+
+    Args:
+        name: 검색 이름
+        filter_config: 뷰를 만든 필터 설정 (설정이 바뀌면 다시 만듦)
+        results: VideoResult 리스트
+        videos: 검사한 영상 수
+    """
+    _write_json(view_file(name), {
+        'filterConfig': filter_config,
+        'updatedAt': datetime.now().isoformat(),
+        'videos': videos,
+        'results': [result.to_row() for result in results]
+    }, separators=(',', ':'))
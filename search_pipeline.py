@@ -0,0 +1,385 @@
+"""
+영상 검색 파이프라인 모듈
+- 구독 채널 목록 불러오기 (캐시 우선)
+- 채널 정보 → RSS → 영상 정보 → 필터 순서로 검색
+- 채널 정보/피드/영상 통계는 공유 캐시에 없는 것만 요청 (계정 간 중복 요청 방지)
+- Eel에 의존하지 않음 (데스크톱 앱과 CLI에서 공용)
+- 항목은 records 레코드 객체로 다룸 (dict 변환은 Eel/CLI 출력에서만)
+"""
+
+import os
+from datetime import datetime, timedelta
+from functools import partial
+from operator import attrgetter
+
+from youtube_api import get_subscriptions, get_channels_batch, get_videos_batch
+from rss_fetcher import fetch_channels
+import cache_manager
+import metrics
+import profiler
+import stats_store
+from records import VideoResult
+
+# 결과 정렬 기준 (모두 내림차순)
+RESULT_SORT_KEYS = ('viewCount', 'ratio', 'velocity', 'subscriberCount', 'likeCount', 'publishedAt')
+
+# 결과 항목 필드 (CSV 열 순서)
+RESULT_FIELDS = VideoResult.DICT_FIELDS
+
+MIN_DURATION = 181  # 쇼츠 제외
+
+# 피드 캐시에 보관하는 기간 (검색 기간은 이 안에서 잘라 씀)
+FEED_CACHE_DAYS = 30
+
+# 피드를 나눠 받을 로컬 워커 수 (0이면 rss_fetcher 이벤트 루프 하나로 수집, crawl_cluster 참고)
+CRAWL_WORKERS = int(os.environ.get('AUTOBLOGER_CRAWL_WORKERS', '0') or 0)
+
+
+def load_subscriptions(get_service, force_refresh=False):
+    """
+    구독 채널 목록을 불러옵니다 (캐시 우선).
+
+    Args:
+        get_service: OAuth 인증된 YouTube API 서비스를 반환하는 함수
+        force_refresh: True면 캐시를 무시하고 API로 조회
+
+    Returns:
+        tuple: (구독 리스트, 캐시 사용 여부)
+    """
+    if not force_refresh:
+        cached = cache_manager.load_subscriptions()
+        if cached:
+            # 캐시에 구독자 수가 없으면 API로 조회
+            needs_subscriber_count = any(not sub.subscriberCount for sub in cached)
+
+            if needs_subscriber_count:
+                try:
+                    youtube = get_service()
+                    if youtube:
+                        channel_ids = [sub.id for sub in cached]
+                        channel_stats = get_channel_info(youtube, channel_ids)
+
+                        for sub in cached:
+                            stats = channel_stats.get(sub.id)
+                            sub.subscriberCount = stats.subscriberCount if stats else 0
+
+                        cache_manager.save_subscriptions(cached)
+                except Exception as e:
+                    print(f"구독자 수 조회 실패: {e}")
+
+            return cached, True
+
+    youtube = get_service()
+    if not youtube:
+        raise RuntimeError('로그인이 필요합니다.')
+
+    print("구독 채널 목록을 가져오는 중...")
+    subs = get_subscriptions(youtube)
+
+    if not subs:
+        raise RuntimeError('구독 채널이 없습니다.')
+
+    cache_manager.save_subscriptions(subs)
+    return subs, False
+
+
+def get_channel_info(youtube, channel_ids):
+    """채널 정보를 공유 캐시에서 찾고, 없는 채널만 API로 조회합니다."""
+    channel_info, missing = cache_manager.load_channel_stats(channel_ids)
+
+    if missing:
+        channel_info.update(fetch_channel_info(youtube, missing))
+
+    return channel_info
+
+
+def fetch_channel_info(youtube, channel_ids):
+    """채널 정보를 API로 조회해 공유 캐시에 저장하고 반환합니다."""
+    fetched = get_channels_batch(youtube, channel_ids)
+    cache_manager.save_channel_stats(fetched)
+    return fetched
+
+
+def load_feeds(channel_ids, days_within, progress_callback=None):
+    """
+    채널별 RSS 영상 목록을 가져옵니다. 피드 캐시에 없는 채널만 RSS로 받습니다.
+    AUTOBLOGER_CRAWL_WORKERS가 설정되면 로컬 워커 프로세스로 나눠 받습니다 (crawl_cluster).
+
+    Returns:
+        tuple: ({채널ID: VideoEntry 리스트 (받지 못하면 None)}, 새로 받은 채널 ID 리스트)
+    """
+    fetch = fetch_channels
+    if CRAWL_WORKERS:
+        import crawl_cluster  # 분산 수집을 쓸 때만 불러옴 (시작 속도)
+        fetch = partial(crawl_cluster.fetch_channels, local_workers=CRAWL_WORKERS)
+
+    if days_within > FEED_CACHE_DAYS:
+        return fetch(channel_ids, days_within, progress_callback), list(channel_ids)
+
+    feeds, missing = cache_manager.load_feeds(channel_ids)
+    if missing:
+        fetched = fetch(missing, FEED_CACHE_DAYS, progress_callback)
+        cache_manager.save_feeds(fetched)
+        feeds.update(fetched)
+    return feeds, missing
+
+
+def recent_videos(feeds, channel_ids, days_within):
+    """채널별 영상 목록에서 최근 N일 이내 영상만 채널 순서대로 모읍니다."""
+    cutoff = (datetime.now() - timedelta(days=days_within)).isoformat()
+    return [
+        video
+        for cid in channel_ids
+        for video in (feeds.get(cid) or [])
+        if video.publishedAt >= cutoff
+    ]
+
+
+def collect_videos(channel_ids, days_within, progress_callback=None):
+    """
+    채널들의 최근 영상을 모읍니다. 피드 캐시에 없는 채널만 RSS로 받습니다.
+
+    Args:
+        channel_ids: 채널 ID 리스트
+        days_within: 최근 N일 이내
+        progress_callback: RSS 진행률 콜백 (current, total)
+
+    Returns:
+        list: VideoEntry 리스트
+    """
+    feeds, _ = load_feeds(channel_ids, days_within, progress_callback)
+    return recent_videos(feeds, channel_ids, days_within)
+
+
+def get_video_info(youtube, video_ids):
+    """
+    영상 통계를 공유 캐시에서 찾고, 없는 영상만 API로 조회합니다.
+    새로 받은 통계는 조회수 시계열(stats_store)에 스냅샷으로 남깁니다.
+    """
+    video_info, missing = cache_manager.load_video_stats(video_ids)
+
+    if missing:
+        video_info.update(fetch_video_info(youtube, missing))
+
+    return video_info
+
+
+def fetch_video_info(youtube, video_ids):
+    """영상 통계를 API로 조회해 공유 캐시와 조회수 시계열에 저장하고 반환합니다."""
+    fetched = get_videos_batch(youtube, video_ids)
+    cache_manager.save_video_stats(fetched)
+    stats_store.record(fetched)
+    return fetched
+
+
+def make_filter(filter_config):
+    """
+    영상 하나에 필터 조건을 적용하는 함수를 만듭니다.
+
+    Args:
+        filter_config: 필터 설정 (filterType, maxSubscribers, minViews, mutationRatio,
+                       minVelocity)
+
+    Returns:
+        function: (VideoEntry, VideoStats, ChannelInfo) -> VideoResult (통과하지 못하면 None)
+    """
+    filter_type = filter_config.get('filterType', 'normal')
+    max_subscribers = filter_config.get('maxSubscribers', 10000)
+    min_views = filter_config.get('minViews', 10000)
+    mutation_ratio = filter_config.get('mutationRatio', 1.0)
+    min_velocity = filter_config.get('minVelocity', 100)
+
+    def match(video, v_info, c_info):
+        if not v_info or not c_info:
+            return None
+
+        if v_info.duration < MIN_DURATION:
+            return None
+
+        view_count = v_info.viewCount
+        subscriber_count = c_info.subscriberCount
+        velocity = stats_store.velocity(video.videoId, video.publishedAt)
+
+        # 필터 적용
+        if filter_type == 'normal':
+            if subscriber_count > max_subscribers:
+                return None
+            if view_count < min_views:
+                return None
+        elif filter_type == 'velocity':
+            # 시간당 조회수 (직전 스냅샷 대비)
+            if velocity is None or velocity < min_velocity:
+                return None
+        else:
+            if subscriber_count == 0:
+                return None
+            ratio = view_count / subscriber_count
+            if ratio < mutation_ratio:
+                return None
+
+        return VideoResult(
+            video.videoId,
+            video.title,
+            video.channelId,
+            c_info.title,
+            video.publishedAt,
+            view_count,
+            v_info.likeCount,
+            subscriber_count,
+            v_info.duration,
+            round(view_count / subscriber_count, 2) if subscriber_count > 0 else 0,
+            round(velocity, 1) if velocity is not None else 0
+        )
+
+    return match
+
+
+def filter_videos(all_videos, video_info, channel_info, filter_config):
+    """
+    수집된 영상에 필터 조건을 적용합니다.
+
+    Args:
+        all_videos: RSS로 수집한 영상 리스트
+        video_info: get_video_info 결과
+        channel_info: get_channel_info 결과
+        filter_config: 필터 설정 (make_filter 참고)
+
+    Returns:
+        list: VideoResult 리스트
+    """
+    match = make_filter(filter_config)
+    filtered_videos = []
+
+    for video in all_videos:
+        result = match(video, video_info.get(video.videoId), channel_info.get(video.channelId))
+        if result is not None:
+            filtered_videos.append(result)
+
+    return filtered_videos
+
+
+def default_sort_key(filter_config):
+    """필터 종류별 기본 정렬 기준을 반환합니다 (일반=조회수, 돌연변이=지수, 급상승=속도)."""
+    filter_type = filter_config.get('filterType', 'normal')
+    if filter_type == 'velocity':
+        return 'velocity'
+    return 'viewCount' if filter_type == 'normal' else 'ratio'
+
+
+def sort_results(videos, sort_key):
+    """결과를 정렬 기준에 따라 내림차순 정렬한 새 리스트를 반환합니다."""
+    if sort_key not in RESULT_SORT_KEYS:
+        sort_key = 'viewCount'
+    return sorted(videos, key=attrgetter(sort_key), reverse=True)
+
+
+def run_search(api_service, channel_ids, filter_config, progress_callback=None):
+    """
+    조건에 맞는 영상을 검색합니다.
+
+    Args:
+        api_service: YouTube API 서비스 (API 키 또는 OAuth)
+        channel_ids: 검색할 채널 ID 리스트
+        filter_config: 필터 설정 (daysWithin 포함)
+        progress_callback: 진행률 콜백 함수 (text, percent)
+
+    Returns:
+        tuple: (수집된 영상 수, VideoResult 리스트)
+    """
+    def progress(text, percent):
+        if progress_callback:
+            progress_callback(text, percent)
+
+    metrics.start_run()
+    profiler.start_run()
+    try:
+        total, filtered_videos = _run_stages(api_service, channel_ids, filter_config, progress)
+    except Exception as e:
+        # 실패한 검색도 측정 기록(TRACE_FILE)에 남김
+        metrics.record_error('search')
+        metrics.finish_run({
+            'filterConfig': filter_config,
+            'channels': len(channel_ids),
+            'error': f"{type(e).__name__}: {e}"
+        })
+        raise
+    finally:
+        # 단계에서 예외가 나도 프로파일(tracemalloc 포함)은 끝냄
+        profiler.finish_run()
+
+    _finish_metrics(filter_config, channel_ids, total, len(filtered_videos))
+    return total, filtered_videos
+
+
+def _run_stages(api_service, channel_ids, filter_config, progress):
+    """
+    run_search의 단계들 (채널 정보 → RSS → 영상 정보 → 필터).
+
+    Returns:
+        tuple: (수집된 영상 수, VideoResult 리스트)
+    """
+    days_within = filter_config.get('daysWithin', 15)
+    print(f"총 {len(channel_ids)}개 채널 검색 시작...")
+
+    # 1단계: 채널 구독자 수 조회
+    print("1단계: 채널 정보 조회 중...")
+    progress("채널 정보 조회 중...", 10)
+    with metrics.stage('channels'), profiler.stage('channels'):
+        channel_info = get_channel_info(api_service, channel_ids)
+
+    # 2단계: RSS로 최신 영상 수집
+    print("2단계: RSS 피드 수집 중...")
+    progress("RSS 피드 수집 중...", 30)
+
+    def rss_progress(current, total):
+        percent = 30 + int((current / total) * 40)
+        progress(f"RSS 수집: {current}/{total}", percent)
+
+    with metrics.stage('rss'), profiler.stage('rss'):
+        all_videos = collect_videos(channel_ids, days_within, rss_progress)
+    print(f"총 {len(all_videos)}개 영상 수집됨")
+
+    if not all_videos:
+        return 0, []
+
+    # 3단계: 영상 상세 정보 조회
+    print("3단계: 영상 정보 조회 중...")
+    progress("영상 정보 조회 중...", 75)
+    video_ids = [v.videoId for v in all_videos]
+    with metrics.stage('videos'), profiler.stage('videos'):
+        video_info = get_video_info(api_service, video_ids)
+
+    # 4단계: 필터링
+    print("4단계: 필터 적용 중...")
+    progress("필터 적용 중...", 90)
+    with metrics.stage('filter'), profiler.stage('filter'):
+        filtered_videos = filter_videos(all_videos, video_info, channel_info, filter_config)
+
+    progress("완료!", 100)
+    print(f"필터링 결과: {len(filtered_videos)}개")
+    return len(all_videos), filtered_videos
+
+
+def _finish_metrics(filter_config, channel_ids, total, filtered):
+    """검색 측정을 끝내고 요약을 출력합니다."""
+    record = metrics.finish_run({
+        'filterConfig': filter_config,
+        'channels': len(channel_ids),
+        'videos': total,
+        'results': filtered
+    })
+
+    stages = ', '.join(f"{name} {seconds:.2f}초" for name, seconds in record['stages'].items())
+    http_stats = record['transport']
+    print(f"단계별 시간: {stages}")
+    print(
+        f"API 연결: 요청 {http_stats['requests']}회, 새 연결 {http_stats['connections']}개, "
+        f"재사용 {http_stats['reused']}회"
+    )
+
+    shared = {
+        name.split('.', 1)[1]: count for name, count in record['counters'].items()
+        if name.startswith('singleflight.')
+    }
+    if shared:
+        print("중복 요청 합침: " + ', '.join(f"{name} {count}회" for name, count in shared.items()))
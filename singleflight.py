@@ -0,0 +1,121 @@
+"""
+중복 요청 합치기 (single-flight) 모듈
+- 같은 키로 동시에 들어온 호출은 먼저 온 호출 하나만 실행하고 결과(또는 예외)를 공유
+- 스레드(do)와 asyncio 코루틴(do_async) 모두 지원 (서로 다른 이벤트 루프/스레드 사이에서도 공유)
+- 끝난 호출은 보관하지 않음 (캐시가 아님, 결과 캐시는 cache_manager)
+- 그룹별 호출 수/공유(절약)된 호출 수 통계
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+
+import metrics
+
+_lock = threading.Lock()
+_groups = {}  # 이름 -> Group
+
+
+class Group:
+    """키별로 진행 중인 호출을 하나씩만 실행하는 그룹."""
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls = {}   # 키 -> Future (진행 중인 호출)
+        self.calls = 0     # 전체 호출 수
+        self.shared = 0    # 진행 중인 호출의 결과를 받아 간 (요청을 절약한) 호출 수
+
+    def _join(self, key):
+        """
+        진행 중인 호출을 찾거나 새로 등록합니다.
+
+        Returns:
+            tuple: (Future, 직접 실행해야 하면 True)
+        """
+        with self._lock:
+            self.calls += 1
+            future = self._calls.get(key)
+            if future is not None:
+                self.shared += 1
+                leader = False
+            else:
+                future = self._calls[key] = Future()
+                leader = True
+
+        if not leader:
+            metrics.incr(f"singleflight.{self.name}")
+        return future, leader
+
+    def _finish(self, key, future, result=None, error=None):
+        with self._lock:
+            del self._calls[key]
+        if error is None:
+            future.set_result(result)
+        elif isinstance(error, Exception):
+            future.set_exception(error)
+        else:
+            # 취소/중단은 기다리던 호출에는 실패로 전달 (각자 다시 요청하지 않음)
+            future.set_exception(RuntimeError(f"{self.name} 요청 중단됨"))
+
+    def do(self, key, func, *args):
+        """
+        func(*args)를 실행합니다. 같은 키의 호출이 진행 중이면 그 결과를 기다려 반환합니다.
+
+        Args:
+            key: 요청을 구분하는 키 (해시 가능)
+            func: 실행할 함수
+
+        Returns:
+            func의 결과 (예외도 함께 기다린 호출 모두에게 전달)
+        """
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+
+        try:
+            result = func(*args)
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+    async def do_async(self, key, coro_func, *args):
+        """do의 코루틴 버전 (await coro_func(*args))."""
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+
+        try:
+            result = await coro_func(*args)
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+
+def group(name):
+    """이름별 그룹을 반환합니다 (없으면 만듦)."""
+    with _lock:
+        if name not in _groups:
+            _groups[name] = Group(name)
+        return _groups[name]
+
+
+def get_stats():
+    """
+    그룹별 통계를 반환합니다.
+
+    Returns:
+        dict: {이름: {'calls': 호출 수, 'shared': 절약된 호출 수, 'inFlight': 진행 중}}
+    """
+    with _lock:
+        groups = list(_groups.values())
+
+    stats = {}
+    for g in groups:
+        with g._lock:
+            stats[g.name] = {'calls': g.calls, 'shared': g.shared, 'inFlight': len(g._calls)}
+    return stats
@@ -0,0 +1,212 @@
+"""
+로컬 대체 서버 (테스트용)
+- YouTube RSS 피드와 Data API(channels.list, videos.list), 썸네일 이미지를 흉내 내는 HTTP 서버
+- 썸네일은 ID마다 색이 다른 PNG (브라우저는 확장자/Content-Type이 아니라 내용으로 형식을 판단)
+- 채널/영상 데이터는 ID에서 결정적으로 만듦 (조회수는 시간이 지나면 증가)
+- 지연/오류 비율을 지정해 느린 서버, 실패하는 서버도 흉내 냄
+- 실제 YouTube에 요청하지 않고 refresher/CLI를 헤드리스로 실행할 때 사용
+
+사용 예:
+    python standin_server.py --port 8765
+    AUTOBLOGER_RSS_URL='http://127.0.0.1:8765/feeds/videos.xml?channel_id={}' \\
+    AUTOBLOGER_API_ENDPOINT='http://127.0.0.1:8765/youtube/v3/' \\
+    AUTOBLOGER_THUMBNAIL_URL='http://127.0.0.1:8765/vi/{}/mqdefault.jpg' \\
+        python refresher.py --once --api-key standin
+"""
+
+import json
+import time
+import zlib
+import struct
+import random
+import hashlib
+import argparse
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from xml.sax.saxutils import escape
+
+VIDEOS_PER_FEED = 15
+VIDEO_SPACING_HOURS = 20  # 피드 안 영상 간격 (15개면 약 12일)
+THUMBNAIL_SIZE = (320, 180)  # mqdefault와 같은 크기
+
+
+def _number(text, low, high):
+    """문자열에서 [low, high) 범위의 고정된 정수를 만듭니다."""
+    digest = hashlib.md5(text.encode('utf-8')).digest()
+    return low + int.from_bytes(digest[:8], 'big') % (high - low)
+
+
+class StandinData:
+    """대체 서버가 돌려주는 채널/영상 데이터."""
+
+    def __init__(self, started=None):
+        # 영상 게시 시각의 기준 (서버 시작 시각)
+        self.started = started or datetime.now(timezone.utc)
+
+    def video_ids(self, channel_id):
+        prefix = hashlib.md5(channel_id.encode('utf-8')).hexdigest()[:8]
+        return [f"{prefix}{i:03d}" for i in range(VIDEOS_PER_FEED)]
+
+    def published(self, video_id):
+        index = int(video_id[-3:])
+        return self.started - timedelta(hours=index * VIDEO_SPACING_HOURS + 1)
+
+    def channel(self, channel_id, base_url=None):
+        """채널 정보 (base_url이 있으면 썸네일도 이 서버에서 제공)."""
+        if base_url:
+            thumbnail = f"{base_url}/ch/{channel_id}/default.jpg"
+        else:
+            thumbnail = f"https://yt3.ggpht.com/standin/{channel_id}=s88"
+        return {
+            'id': channel_id,
+            'snippet': {
+                'title': f"채널 {channel_id[-6:]}",
+                'thumbnails': {'default': {'url': thumbnail}}
+            },
+            'statistics': {'subscriberCount': str(_number(channel_id, 100, 1000000))}
+        }
+
+    def video(self, video_id, now=None):
+        now = now or datetime.now(timezone.utc)
+        hours = max(0.0, (now - self.published(video_id)).total_seconds() / 3600)
+        views = _number(video_id, 0, 5000) + int(_number(video_id + ':rate', 1, 2000) * hours)
+        return {
+            'id': video_id,
+            'statistics': {
+                'viewCount': str(views),
+                'likeCount': str(views // 50),
+                'commentCount': str(views // 500)
+            },
+            'contentDetails': {'duration': f"PT{_number(video_id + ':len', 1, 40)}M{_number(video_id, 0, 60)}S"}
+        }
+
+    def thumbnail(self, key):
+        """키마다 색이 다른 PNG 이미지 (가로 그라데이션)."""
+        width, height = THUMBNAIL_SIZE
+        r, g, b = hashlib.md5(key.encode('utf-8')).digest()[:3]
+        row = b'\x00' + b''.join(
+            bytes((r * x // width, g, b)) for x in range(width)
+        )
+
+        def chunk(kind, data):
+            body = kind + data
+            return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body))
+
+        return (
+            b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(row * height))
+            + chunk(b'IEND', b'')
+        )
+
+    def feed(self, channel_id):
+        title = escape(self.channel(channel_id)['snippet']['title'])
+        entries = []
+        for video_id in self.video_ids(channel_id):
+            entries.append(
+                '<entry>'
+                f'<id>yt:video:{video_id}</id>'
+                f'<yt:videoId>{video_id}</yt:videoId>'
+                f'<yt:channelId>{channel_id}</yt:channelId>'
+                f'<title>영상 {video_id}</title>'
+                f'<link rel="alternate" href="https://www.youtube.com/watch?v={video_id}"/>'
+                f'<author><name>{title}</name></author>'
+                f'<published>{self.published(video_id).isoformat()}</published>'
+                '</entry>'
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" '
+            'xmlns="http://www.w3.org/2005/Atom">'
+            f'<title>{title}</title>'
+            + ''.join(entries) +
+            '</feed>'
+        )
+
+
+def make_handler(data, delay=0.0, fail_rate=0.0):
+    """요청 처리 클래스를 만듭니다."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body, content_type):
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if delay:
+                time.sleep(delay)
+            if fail_rate and random.random() < fail_rate:
+                self._send(503, '{"error": "standin failure"}', 'application/json')
+                return
+
+            url = urlsplit(self.path)
+            query = parse_qs(url.query)
+            ids = [i for i in ','.join(query.get('id', [])).split(',') if i]
+
+            if url.path == '/feeds/videos.xml':
+                channel_id = query.get('channel_id', [''])[0]
+                self._send(200, data.feed(channel_id), 'application/atom+xml; charset=utf-8')
+            elif url.path.endswith('.jpg') and url.path.startswith(('/vi/', '/ch/')):
+                # /vi/<영상ID>/mqdefault.jpg, /ch/<채널ID>/default.jpg
+                self._send(200, data.thumbnail(url.path.split('/')[2]), 'image/png')
+            elif url.path.endswith('/channels'):
+                base_url = f"http://{self.headers.get('Host')}" if self.headers.get('Host') else None
+                body = {'items': [data.channel(i, base_url) for i in ids]}
+                self._send(200, json.dumps(body, ensure_ascii=False), 'application/json; charset=utf-8')
+            elif url.path.endswith('/videos'):
+                body = {'items': [data.video(i) for i in ids]}
+                self._send(200, json.dumps(body), 'application/json; charset=utf-8')
+            else:
+                self._send(404, '{"error": "not found"}', 'application/json')
+
+    return Handler
+
+
+def start(port=0, delay=0.0, fail_rate=0.0, host='127.0.0.1'):
+    """
+    대체 서버를 백그라운드 스레드에서 시작합니다.
+
+    Returns:
+        ThreadingHTTPServer (server.server_address로 포트 확인, shutdown()으로 종료)
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(StandinData(), delay, fail_rate))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='standin', daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='YouTube RSS/API 로컬 대체 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--delay', type=float, default=0.0, help='응답 지연 (초)')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='503 응답 비율 (0~1)')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(
+        (args.host, args.port), make_handler(StandinData(), args.delay, args.fail_rate)
+    )
+    base = f"http://{args.host}:{server.server_address[1]}"
+    print(f"AUTOBLOGER_RSS_URL='{base}/feeds/videos.xml?channel_id={{}}'")
+    print(f"AUTOBLOGER_API_ENDPOINT='{base}/youtube/v3/'")
+    print(f"AUTOBLOGER_THUMBNAIL_URL='{base}/vi/{{}}/mqdefault.jpg'")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,502 @@
+"""
+조회수 시계열 저장 모듈
+- 영상별 (시각, 조회수) 스냅샷을 array 하나에 압축 보관
+- 파일에는 델타 + 가변 길이 정수로 인코딩해 저장
+- 새 스냅샷은 추가 전용 로그에 덧붙이고, 주기적으로 백그라운드에서 본 파일로 압축
+- 오래된 스냅샷은 압축할 때 다운샘플링 (1일 이후 시간당 1개, 7일 이후 하루 1개)
+- 조회수 증가 속도 (시간당 조회수) 계산 (추가 API 호출 없음)
+- 다른 프로세스(refresher 데몬 등)가 저장하면 파일 수정 시각으로 감지해 합침
+"""
+
+import os
+import time
+import array
+import threading
+from datetime import datetime, timezone
+
+from cache_manager import CACHE_DIR
+
+STORE_FILE = os.path.join(CACHE_DIR, 'view_history.bin')
+LOG_FILE = os.path.join(CACHE_DIR, 'view_history.log')
+_MAGIC = b'VHS1'
+_LOG_MAGIC = b'VHL1'
+_LOG_HEADER_SIZE = len(_LOG_MAGIC) + 8  # 매직 + 세대 ID (압축으로 로그가 새로 쓰였는지 구분)
+
+MIN_INTERVAL = 60              # 이 간격(초) 안의 중복 스냅샷은 무시
+HOURLY_AFTER = 24 * 3600       # 1일 지난 스냅샷은 시간당 1개
+DAILY_AFTER = 7 * 24 * 3600    # 7일 지난 스냅샷은 하루 1개
+MAX_AGE = 60 * 24 * 3600       # 60일 넘게 갱신되지 않은 영상은 삭제
+COMPACT_INTERVAL = 3600        # 본 파일이 이보다 오래되면 로그를 압축
+
+_lock = threading.Lock()
+_series = None  # 영상ID -> array('q') [t0, v0, t1, v1, ...]
+_mtime = None   # 마지막으로 읽거나 쓴 저장 파일의 수정 시각
+_log_gen = None  # 마지막으로 읽은 로그의 세대 ID
+_log_offset = 0  # 로그에서 어디까지 읽었는지 (바이트)
+_checked = 0.0  # 마지막으로 수정 시각을 확인한 시각 (영상마다 확인하지 않도록)
+_compacting = False
+RELOAD_CHECK_INTERVAL = 1.0
+
+
+# 가변 길이 정수 (zigzag + LEB128)
+def _write_varint(out, value):
+    value = (value << 1) ^ (value >> 63)
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            break
+        shift += 7
+    return (result >> 1) ^ -(result & 1), pos
+
+
+def _encode(series):
+    """시계열 전체를 바이트로 인코딩합니다 (영상마다 첫 점 이후는 이전 점과의 차이)."""
+    out = bytearray(_MAGIC)
+    _write_varint(out, len(series))
+
+    for video_id, points in series.items():
+        encoded_id = video_id.encode('ascii')
+        _write_varint(out, len(encoded_id))
+        out += encoded_id
+        _write_varint(out, len(points) // 2)
+
+        prev_t = prev_v = 0
+        for i in range(0, len(points), 2):
+            t, v = points[i], points[i + 1]
+            _write_varint(out, t - prev_t)
+            _write_varint(out, v - prev_v)
+            prev_t, prev_v = t, v
+
+    return bytes(out)
+
+
+def _decode(data):
+    """_encode로 만든 바이트를 시계열로 되돌립니다."""
+    if data[:len(_MAGIC)] != _MAGIC:
+        return {}
+
+    series = {}
+    pos = len(_MAGIC)
+    count, pos = _read_varint(data, pos)
+
+    for _ in range(count):
+        id_len, pos = _read_varint(data, pos)
+        video_id = data[pos:pos + id_len].decode('ascii')
+        pos += id_len
+        n, pos = _read_varint(data, pos)
+
+        points = array.array('q')
+        t = v = 0
+        for _ in range(n):
+            dt, pos = _read_varint(data, pos)
+            dv, pos = _read_varint(data, pos)
+            t += dt
+            v += dv
+            points.append(t)
+            points.append(v)
+        series[video_id] = points
+
+    return series
+
+
+def _file_mtime():
+    try:
+        return os.stat(STORE_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _merge(points, other):
+    """두 시계열을 시각 순으로 합칩니다 (같은 시각은 하나만)."""
+    merged = {}
+    for series in (other, points):
+        for i in range(0, len(series), 2):
+            merged[series[i]] = series[i + 1]
+
+    result = array.array('q')
+    for t in sorted(merged):
+        result.append(t)
+        result.append(merged[t])
+    return result
+
+
+def _add_point(video_id, t, v):
+    """스냅샷 하나를 메모리 시계열에 넣습니다 (이미 있는 시각이면 무시)."""
+    points = _series.get(video_id)
+    if points is None:
+        _series[video_id] = array.array('q', (t, v))
+    elif t > points[-2]:
+        points.append(t)
+        points.append(v)
+    elif t != points[-2]:
+        _series[video_id] = _merge(points, array.array('q', (t, v)))
+
+
+def _encode_log_record(t, entries):
+    """한 번에 기록한 스냅샷들을 로그 레코드로 인코딩합니다 (앞에 레코드 길이)."""
+    payload = bytearray()
+    _write_varint(payload, t)
+    _write_varint(payload, len(entries))
+    for video_id, views in entries:
+        encoded_id = video_id.encode('ascii')
+        _write_varint(payload, len(encoded_id))
+        payload += encoded_id
+        _write_varint(payload, views)
+
+    out = bytearray()
+    _write_varint(out, len(payload))
+    out += payload
+    return bytes(out)
+
+
+def _apply_log_record(data):
+    t, pos = _read_varint(data, 0)
+    n, pos = _read_varint(data, pos)
+    for _ in range(n):
+        id_len, pos = _read_varint(data, pos)
+        video_id = data[pos:pos + id_len].decode('ascii')
+        pos += id_len
+        v, pos = _read_varint(data, pos)
+        _add_point(video_id, t, v)
+
+
+def _read_log():
+    """로그에서 아직 읽지 않은 레코드를 메모리에 합칩니다 (잠금 안에서 호출)."""
+    global _log_gen, _log_offset
+
+    try:
+        with open(LOG_FILE, 'rb') as f:
+            header = f.read(_LOG_HEADER_SIZE)
+            if len(header) < _LOG_HEADER_SIZE or header[:len(_LOG_MAGIC)] != _LOG_MAGIC:
+                return
+            gen = header[len(_LOG_MAGIC):]
+            if gen != _log_gen:
+                # 압축으로 새로 쓰인 로그는 처음부터 읽음
+                _log_gen = gen
+                _log_offset = _LOG_HEADER_SIZE
+            f.seek(_log_offset)
+            data = f.read()
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        print(f"조회수 로그 읽기 실패: {e}")
+        return
+
+    pos = 0
+    while pos < len(data):
+        try:
+            size, start = _read_varint(data, pos)
+        except IndexError:
+            break
+        if start + size > len(data):
+            break  # 다른 프로세스가 아직 쓰는 중인 레코드
+        try:
+            _apply_log_record(data[start:start + size])
+        except (IndexError, UnicodeDecodeError) as e:
+            print(f"조회수 로그 레코드 손상 (건너뜀): {e}")
+        pos = start + size
+    _log_offset += pos
+
+
+def _append_log(record):
+    """레코드를 로그 끝에 덧붙입니다 (잠금 안에서 호출)."""
+    global _log_gen, _log_offset
+
+    if not os.path.exists(CACHE_DIR):
+        os.makedirs(CACHE_DIR)
+
+    flags = getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(LOG_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL | flags)
+        gen = os.urandom(8)
+        record = _LOG_MAGIC + gen + record
+    except FileExistsError:
+        fd = os.open(LOG_FILE, os.O_RDWR | os.O_APPEND | flags)
+        gen = os.read(fd, _LOG_HEADER_SIZE)[len(_LOG_MAGIC):]
+
+    try:
+        os.write(fd, record)
+        end = os.lseek(fd, 0, os.SEEK_CUR)
+    finally:
+        os.close(fd)
+
+    # 읽은 곳 바로 뒤에 붙었으면 방금 쓴 레코드는 다시 읽지 않음
+    if gen == _log_gen and end - len(record) == _log_offset:
+        _log_offset = end
+    elif end == len(record):
+        _log_gen, _log_offset = gen, end
+
+
+def _ensure_loaded(force_check=False):
+    """
+    저장 파일과 로그를 메모리로 불러옵니다 (잠금 안에서 호출).
+    마지막으로 읽거나 쓴 뒤 파일이 바뀌었으면 다시 읽어 합치고, 로그는 새로 붙은 부분만 읽습니다.
+    (RELOAD_CHECK_INTERVAL마다 확인, 압축 전에는 항상 확인)
+    """
+    global _series, _mtime, _checked
+
+    if _series is not None and not force_check and time.monotonic() - _checked < RELOAD_CHECK_INTERVAL:
+        return
+    _checked = time.monotonic()
+
+    mtime = _file_mtime()
+    if _series is None or mtime != _mtime:
+        if _series is None:
+            _series = {}
+        _mtime = mtime
+        if mtime is not None:
+            try:
+                with open(STORE_FILE, 'rb') as f:
+                    stored = _decode(f.read())
+            except Exception as e:
+                print(f"조회수 기록 불러오기 실패: {e}")
+                stored = {}
+
+            for video_id, points in stored.items():
+                current = _series.get(video_id)
+                _series[video_id] = points if current is None else _merge(current, points)
+
+    _read_log()
+
+
+def _downsample(points, now):
+    """오래된 점을 구간(시간/일)마다 마지막 하나만 남기고 줄입니다."""
+    kept = array.array('q')
+    last_bucket = None
+
+    for i in range(0, len(points), 2):
+        t = points[i]
+        age = now - t
+        if age >= DAILY_AFTER:
+            bucket = ('d', t // 86400)
+        elif age >= HOURLY_AFTER:
+            bucket = ('h', t // 3600)
+        else:
+            bucket = None
+
+        # 같은 구간이면 앞의 점을 덮어씀 (구간의 마지막 점 유지)
+        if bucket is not None and bucket == last_bucket:
+            kept[-2] = t
+            kept[-1] = points[i + 1]
+        else:
+            kept.append(t)
+            kept.append(points[i + 1])
+        last_bucket = bucket
+
+    return kept
+
+
+def _compaction_due():
+    """로그에 쌓인 것이 있고 본 파일이 COMPACT_INTERVAL보다 오래됐는지 (잠금 안에서 호출)."""
+    if _log_offset <= _LOG_HEADER_SIZE:
+        return False
+    return _mtime is None or time.time() - _mtime / 1e9 >= COMPACT_INTERVAL
+
+
+def record(video_info, now=None):
+    """
+    영상 통계를 스냅샷으로 추가하고 로그에 덧붙입니다.
+    압축할 때가 되면 백그라운드 스레드에서 compact()를 실행합니다.
+
+    Args:
+        video_info: get_videos_batch 결과 ({영상ID: VideoStats})
+        now: 기록 시각 (초, 기본: 현재)
+    """
+    if not video_info:
+        return
+
+    now = int(now if now is not None else time.time())
+
+    entries = []
+    with _lock:
+        _ensure_loaded()
+
+        for video_id, info in video_info.items():
+            views = int(info.viewCount)
+            points = _series.get(video_id)
+            if points is None:
+                points = _series[video_id] = array.array('q')
+            elif now - points[-2] < MIN_INTERVAL:
+                continue
+
+            points.append(now)
+            points.append(views)
+            entries.append((video_id, views))
+
+    if not entries:
+        return
+
+    # 인코딩은 잠금 밖에서 (그동안 velocity()가 막히지 않도록)
+    data = _encode_log_record(now, entries)
+
+    with _lock:
+        _append_log(data)
+        due = not _compacting and _compaction_due()
+
+    if due:
+        threading.Thread(target=compact, daemon=True).start()
+
+
+def compact(now=None):
+    """
+    로그를 본 파일로 압축합니다 (오래된 영상 삭제 + 다운샘플링).
+    다운샘플링과 인코딩은 잠금 밖에서 복사본으로 하므로 그동안 조회는 막히지 않습니다.
+
+    Args:
+        now: 기준 시각 (초, 기본: 현재)
+    """
+    global _compacting
+
+    with _lock:
+        if _compacting:
+            return
+        _compacting = True
+
+    try:
+        _compact(int(now if now is not None else time.time()))
+    except Exception as e:
+        print(f"조회수 기록 압축 실패: {e}")
+    finally:
+        with _lock:
+            _compacting = False
+
+
+def _compact(now):
+    global _mtime, _log_gen, _log_offset
+
+    with _lock:
+        _ensure_loaded(force_check=True)
+        base_mtime, log_gen, log_offset = _mtime, _log_gen, _log_offset
+        snapshot = {video_id: array.array('q', points) for video_id, points in _series.items()}
+
+    compacted = {}
+    for video_id, points in snapshot.items():
+        if now - points[-2] >= MAX_AGE:
+            continue
+        if now - points[0] >= HOURLY_AFTER:
+            points = _downsample(points, now)
+        compacted[video_id] = points
+
+    data = _encode(compacted)
+
+    if not os.path.exists(CACHE_DIR):
+        os.makedirs(CACHE_DIR)
+    tmp_file = f"{STORE_FILE}.{os.getpid()}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+
+    with _lock:
+        _ensure_loaded(force_check=True)
+        if _mtime != base_mtime or _log_gen != log_gen:
+            # 그사이 다른 프로세스가 먼저 압축함
+            os.remove(tmp_file)
+            return
+
+        # 복사본을 뜬 뒤에 붙은 레코드만 새 로그로 옮김
+        with open(LOG_FILE, 'rb') as f:
+            f.seek(log_offset)
+            tail = f.read()
+        gen = os.urandom(8)
+        log_tmp = f"{LOG_FILE}.{os.getpid()}.tmp"
+        with open(log_tmp, 'wb') as f:
+            f.write(_LOG_MAGIC + gen + tail)
+
+        # 본 파일을 먼저 바꿔야 도중에 멈춰도 로그 레코드를 잃지 않음
+        _mtime = os.stat(tmp_file).st_mtime_ns  # 방금 쓴 파일은 다시 읽지 않음
+        os.replace(tmp_file, STORE_FILE)
+        os.replace(log_tmp, LOG_FILE)
+        _log_offset = _LOG_HEADER_SIZE + (_log_offset - log_offset)
+        _log_gen = gen
+
+        # 메모리도 압축 결과로 바꾸되, 복사본 이후에 추가된 점은 유지
+        for video_id, points in snapshot.items():
+            current = _series.get(video_id)
+            if current is None:
+                continue
+            i = len(current)
+            while i > 0 and current[i - 2] > points[-2]:
+                i -= 2
+            newer = current[i:]
+
+            kept = compacted.get(video_id)
+            if kept is None:
+                if newer:
+                    _series[video_id] = newer
+                else:
+                    del _series[video_id]
+            else:
+                kept.extend(newer)
+                _series[video_id] = kept
+
+
+def velocity(video_id, published_at=None):
+    """
+    최근 두 스냅샷 사이의 시간당 조회수를 계산합니다.
+    스냅샷이 하나뿐이면 게시 시각(조회수 0)을 이전 스냅샷으로 봅니다.
+
+    Args:
+        video_id: 영상 ID
+        published_at: 게시 시각 (ISO 문자열, 선택)
+
+    Returns:
+        float: 시간당 조회수 (계산할 수 없으면 None)
+    """
+    with _lock:
+        _ensure_loaded()
+        points = _series.get(video_id)
+        if not points:
+            return None
+        last_t, last_v = points[-2], points[-1]
+        if len(points) >= 4:
+            prev_t, prev_v = points[-4], points[-3]
+        else:
+            prev_t, prev_v = None, 0
+
+    if prev_t is None:
+        if not published_at:
+            return None
+        try:
+            published = datetime.fromisoformat(published_at)
+        except ValueError:
+            return None
+        # RSS 게시 시각은 시간대 정보가 빠진 UTC (로컬 시각으로 해석하지 않음)
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        prev_t = published.timestamp()
+
+    hours = (last_t - prev_t) / 3600
+    if hours <= 0:
+        return None
+    return (last_v - prev_v) / hours
+
+
+def get_history(video_id):
+    """영상의 스냅샷 목록을 [(시각, 조회수), ...]로 반환합니다."""
+    with _lock:
+        _ensure_loaded()
+        points = _series.get(video_id)
+        if not points:
+            return []
+        return [(points[i], points[i + 1]) for i in range(0, len(points), 2)]
+
+
+def get_store_info():
+    """저장 상태 정보를 반환합니다."""
+    with _lock:
+        _ensure_loaded()
+        return {
+            'videos': len(_series),
+            'snapshots': sum(len(points) // 2 for points in _series.values()),
+            'fileBytes': sum(os.path.getsize(path) for path in (STORE_FILE, LOG_FILE) if os.path.exists(path))
+        }
@@ -0,0 +1,98 @@
+"""
+구독 채널 인덱스 모듈
+- 구독자 수 내림차순 정렬 유지
+- 채널명 접두사/부분 문자열 검색
+- 페이지 단위 조회
+"""
+
+import bisect
+
+
+def _normalize(text):
+    """검색용으로 문자열을 정규화합니다."""
+    return (text or '').strip().casefold()
+
+
+class SubscriptionIndex:
+    """구독 목록을 구독자 수 순으로 정렬해 두고 검색/페이지 조회를 제공합니다."""
+
+    def __init__(self, subscriptions=None):
+        self.rebuild(subscriptions or [])
+
+    def rebuild(self, subscriptions):
+        """구독 목록으로 인덱스를 다시 만듭니다."""
+        # 구독자 수 내림차순 (순위 = 리스트 위치)
+        self._by_count = sorted(
+            subscriptions,
+            key=lambda sub: sub.subscriberCount or 0,
+            reverse=True
+        )
+        self._titles = [_normalize(sub.title) for sub in self._by_count]
+
+        # 접두사 검색용: (정규화된 채널명, 순위) 정렬 목록
+        self._prefix_keys = sorted(
+            (title, rank) for rank, title in enumerate(self._titles)
+        )
+
+        # 스크롤 중 같은 검색어로 반복 조회되므로 마지막 결과만 보관
+        self._last_query = None
+        self._last_ranks = None
+
+    def __len__(self):
+        return len(self._by_count)
+
+    def search(self, query):
+        """
+        검색어에 맞는 채널의 순위 목록을 반환합니다.
+
+        접두사 일치 채널을 먼저, 그 외 부분 문자열 일치 채널을 뒤에 두며
+        각 그룹 안에서는 구독자 수 순서를 유지합니다.
+
+        Args:
+            query: 검색어
+
+        Returns:
+            list: 순위 리스트 (검색어가 비어 있으면 None)
+        """
+        query = _normalize(query)
+        if not query:
+            return None
+
+        if query == self._last_query:
+            return self._last_ranks
+
+        # 접두사 일치: 정렬 목록에서 이진 탐색 (접두사로 시작하는 문자열은 모두 query + 최대 문자보다 작음)
+        lo = bisect.bisect_left(self._prefix_keys, (query,))
+        hi = bisect.bisect_right(self._prefix_keys, (query + '\U0010ffff',))
+        prefix_ranks = sorted(rank for _, rank in self._prefix_keys[lo:hi])
+
+        # 부분 문자열 일치: 나머지 채널 순차 검사
+        prefix_set = set(prefix_ranks)
+        substring_ranks = [
+            rank for rank, title in enumerate(self._titles)
+            if rank not in prefix_set and query in title
+        ]
+
+        self._last_query = query
+        self._last_ranks = prefix_ranks + substring_ranks
+        return self._last_ranks
+
+    def page(self, offset=0, limit=100, query=''):
+        """
+        구독 목록(Subscription)의 일부를 반환합니다.
+
+        Args:
+            offset: 시작 위치
+            limit: 최대 개수
+            query: 검색어 (비어 있으면 전체)
+
+        Returns:
+            tuple: (구독 리스트, 전체 개수)
+        """
+        ranks = self.search(query)
+
+        if ranks is None:
+            return self._by_count[offset:offset + limit], len(self._by_count)
+
+        items = [self._by_count[rank] for rank in ranks[offset:offset + limit]]
+        return items, len(ranks)
@@ -0,0 +1,267 @@
+"""
+썸네일 캐시 모듈
+- 썸네일 이미지를 디스크에 캐싱 (용량 제한 LRU)
+- 결과 페이지 썸네일 동시 미리 받기
+- 원본 URL을 로컬 프록시 URL로 변환 (캐시에 있으면 Eel 서버에서 제공, 없으면 원본으로 리디렉트)
+"""
+
+import os
+import hashlib
+import threading
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from cache_manager import CACHE_DIR
+import metrics
+
+THUMBNAIL_DIR = os.path.join(CACHE_DIR, 'thumbnails')
+MAX_CACHE_BYTES = 200 * 1024 * 1024  # 200MB
+PREFETCH_WORKERS = 8
+MAX_URLS = 20000  # 기억하는 원본 URL 수 (결과 몇 페이지 분량, 오래된 것부터 잊음)
+FETCH_TIMEOUT = 10
+
+# 로컬 프록시 경로와 브라우저 캐시 유지 시간 (키가 URL 해시이므로 내용 불변)
+LOCAL_URL_PREFIX = '/thumbnails/'
+CACHE_MAX_AGE = 365 * 24 * 3600
+
+_lock = threading.Lock()
+_urls = OrderedDict()  # 키 -> 원본 URL (최근 등록 순, MAX_URLS개까지)
+_entries = None     # 키 -> 파일 크기 (오래 사용하지 않은 순)
+_total_bytes = 0
+_inflight = {}      # 키 -> 다운로드 완료 이벤트
+_executor = None
+
+
+def thumbnail_key(url):
+    """원본 URL로 캐시 키를 만듭니다."""
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()[:24]
+
+
+def _is_valid_key(key):
+    return len(key) == 24 and all(c in '0123456789abcdef' for c in key)
+
+
+def _path(key):
+    return os.path.join(THUMBNAIL_DIR, key + '.jpg')
+
+
+def _ensure_index():
+    """디스크의 캐시 파일로 LRU 인덱스를 만듭니다 (최초 1회, 잠금 안에서 호출)."""
+    global _entries, _total_bytes
+
+    if _entries is not None:
+        return
+
+    _entries = OrderedDict()
+    _total_bytes = 0
+
+    if not os.path.exists(THUMBNAIL_DIR):
+        os.makedirs(THUMBNAIL_DIR)
+        return
+
+    files = []
+    for entry in os.scandir(THUMBNAIL_DIR):
+        if entry.is_file() and entry.name.endswith('.jpg'):
+            stat = entry.stat()
+            files.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+
+    # 파일 수정 시각 = 마지막 사용 시각
+    for _, key, size in sorted(files):
+        _entries[key] = size
+        _total_bytes += size
+
+
+def _evict():
+    """용량을 넘으면 가장 오래 사용하지 않은 썸네일부터 삭제합니다 (잠금 안에서 호출)."""
+    global _total_bytes
+
+    while _total_bytes > MAX_CACHE_BYTES and _entries:
+        key, size = _entries.popitem(last=False)
+        _total_bytes -= size
+        try:
+            os.remove(_path(key))
+        except OSError:
+            pass
+
+
+def _lookup(key):
+    """캐시에 있으면 사용 기록을 갱신하고 경로를 반환합니다."""
+    with _lock:
+        _ensure_index()
+        if key not in _entries:
+            return None
+        _entries.move_to_end(key)
+
+    path = _path(key)
+    try:
+        os.utime(path)
+    except OSError:
+        return None
+    return path
+
+
+def _download(key):
+    """원본 URL에서 썸네일을 받아 캐시에 저장합니다."""
+    global _total_bytes
+
+    with _lock:
+        url = _urls.get(key)
+    if not url:
+        return None
+
+    try:
+        with urllib.request.urlopen(url, timeout=FETCH_TIMEOUT) as response:
+            if response.status != 200:
+                return None
+            data = response.read()
+    except Exception as e:
+        print(f"썸네일 다운로드 실패 ({url}): {e}")
+        metrics.record_error('thumbnail')
+        return None
+
+    metrics.record_http(url, len(data))
+
+    path = _path(key)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+    with _lock:
+        _ensure_index()
+        _total_bytes += len(data) - _entries.pop(key, 0)
+        _entries[key] = len(data)
+        _evict()
+
+    return path
+
+
+def _fetch(key):
+    """캐시에 없으면 받아옵니다. 같은 키의 동시 요청은 한 번만 다운로드합니다."""
+    path = _lookup(key)
+    if path:
+        return path
+
+    with _lock:
+        event = _inflight.get(key)
+        owner = event is None
+        if owner:
+            event = _inflight[key] = threading.Event()
+
+    if not owner:
+        event.wait(FETCH_TIMEOUT)
+        return _lookup(key)
+
+    try:
+        return _download(key)
+    finally:
+        with _lock:
+            _inflight.pop(key, None)
+        event.set()
+
+
+def local_url(url):
+    """
+    원본 썸네일 URL을 로컬 프록시 URL로 변환합니다.
+
+    Args:
+        url: 원본 썸네일 URL
+
+    Returns:
+        str: '/thumbnails/<키>.jpg' (url이 비어 있으면 그대로)
+    """
+    if not url or url.startswith(LOCAL_URL_PREFIX):
+        return url
+
+    key = thumbnail_key(url)
+    with _lock:
+        _urls[key] = url
+        _urls.move_to_end(key)
+        if len(_urls) > MAX_URLS:
+            _urls.popitem(last=False)
+    return f"{LOCAL_URL_PREFIX}{key}.jpg"
+
+
+def get_thumbnail_path(key):
+    """
+    캐시된 썸네일 파일 경로를 반환합니다 (다운로드하지 않음).
+
+    Args:
+        key: 캐시 키 (local_url로 등록된 것)
+
+    Returns:
+        str: 파일 경로 또는 None
+    """
+    if not _is_valid_key(key):
+        return None
+    return _lookup(key)
+
+
+def source_url(key):
+    """
+    캐시에 없는 썸네일의 원본 URL을 반환하고 백그라운드 다운로드를 예약합니다.
+
+    Args:
+        key: 캐시 키 (local_url로 등록된 것)
+
+    Returns:
+        str: 원본 URL 또는 None (등록되지 않은 키)
+    """
+    if not _is_valid_key(key):
+        return None
+    with _lock:
+        url = _urls.get(key)
+    if url:
+        _submit([key])
+    return url
+
+
+def _submit(keys):
+    """캐시에도 없고 받는 중도 아닌 키들을 미리 받기 풀에 넣습니다."""
+    global _executor
+
+    with _lock:
+        _ensure_index()
+        keys = [key for key in keys if key not in _entries and key not in _inflight]
+        if not keys:
+            return
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+
+    for key in keys:
+        _executor.submit(_fetch, key)
+
+
+def prefetch(urls):
+    """썸네일들을 백그라운드에서 동시에 미리 받아 둡니다."""
+    keys = []
+    for url in urls:
+        if url:
+            local_url(url)
+            keys.append(thumbnail_key(url))
+    _submit(keys)
+
+
+def clear():
+    """썸네일 캐시를 모두 삭제합니다."""
+    global _entries, _total_bytes
+
+    with _lock:
+        if os.path.exists(THUMBNAIL_DIR):
+            for entry in os.scandir(THUMBNAIL_DIR):
+                if entry.is_file():
+                    os.remove(entry.path)
+        _entries = None
+        _total_bytes = 0
+
+
+def get_cache_info():
+    """썸네일 캐시 상태 정보를 반환합니다."""
+    with _lock:
+        _ensure_index()
+        return {
+            'count': len(_entries),
+            'bytes': _total_bytes,
+            'maxBytes': MAX_CACHE_BYTES
+        }
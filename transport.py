@@ -0,0 +1,167 @@
+"""
+HTTP 전송 계층 모듈
+- Google API 클라이언트용 스레드 안전 HTTP 객체 (httplib2.Http 대체)
+- 모든 스레드가 keep-alive 연결 풀을 공유
+- 연결 재사용 통계 (공유 어댑터를 지나는 모든 요청과 새 연결 수를 직접 셈)
+"""
+
+import threading
+
+import metrics
+
+POOL_CONNECTIONS = 4   # 호스트별 연결 풀 개수
+POOL_MAXSIZE = 16      # 풀당 최대 연결 수 (동시 작업 수 이상)
+TIMEOUT = 30
+
+_lock = threading.Lock()
+_adapter = None
+_requests = 0      # 공유 어댑터로 보낸 요청 수 (API, 토큰 갱신 모두)
+_connections = 0   # 새로 연 연결 수 (풀이 LRU에서 밀려나도 유지)
+
+
+def _count_request():
+    global _requests
+    with _lock:
+        _requests += 1
+
+
+def _count_connection():
+    global _connections
+    with _lock:
+        _connections += 1
+
+
+def _make_adapter():
+    """요청 수와 새 연결 수를 세는 어댑터를 만듭니다."""
+    from requests.adapters import HTTPAdapter
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class CountingHTTPConnectionPool(HTTPConnectionPool):
+        def _new_conn(self):
+            _count_connection()
+            return super()._new_conn()
+
+    class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+        def _new_conn(self):
+            _count_connection()
+            return super()._new_conn()
+
+    class CountingAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                'http': CountingHTTPConnectionPool,
+                'https': CountingHTTPSConnectionPool
+            }
+
+        def send(self, request, **kwargs):
+            _count_request()
+            return super().send(request, **kwargs)
+
+    return CountingAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=0
+    )
+
+
+def _get_adapter():
+    """모든 세션이 공유하는 연결 풀 어댑터를 반환합니다 (urllib3 풀은 스레드 안전)."""
+    global _adapter
+
+    with _lock:
+        if _adapter is None:
+            _adapter = _make_adapter()
+        return _adapter
+
+
+def mount(session):
+    """requests 세션이 공유 연결 풀을 쓰도록 어댑터를 연결합니다."""
+    adapter = _get_adapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def new_session():
+    """공유 연결 풀을 쓰는 새 requests 세션을 반환합니다."""
+    import requests
+    return mount(requests.Session())
+
+
+class PooledHttp:
+    """
+    googleapiclient에 httplib2.Http 대신 넘기는 HTTP 객체.
+
+    requests 세션은 스레드마다 따로 만들고(자격 증명이 있으면 AuthorizedSession),
+    실제 연결 풀은 공유 어댑터를 사용합니다.
+    """
+
+    def __init__(self, credentials=None, timeout=TIMEOUT):
+        self.credentials = credentials
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self):
+        session = getattr(self._local, 'session', None)
+
+        if session is None:
+            if self.credentials is not None:
+                from google.auth.transport.requests import AuthorizedSession
+                session = mount(AuthorizedSession(self.credentials))
+            else:
+                session = new_session()
+            self._local.session = session
+
+        return session
+
+    def request(self, uri, method='GET', body=None, headers=None,
+                redirections=5, connection_type=None):
+        """httplib2.Http.request와 같은 형식으로 (응답, 본문)을 반환합니다."""
+        import httplib2
+
+        response = self._session().request(
+            method, uri,
+            data=body,
+            headers=headers,
+            timeout=self.timeout,
+            allow_redirects=redirections > 0
+        )
+
+        metrics.record_http(uri, len(response.content))
+
+        # requests가 이미 압축을 풀었으므로 인코딩/길이 헤더는 제외
+        info = {
+            key.lower(): value for key, value in response.headers.items()
+            if key.lower() not in ('content-encoding', 'content-length')
+        }
+        info['status'] = str(response.status_code)
+
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+
+    def close(self):
+        """현재 스레드의 세션을 버립니다 (공유 연결 풀은 닫지 않음)."""
+        self._local.session = None
+
+
+def get_stats():
+    """
+    연결 재사용 통계를 반환합니다.
+
+    Returns:
+        dict: {'requests': 요청 수, 'connections': 새로 연결한 수,
+               'reused': 재사용 요청 수, 'reuseRatio': 재사용 비율}
+    """
+    with _lock:
+        requests_count = _requests
+        connections = _connections
+
+    reused = max(0, requests_count - connections)
+    return {
+        'requests': requests_count,
+        'connections': connections,
+        'reused': reused,
+        'reuseRatio': round(reused / requests_count, 3) if requests_count else 0
+    }
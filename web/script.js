@@ -1,7 +1,7 @@
 // 전역 상태
 let isLoggedIn = false;
 let subscriptionsLoaded = false;
-let currentSubscriptions = [];
+let subscriptionsCount = 0;
 
 // DOM 요소
 const loginSection = document.getElementById('login-section');
@@ -13,6 +13,12 @@ const btnLoadSubs = document.getElementById('btn-load-subs');
 const btnViewSubs = document.getElementById('btn-view-subs');
 const btnRefreshSubs = document.getElementById('btn-refresh-subs');
 const btnSearch = document.getElementById('btn-search');
+const accountSelects = document.querySelectorAll('.account-select');
+const btnAddAccounts = document.querySelectorAll('.btn-add-account');
+const searchAllAccounts = document.getElementById('search-all-accounts');
+const savedSearchSelect = document.getElementById('saved-search-select');
+const btnSaveSearch = document.getElementById('btn-save-search');
+const btnDeleteSearch = document.getElementById('btn-delete-search');
 const configStatus = document.getElementById('config-status');
 const subsInfo = document.getElementById('subs-info');
 const progressSection = document.getElementById('progress-section');
@@ -22,12 +28,22 @@ const resultsSection = document.getElementById('results-section');
 const resultsCount = document.getElementById('results-count');
 const resultsStats = document.getElementById('results-stats');
 const resultsList = document.getElementById('results-list');
+const resultsSort = document.getElementById('results-sort');
+
+// 검색 결과 행 높이 (.video-item 높이 + 간격)
+const RESULT_ROW_HEIGHT = 90;
+const RESULT_PAGE_SIZE = 100;
 
 // 구독 목록 모달
 const subsModal = document.getElementById('subs-modal');
 const btnCloseSubsModal = document.getElementById('btn-close-subs-modal');
 const subsModalCount = document.getElementById('subs-modal-count');
 const subsList = document.getElementById('subs-list');
+const subsSearch = document.getElementById('subs-search');
+
+// 구독 채널 행 높이 (.subs-item 높이 + 간격)
+const SUBS_ROW_HEIGHT = 58;
+const SUBS_PAGE_SIZE = 200;
 
 // API 설정 모달
 const setupModal = document.getElementById('setup-modal');
@@ -37,12 +53,194 @@ const inputClientId = document.getElementById('input-client-id');
 const inputClientSecret = document.getElementById('input-client-secret');
 const inputApiKey = document.getElementById('input-api-key');
 
+// 가상 스크롤 목록: 화면에 보이는 행만 렌더링하고 데이터는 페이지 단위로 요청
+class VirtualList {
+    constructor(container, options) {
+        this.container = container;
+        this.rowHeight = options.rowHeight;
+        this.pageSize = options.pageSize || 100;
+        this.fetchPage = options.fetchPage;
+        this.renderRow = options.renderRow;
+        this.emptyHtml = options.emptyHtml || '';
+        this.overscan = options.overscan || 5;
+        this.maxPages = options.maxPages || 10;
+
+        this.total = 0;
+        this.pages = new Map();
+        this.pending = new Set();
+        this.generation = 0;
+        this.frame = null;
+
+        this.spacer = document.createElement('div');
+        this.spacer.className = 'virtual-spacer';
+        this.content = document.createElement('div');
+        this.content.className = 'virtual-content';
+        this.spacer.appendChild(this.content);
+
+        this.container.addEventListener('scroll', () => this.scheduleRender());
+        window.addEventListener('resize', () => this.scheduleRender());
+    }
+
+    // 목록을 처음부터 다시 구성
+    reset(total) {
+        this.container.scrollTop = 0;
+        this.refresh(total);
+    }
+
+    // 스크롤 위치를 유지한 채 데이터만 다시 요청
+    refresh(total) {
+        this.generation++;
+        this.total = total;
+        this.pages.clear();
+        this.pending.clear();
+
+        if (total === 0) {
+            this.container.innerHTML = this.emptyHtml;
+            return;
+        }
+
+        if (this.spacer.parentNode !== this.container) {
+            this.container.innerHTML = '';
+            this.container.appendChild(this.spacer);
+        }
+        this.spacer.style.height = (total * this.rowHeight) + 'px';
+        this.render();
+    }
+
+    scheduleRender() {
+        if (this.frame || this.total === 0) return;
+        this.frame = requestAnimationFrame(() => {
+            this.frame = null;
+            this.render();
+        });
+    }
+
+    render() {
+        const scrollTop = this.container.scrollTop;
+        const viewHeight = this.container.clientHeight;
+        const first = Math.max(0, Math.floor(scrollTop / this.rowHeight) - this.overscan);
+        const last = Math.min(this.total, Math.ceil((scrollTop + viewHeight) / this.rowHeight) + this.overscan);
+
+        const rows = [];
+        for (let i = first; i < last; i++) {
+            const item = this.getItem(i);
+            rows.push(item ? this.renderRow(item, i) : '<div class="virtual-placeholder"></div>');
+        }
+
+        this.content.style.transform = `translateY(${first * this.rowHeight}px)`;
+        this.content.innerHTML = rows.join('');
+        this.evictPages(first, last);
+    }
+
+    getItem(index) {
+        const pageIndex = Math.floor(index / this.pageSize);
+        const page = this.pages.get(pageIndex);
+
+        if (!page) {
+            this.loadPage(pageIndex);
+            return null;
+        }
+        return page[index - pageIndex * this.pageSize];
+    }
+
+    async loadPage(pageIndex) {
+        if (this.pending.has(pageIndex)) return;
+        this.pending.add(pageIndex);
+
+        const generation = this.generation;
+        try {
+            const items = await this.fetchPage(pageIndex * this.pageSize, this.pageSize);
+            if (generation !== this.generation) return;
+            this.pages.set(pageIndex, items);
+            this.scheduleRender();
+        } catch (e) {
+            console.error('목록 페이지 로드 실패:', e);
+        } finally {
+            if (generation === this.generation) {
+                this.pending.delete(pageIndex);
+            }
+        }
+    }
+
+    // 화면에서 먼 페이지는 메모리에서 제거
+    evictPages(first, last) {
+        if (this.pages.size <= this.maxPages) return;
+
+        const firstPage = Math.floor(first / this.pageSize);
+        const lastPage = Math.floor(last / this.pageSize);
+        for (const pageIndex of [...this.pages.keys()]) {
+            if (pageIndex < firstPage - 1 || pageIndex > lastPage + 1) {
+                this.pages.delete(pageIndex);
+            }
+        }
+    }
+}
+
+const resultsView = new VirtualList(resultsList, {
+    rowHeight: RESULT_ROW_HEIGHT,
+    pageSize: RESULT_PAGE_SIZE,
+    emptyHtml: '<p style="text-align:center;color:#666;padding:40px;">조건에 맞는 영상이 없습니다.</p>',
+    fetchPage: async (offset, limit) => {
+        const page = await eel.get_results_page(offset, limit, resultsSort.value)();
+        return page.videos;
+    },
+    renderRow: renderVideoItem
+});
+
+const subsView = new VirtualList(subsList, {
+    rowHeight: SUBS_ROW_HEIGHT,
+    pageSize: SUBS_PAGE_SIZE,
+    emptyHtml: '<p style="text-align:center;color:#666;padding:20px;">구독 채널이 없습니다.</p>',
+    fetchPage: async (offset, limit) => {
+        const page = await eel.get_subscriptions_page(offset, limit, subsSearch.value)();
+        return page.subscriptions;
+    },
+    renderRow: renderSubsItem
+});
+
 // 초기화
 document.addEventListener('DOMContentLoaded', async () => {
+    await loadAccounts();
+    await loadSavedSearches();
     await checkConfigAndAuth();
     setupEventListeners();
 });
 
+// 계정 목록
+let accountNames = [];
+
+async function loadAccounts() {
+    const result = await eel.get_accounts()();
+    accountNames = result.accounts;
+
+    const options = accountNames.map(name =>
+        `<option value="${escapeHtml(name)}">${escapeHtml(name)}</option>`
+    ).join('');
+    accountSelects.forEach(select => {
+        select.innerHTML = options;
+        select.value = result.current;
+    });
+}
+
+async function switchAccount(name) {
+    const result = await eel.switch_account(name)();
+    if (!result.success) {
+        alert(result.error);
+        await loadAccounts();
+        return;
+    }
+
+    subscriptionsLoaded = false;
+    subscriptionsCount = 0;
+    btnSearch.disabled = true;
+    resultsSection.style.display = 'none';
+    btnViewSubs.style.display = 'none';
+    btnRefreshSubs.style.display = 'none';
+
+    await loadAccounts();
+    await checkConfigAndAuth();
+}
+
 async function checkConfigAndAuth() {
     const status = await eel.get_config_status()();
 
@@ -100,15 +298,26 @@ function setupEventListeners() {
 
     // 로그아웃
     btnLogout.addEventListener('click', async () => {
-        if (confirm('로그아웃하시겠습니까? 캐시도 함께 삭제됩니다.')) {
+        if (confirm('로그아웃하시겠습니까? 이 계정의 구독 목록 캐시도 삭제됩니다.')) {
             await eel.do_logout()();
             showLoginSection();
             subscriptionsLoaded = false;
-            currentSubscriptions = [];
+            subscriptionsCount = 0;
             await checkConfigAndAuth();
         }
     });
 
+    // 계정 전환/추가
+    accountSelects.forEach(select => {
+        select.addEventListener('change', () => switchAccount(select.value));
+    });
+    btnAddAccounts.forEach(btn => {
+        btn.addEventListener('click', () => {
+            const name = prompt('새 계정 이름 (영문, 숫자, _, -)');
+            if (name) switchAccount(name.trim());
+        });
+    });
+
     // 구독 채널 불러오기
     btnLoadSubs.addEventListener('click', () => loadSubscriptions(false));
     btnRefreshSubs.addEventListener('click', () => loadSubscriptions(true));
@@ -120,18 +329,37 @@ function setupEventListeners() {
         if (e.target === subsModal) closeSubsModal();
     });
 
+    // 채널명 검색 (입력이 멈추면 조회)
+    let subsSearchTimer = null;
+    subsSearch.addEventListener('input', () => {
+        clearTimeout(subsSearchTimer);
+        subsSearchTimer = setTimeout(() => renderSubsList(true), 150);
+    });
+
     // 필터 타입 변경
     document.querySelectorAll('input[name="filter-type"]').forEach(radio => {
         radio.addEventListener('change', (e) => {
-            const isNormal = e.target.value === 'normal';
-            document.getElementById('normal-filter').style.display = isNormal ? 'flex' : 'none';
-            document.getElementById('mutation-filter').style.display = isNormal ? 'none' : 'flex';
+            const filterType = e.target.value;
+            document.getElementById('normal-filter').style.display = filterType === 'normal' ? 'flex' : 'none';
+            document.getElementById('mutation-filter').style.display = filterType === 'mutation' ? 'flex' : 'none';
+            document.getElementById('velocity-filter').style.display = filterType === 'velocity' ? 'flex' : 'none';
         });
     });
 
     // 검색
     btnSearch.addEventListener('click', searchVideos);
 
+    // 저장된 검색
+    savedSearchSelect.addEventListener('change', () => {
+        btnDeleteSearch.style.display = savedSearchSelect.value ? 'inline-block' : 'none';
+        if (savedSearchSelect.value) openSavedSearch(savedSearchSelect.value);
+    });
+    btnSaveSearch.addEventListener('click', saveSearch);
+    btnDeleteSearch.addEventListener('click', deleteSavedSearch);
+
+    // 결과 정렬 변경
+    resultsSort.addEventListener('change', () => resultsView.reset(resultsView.total));
+
     // API 설정 모달
     btnSetup.addEventListener('click', openSetupModal);
     btnCloseSetupModal.addEventListener('click', closeSetupModal);
@@ -208,10 +436,10 @@ async function loadSubscriptions(forceRefresh) {
         const result = await eel.load_subscriptions(forceRefresh)();
 
         if (result.success) {
-            currentSubscriptions = result.subscriptions;
+            subscriptionsCount = result.count;
             subscriptionsLoaded = true;
 
-            subsInfo.textContent = `${currentSubscriptions.length}개` +
+            subsInfo.textContent = `${subscriptionsCount}개` +
                 (result.fromCache ? ' (캐시)' : '');
             subsInfo.classList.add('loaded');
 
@@ -235,36 +463,37 @@ async function loadSubscriptions(forceRefresh) {
 // 구독 목록 모달
 function openSubsModal() {
     subsModal.style.display = 'flex';
-    renderSubsList();
+    subsSearch.value = '';
+    renderSubsList(true);
 }
 
 function closeSubsModal() {
     subsModal.style.display = 'none';
 }
 
-function renderSubsList() {
-    subsModalCount.textContent = `(${currentSubscriptions.length}개)`;
+// 서버 인덱스에서 개수를 받아 가상 목록을 갱신
+async function renderSubsList(resetScroll) {
+    const page = await eel.get_subscriptions_page(0, 0, subsSearch.value)();
+    subsModalCount.textContent = `(${page.count}개)`;
 
-    if (currentSubscriptions.length === 0) {
-        subsList.innerHTML = '<p style="text-align:center;color:#666;padding:20px;">구독 채널이 없습니다.</p>';
-        return;
+    if (resetScroll) {
+        subsView.reset(page.total);
+    } else {
+        subsView.refresh(page.total);
     }
+}
 
-    // 구독자수 내림차순 정렬
-    const sortedSubs = [...currentSubscriptions].sort((a, b) =>
-        (b.subscriberCount || 0) - (a.subscriberCount || 0)
-    );
-
-    subsList.innerHTML = sortedSubs.map(sub => `
+function renderSubsItem(sub) {
+    return `
         <div class="subs-item" data-channel-id="${sub.id}">
-            <img src="${sub.thumbnail}" alt="${escapeHtml(sub.title)}">
+            <img src="${sub.thumbnail}" alt="${escapeHtml(sub.title)}" loading="lazy">
             <div class="subs-item-info">
                 <div class="subs-item-title">${escapeHtml(sub.title)}</div>
                 <div class="subs-item-count">구독자 ${formatSubscriberCount(sub.subscriberCount)}</div>
             </div>
             <button class="btn-unsubscribe" onclick="unsubscribeChannel('${sub.id}', this)">구독취소</button>
         </div>
-    `).join('');
+    `;
 }
 
 async function unsubscribeChannel(channelId, btn) {
@@ -279,16 +508,14 @@ async function unsubscribeChannel(channelId, btn) {
         const result = await eel.unsubscribe_channel(channelId)();
 
         if (result.success) {
-            // 로컬 목록에서 제거
-            currentSubscriptions = currentSubscriptions.filter(s => s.id !== channelId);
+            subscriptionsCount--;
 
-            // UI 업데이트
+            // UI 업데이트 (서버 인덱스에서 이미 제거됨)
             const item = btn.closest('.subs-item');
             item.style.opacity = '0.5';
             setTimeout(() => {
-                item.remove();
-                subsModalCount.textContent = `(${currentSubscriptions.length}개)`;
-                subsInfo.textContent = `${currentSubscriptions.length}개 채널 로드됨 (캐시)`;
+                renderSubsList(false);
+                subsInfo.textContent = `${subscriptionsCount}개 채널 로드됨 (캐시)`;
             }, 300);
         } else {
             alert('구독 취소 실패: ' + result.error);
@@ -303,21 +530,32 @@ async function unsubscribeChannel(channelId, btn) {
     }
 }
 
-async function searchVideos() {
-    if (!subscriptionsLoaded) {
-        alert('먼저 구독 채널을 불러와주세요.');
-        return;
-    }
-
+function currentFilterConfig() {
     const filterType = document.querySelector('input[name="filter-type"]:checked').value;
     const filterConfig = {
         filterType: filterType,
         maxSubscribers: parseInt(document.getElementById('max-subscribers').value) || 10000,
         minViews: parseInt(document.getElementById('min-views').value) || 10000,
         daysWithin: parseInt(document.getElementById('days-within').value) || 15,
-        mutationRatio: parseFloat(document.getElementById('mutation-ratio').value) || 1.0
+        mutationRatio: parseFloat(document.getElementById('mutation-ratio').value) || 1.0,
+        minVelocity: parseFloat(document.getElementById('min-velocity').value) || 100
     };
 
+    // 모든 계정의 구독 채널을 합쳐서 검색 (겹치는 채널은 한 번만 조회)
+    if (searchAllAccounts.checked) {
+        filterConfig.accounts = accountNames;
+    }
+    return filterConfig;
+}
+
+async function searchVideos() {
+    if (!subscriptionsLoaded) {
+        alert('먼저 구독 채널을 불러와주세요.');
+        return;
+    }
+
+    const filterConfig = currentFilterConfig();
+
     btnSearch.disabled = true;
     progressSection.style.display = 'block';
     resultsSection.style.display = 'none';
@@ -330,7 +568,7 @@ async function searchVideos() {
         progressSection.style.display = 'none';
 
         if (result.success) {
-            displayResults(result.videos, result.stats);
+            displayResults(result.total, result.stats, result.sortKey);
         } else {
             alert('검색 실패: ' + result.error);
         }
@@ -343,6 +581,63 @@ async function searchVideos() {
     btnSearch.disabled = false;
 }
 
+// 저장된 검색 (결과는 refresher 데몬이 미리 갱신)
+async function loadSavedSearches() {
+    const result = await eel.get_saved_searches()();
+    savedSearchSelect.innerHTML = '<option value="">저장된 검색</option>' + result.searches.map(name =>
+        `<option value="${escapeHtml(name)}">${escapeHtml(name)}</option>`
+    ).join('');
+    btnDeleteSearch.style.display = 'none';
+}
+
+async function saveSearch() {
+    const name = prompt('검색 이름 (영문, 숫자, _, -)');
+    if (!name) return;
+
+    const result = await eel.save_search(name.trim(), currentFilterConfig())();
+    if (!result.success) {
+        alert(result.error);
+        return;
+    }
+    await loadSavedSearches();
+    savedSearchSelect.value = name.trim();
+    btnDeleteSearch.style.display = 'inline-block';
+}
+
+async function deleteSavedSearch() {
+    const name = savedSearchSelect.value;
+    if (!name || !confirm(`'${name}' 검색을 삭제하시겠습니까?`)) return;
+
+    await eel.delete_saved_search(name)();
+    await loadSavedSearches();
+}
+
+async function openSavedSearch(name) {
+    progressSection.style.display = 'block';
+    resultsSection.style.display = 'none';
+    progressFill.style.width = '0%';
+    progressText.textContent = '저장된 검색 불러오는 중...';
+
+    try {
+        const result = await eel.open_saved_search(name)();
+
+        progressSection.style.display = 'none';
+
+        if (result.success) {
+            displayResults(result.total, result.stats, result.sortKey);
+            if (result.updatedAt) {
+                resultsStats.textContent += ` (${new Date(result.updatedAt).toLocaleString()} 갱신)`;
+            }
+        } else {
+            alert('검색 실패: ' + result.error);
+        }
+    } catch (e) {
+        progressSection.style.display = 'none';
+        alert('오류가 발생했습니다.');
+        console.error(e);
+    }
+}
+
 // Python에서 호출하는 진행률 업데이트 함수
 eel.expose(update_progress);
 function update_progress(text, percent) {
@@ -350,30 +645,21 @@ function update_progress(text, percent) {
     progressText.textContent = text;
 }
 
-function displayResults(videos, stats, filterType) {
+function displayResults(total, stats, sortKey) {
     resultsSection.style.display = 'block';
-    resultsCount.textContent = `(${videos.length}개)`;
+    resultsCount.textContent = `(${total}개)`;
     resultsStats.textContent = `전체 ${stats.total}개 중 ${stats.filtered}개 필터됨`;
 
-    if (videos.length === 0) {
-        resultsList.innerHTML = '<p style="text-align:center;color:#666;padding:40px;">조건에 맞는 영상이 없습니다.</p>';
-        return;
-    }
-
-    // 정렬: 일반=조회수, 돌연변이=지수
-    const currentFilter = document.querySelector('input[name="filter-type"]:checked').value;
-    const sortedVideos = [...videos].sort((a, b) => {
-        if (currentFilter === 'normal') {
-            return b.viewCount - a.viewCount;
-        } else {
-            return b.ratio - a.ratio;
-        }
-    });
+    // 정렬: 일반=조회수, 돌연변이=지수 (서버에서 정렬)
+    resultsSort.value = sortKey;
+    resultsView.reset(total);
+}
 
-    resultsList.innerHTML = sortedVideos.map(video => `
+function renderVideoItem(video) {
+    return `
         <div class="video-item" onclick="window.open('https://www.youtube.com/watch?v=${video.videoId}', '_blank')">
             <div class="video-thumbnail">
-                <img src="${video.thumbnail}" alt="${escapeHtml(video.title)}">
+                <img src="${video.thumbnail}" alt="${escapeHtml(video.title)}" loading="lazy">
                 <span class="video-duration">${formatDuration(video.duration)}</span>
             </div>
             <div class="video-info">
@@ -387,12 +673,14 @@ function displayResults(videos, stats, filterType) {
                     <span class="separator">|</span>
                     <span>돌연변이지수 <span class="highlight">${video.ratio}x</span></span>
                     <span class="separator">|</span>
+                    <span>시간당 ${formatNumber(Math.round(video.velocity))}회</span>
+                    <span class="separator">|</span>
                     <span>${formatDate(video.publishedAt)}</span>
                     <button class="btn-copy" onclick="copyTitle(event, '${escapeHtml(video.title).replace(/'/g, "\\'")}')">복사</button>
                 </div>
             </div>
         </div>
-    `).join('');
+    `;
 }
 
 // 유틸리티 함수
@@ -3,9 +3,55 @@ YouTube API 호출 모듈
 - 구독 채널 목록 조회
 - 채널 정보 배치 조회
 - 영상 정보 배치 조회
+- 배치는 여러 스레드에서 동시에 요청 (transport 연결 풀 사용)
+- 같은 배치를 동시에 요청하면 한 번만 요청하고 결과 공유 (singleflight)
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+import metrics
+import singleflight
+from records import ChannelInfo, VideoStats, Subscription
+
+BATCH_SIZE = 50
+API_WORKERS = 4  # 동시 배치 요청 수
+
+
+def _run_batches(ids, fetch_batch, label, name):
+    """
+    ID 리스트를 BATCH_SIZE씩 나눠 동시에 요청하고 결과를 합칩니다.
+    다른 스레드가 같은 배치를 요청 중이면 그 결과를 기다려 씁니다 (API 키/OAuth 무관).
+
+    Args:
+        ids: ID 리스트
+        fetch_batch: 배치 하나를 받아 {ID: 정보} dict를 반환하는 함수
+        label: 오류 메시지용 이름
+        name: 측정값(버려진 오류 수)에 쓸 이름
+
+    Returns:
+        dict: 모든 배치 결과
+    """
+    batches = [ids[i:i + BATCH_SIZE] for i in range(0, len(ids), BATCH_SIZE)]
+    flight = singleflight.group(name)
+
+    def run(index, batch):
+        try:
+            return flight.do(','.join(sorted(batch)), fetch_batch, batch)
+        except Exception as e:
+            print(f"{label} 조회 실패 (배치 {index + 1}): {e}")
+            metrics.record_error(name)
+            return {}
+
+    if len(batches) == 1:
+        return dict(run(0, batches[0]))  # 공유된 결과는 복사해서 반환
+
+    result = {}
+    with ThreadPoolExecutor(max_workers=API_WORKERS) as executor:
+        for batch_result in executor.map(run, range(len(batches)), batches):
+            result.update(batch_result)
+
+    return result
 
 
 def get_subscriptions(youtube):
@@ -16,7 +62,7 @@ def get_subscriptions(youtube):
         youtube: OAuth 인증된 YouTube API 서비스
 
     Returns:
-        list: [{'id': 채널ID, 'title': 채널명, 'thumbnail': 썸네일URL, 'subscriberCount': 구독자수}, ...]
+        list: [Subscription, ...]
     """
     subscriptions = []
     next_page_token = None
@@ -33,12 +79,12 @@ def get_subscriptions(youtube):
 
         for item in response.get('items', []):
             snippet = item['snippet']
-            subscriptions.append({
-                'id': snippet['resourceId']['channelId'],
-                'title': snippet['title'],
-                'thumbnail': snippet['thumbnails']['default']['url'],
-                'description': snippet.get('description', '')[:100]
-            })
+            subscriptions.append(Subscription(
+                snippet['resourceId']['channelId'],
+                snippet['title'],
+                snippet['thumbnails']['default']['url'],
+                snippet.get('description', '')[:100]
+            ))
 
         next_page_token = response.get('nextPageToken')
         if not next_page_token:
@@ -46,12 +92,12 @@ def get_subscriptions(youtube):
 
     # 2단계: 채널별 구독자 수 조회
     if subscriptions:
-        channel_ids = [sub['id'] for sub in subscriptions]
+        channel_ids = [sub.id for sub in subscriptions]
         channel_stats = get_channels_batch(youtube, channel_ids)
 
         for sub in subscriptions:
-            stats = channel_stats.get(sub['id'], {})
-            sub['subscriberCount'] = stats.get('subscriberCount', 0)
+            stats = channel_stats.get(sub.id)
+            sub.subscriberCount = stats.subscriberCount if stats else 0
 
     return subscriptions
 
@@ -65,39 +111,32 @@ def get_channels_batch(youtube, channel_ids):
         channel_ids: 채널 ID 리스트
 
     Returns:
-        dict: {채널ID: {'subscriberCount': 구독자수, 'title': 채널명}, ...}
+        dict: {채널ID: ChannelInfo, ...}
     """
     if not channel_ids:
         return {}
 
-    result = {}
-    batch_size = 50
+    def fetch_batch(batch):
+        request = youtube.channels().list(
+            part='snippet,statistics',
+            id=','.join(batch)
+        )
+        response = request.execute()
 
-    for i in range(0, len(channel_ids), batch_size):
-        batch = channel_ids[i:i + batch_size]
+        result = {}
+        for item in response.get('items', []):
+            channel_id = item['id']
+            stats = item['statistics']
+            snippet = item['snippet']
 
-        try:
-            request = youtube.channels().list(
-                part='snippet,statistics',
-                id=','.join(batch)
+            result[channel_id] = ChannelInfo(
+                int(stats.get('subscriberCount', 0)),
+                snippet.get('title', ''),
+                snippet['thumbnails']['default']['url']
             )
-            response = request.execute()
-
-            for item in response.get('items', []):
-                channel_id = item['id']
-                stats = item['statistics']
-                snippet = item['snippet']
+        return result
 
-                result[channel_id] = {
-                    'subscriberCount': int(stats.get('subscriberCount', 0)),
-                    'title': snippet.get('title', ''),
-                    'thumbnail': snippet['thumbnails']['default']['url']
-                }
-
-        except Exception as e:
-            print(f"채널 정보 조회 실패 (배치 {i // batch_size + 1}): {e}")
-
-    return result
+    return _run_batches(channel_ids, fetch_batch, '채널 정보', 'get_channels_batch')
 
 
 def get_videos_batch(youtube, video_ids):
@@ -109,40 +148,33 @@ def get_videos_batch(youtube, video_ids):
         video_ids: 영상 ID 리스트
 
     Returns:
-        dict: {영상ID: {'viewCount': 조회수, 'duration': 길이(초)}, ...}
+        dict: {영상ID: VideoStats, ...}
     """
     if not video_ids:
         return {}
 
-    result = {}
-    batch_size = 50
-
-    for i in range(0, len(video_ids), batch_size):
-        batch = video_ids[i:i + batch_size]
+    def fetch_batch(batch):
+        request = youtube.videos().list(
+            part='statistics,contentDetails',
+            id=','.join(batch)
+        )
+        response = request.execute()
 
-        try:
-            request = youtube.videos().list(
-                part='statistics,contentDetails',
-                id=','.join(batch)
+        result = {}
+        for item in response.get('items', []):
+            video_id = item['id']
+            stats = item['statistics']
+            content = item['contentDetails']
+
+            result[video_id] = VideoStats(
+                int(stats.get('viewCount', 0)),
+                int(stats.get('likeCount', 0)),
+                int(stats.get('commentCount', 0)),
+                parse_duration(content.get('duration', 'PT0S'))
             )
-            response = request.execute()
+        return result
 
-            for item in response.get('items', []):
-                video_id = item['id']
-                stats = item['statistics']
-                content = item['contentDetails']
-
-                result[video_id] = {
-                    'viewCount': int(stats.get('viewCount', 0)),
-                    'likeCount': int(stats.get('likeCount', 0)),
-                    'commentCount': int(stats.get('commentCount', 0)),
-                    'duration': parse_duration(content.get('duration', 'PT0S'))
-                }
-
-        except Exception as e:
-            print(f"영상 정보 조회 실패 (배치 {i // batch_size + 1}): {e}")
-
-    return result
+    return _run_batches(video_ids, fetch_batch, '영상 정보', 'get_videos_batch')
 
 
 def parse_duration(duration_str):